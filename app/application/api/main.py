@@ -1,18 +1,60 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, APIRouter
 
+from application.api.middlewares import InstrumentationMiddleware
+from application.api.v1.health.handlers import router as health_router
+from application.api.v1.metrics.handlers import router as metrics_router
 from application.api.v1.organizations.handlers import router as organizations_router
+from domain.db_session import AsyncSessionLocal, read_session_router
+from infra.indexes.activities import activity_taxonomy_cache
+from infra.indexes.buildings import building_spatial_index
+from infra.indexes.organizations import organization_name_index
+from settings.config import config
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with AsyncSessionLocal() as db_session:
+        if config.spatial_index_enabled:
+            await building_spatial_index.refresh(db_session=db_session)
+        if config.activity_cache_enabled:
+            await activity_taxonomy_cache.refresh(db_session=db_session)
+        if config.autocomplete_index_enabled:
+            await organization_name_index.refresh(db_session=db_session)
+
+    background_tasks = []
+    if read_session_router.replicas:
+        await read_session_router.check_health()
+        background_tasks.append(asyncio.create_task(read_session_router.run_health_check_loop()))
+    if config.autocomplete_index_enabled:
+        background_tasks.append(asyncio.create_task(organization_name_index.run_refresh_loop(AsyncSessionLocal)))
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+
 
 def create_app() -> FastAPI:
 
     app = FastAPI(
         title="Organizations API",
         docs_url="/api/docs",
-        debug=True
+        debug=True,
+        lifespan=lifespan,
     )
 
     v1_api_router = APIRouter(prefix="/api/v1")
     v1_api_router.include_router(organizations_router)
+    v1_api_router.include_router(health_router)
+    if config.metrics_enabled:
+        v1_api_router.include_router(metrics_router)
 
     app.include_router(v1_api_router)
 
-    return app
\ No newline at end of file
+    if config.metrics_enabled:
+        app.add_middleware(InstrumentationMiddleware, server_timing=config.server_timing_enabled)
+
+    return app
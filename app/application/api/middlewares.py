@@ -0,0 +1,71 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infra.metrics import (
+    RequestTimings,
+    current_request_timings,
+    http_request_duration_seconds,
+    http_requests_total,
+    request_db_seconds,
+    request_hydration_seconds,
+    request_serialization_seconds,
+    request_sql_statements,
+)
+
+
+def format_server_timing(timings: RequestTimings, total_seconds: float) -> str:
+    return ', '.join((
+        f'db;dur={timings.db_seconds * 1000:.2f};desc="{timings.sql_statements} SQL"',
+        f'hydration;dur={timings.hydration_seconds * 1000:.2f}',
+        f'serialization;dur={timings.serialization_seconds * 1000:.2f}',
+        f'total;dur={total_seconds * 1000:.2f}',
+    ))
+
+
+class InstrumentationMiddleware:
+    # Чистый ASGI-middleware: замеры снимаются в момент начала ответа, когда тело
+    # обычного ответа уже сериализовано, и попадают в заголовок Server-Timing.
+    # Для потоковых ответов (export) кодирование пачек идёт уже после заголовков.
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True) -> None:
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = current_request_timings.set(timings)
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timings(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append('Server-Timing', format_server_timing(timings, time.perf_counter() - started_at))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            current_request_timings.reset(token)
+            self._observe(scope, status_code, timings, time.perf_counter() - started_at)
+
+    @staticmethod
+    def _observe(scope: Scope, status_code: int, timings: RequestTimings, elapsed: float) -> None:
+        # Метка — шаблон пути маршрута, а не сам путь: иначе число рядов растёт с каждым pk.
+        route = scope.get('route')
+        labels = (scope['method'], getattr(route, 'path', 'unmatched'))
+        http_requests_total.inc(*labels, str(status_code))
+        http_request_duration_seconds.observe(elapsed, *labels)
+        request_sql_statements.observe(timings.sql_statements, *labels)
+        request_db_seconds.observe(timings.db_seconds, *labels)
+        request_hydration_seconds.observe(timings.hydration_seconds, *labels)
+        request_serialization_seconds.observe(timings.serialization_seconds, *labels)
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, Response, status
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.api.v1.health.schemas import HealthResponseSchema, PoolStatusResponseSchema, ReplicaStatusResponseSchema
+from domain.db_session import engine, get_db, read_session_router
+
+
+router = APIRouter(
+    prefix='/health', tags=['Health']
+)
+
+
+@router.get(
+    '',
+    description='Доступность базы данных, состояние пулов соединений primary и реплик: выдачи, возвраты, ожидания свободного соединения.',
+    response_model=HealthResponseSchema,
+    responses={
+        status.HTTP_200_OK: {'model': HealthResponseSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {'model': HealthResponseSchema},
+    }
+)
+async def get_health(
+    response: Response,
+    db_session: AsyncSession = Depends(get_db),
+):
+    try:
+        await db_session.execute(text('SELECT 1'))
+        is_database_available = True
+    except (SQLAlchemyError, OSError):
+        is_database_available = False
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return HealthResponseSchema(
+        database=is_database_available,
+        pool=PoolStatusResponseSchema.from_pool(pool=engine.pool),
+        replicas=[
+            ReplicaStatusResponseSchema(
+                url=replica.url.render_as_string(hide_password=True),
+                healthy=read_session_router.is_healthy(replica),
+                pool=PoolStatusResponseSchema.from_pool(pool=replica.pool),
+            )
+            for replica in read_session_router.replicas
+        ],
+    )
@@ -0,0 +1,50 @@
+from pydantic import BaseModel
+
+from infra.pool import InstrumentedAsyncAdaptedQueuePool
+
+
+class PoolStatusResponseSchema(BaseModel):
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    connects: int
+    checkouts: int
+    checkins: int
+    invalidations: int
+    waits: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+    @classmethod
+    def from_pool(cls, pool: InstrumentedAsyncAdaptedQueuePool) -> "PoolStatusResponseSchema":
+        return PoolStatusResponseSchema(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            connects=pool.metrics.connects,
+            checkouts=pool.metrics.checkouts,
+            checkins=pool.metrics.checkins,
+            invalidations=pool.metrics.invalidations,
+            waits=pool.metrics.waits,
+            timeouts=pool.metrics.timeouts,
+            wait_seconds_total=pool.metrics.wait_seconds_total,
+            wait_seconds_max=pool.metrics.wait_seconds_max,
+        )
+
+
+class ReplicaStatusResponseSchema(BaseModel):
+
+    url: str
+    healthy: bool
+    pool: PoolStatusResponseSchema
+
+
+class HealthResponseSchema(BaseModel):
+
+    database: bool
+    pool: PoolStatusResponseSchema
+    replicas: list[ReplicaStatusResponseSchema] = []
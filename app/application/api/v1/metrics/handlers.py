@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Response
+
+from domain.db_session import engine, read_session_router
+from infra.metrics import format_labels, metrics_registry, render_metric
+from infra.pool import InstrumentedAsyncAdaptedQueuePool
+
+
+router = APIRouter(
+    prefix='/metrics', tags=['Metrics']
+)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+POOL_GAUGES = {
+    'checked_out': ('Соединения, выданные из пула.', InstrumentedAsyncAdaptedQueuePool.checkedout),
+    'checked_in': ('Свободные соединения в пуле.', InstrumentedAsyncAdaptedQueuePool.checkedin),
+    'overflow': ('Соединения сверх pool_size.', InstrumentedAsyncAdaptedQueuePool.overflow),
+}
+
+POOL_COUNTERS = {
+    'checkouts': 'Выдачи соединений из пула.',
+    'waits': 'Ожидания свободного соединения.',
+    'timeouts': 'Ожидания, завершившиеся таймаутом.',
+    'wait_seconds': 'Суммарное время ожидания свободного соединения.',
+}
+
+
+def render_pool_metrics() -> list[str]:
+    pools = [('primary', engine.pool)] + [
+        (replica.url.render_as_string(hide_password=True), replica.pool) for replica in read_session_router.replicas
+    ]
+
+    lines = []
+    for gauge, (description, read) in POOL_GAUGES.items():
+        lines += render_metric(
+            f'organizations_db_pool_{gauge}', 'gauge', description,
+            ((format_labels(('database',), (database,)), read(pool)) for database, pool in pools),
+        )
+    for counter, description in POOL_COUNTERS.items():
+        attribute = 'wait_seconds_total' if counter == 'wait_seconds' else counter
+        lines += render_metric(
+            f'organizations_db_pool_{counter}_total', 'counter', description,
+            ((format_labels(('database',), (database,)), getattr(pool.metrics, attribute)) for database, pool in pools),
+        )
+    return lines
+
+
+@router.get(
+    '',
+    description='Метрики в текстовом формате Prometheus: HTTP-запросы, SQL-выражения на запрос, время БД, '
+                'построения сущностей и сериализации, состояние пулов соединений.',
+    response_class=Response,
+)
+async def get_metrics() -> Response:
+    lines = metrics_registry.render() + render_pool_metrics()
+    return Response(content='\n'.join(lines) + '\n', media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,32 @@
+from infra.caches.backends import response_cache_backend
+from infra.caches.buildings import building_cache
+from infra.caches.versions import organization_data_version
+from infra.coalescing import organization_single_flight
+from infra.indexes.activities import activity_taxonomy_cache
+from infra.indexes.buildings import building_spatial_index
+from infra.indexes.organizations import organization_name_index
+from logic.services.caching import CachedOrganizationService
+from logic.services.coalescing import CoalescingOrganizationService
+from logic.services.organizations import BaseOrganizationService, ORMOrganizationService
+from settings.config import config
+
+
+def get_organization_service() -> BaseOrganizationService:
+    service = ORMOrganizationService(
+        building_index=building_spatial_index if config.spatial_index_enabled else None,
+        activity_taxonomy=activity_taxonomy_cache if config.activity_cache_enabled else None,
+        name_index=organization_name_index if config.autocomplete_index_enabled else None,
+        read_model=config.organization_read_model_enabled,
+        building_cache=building_cache if config.building_cache_enabled else None,
+    )
+    if config.request_coalescing_enabled:
+        # Кэш ответов стоит снаружи: совместно выполняются только промахи кэша.
+        service = CoalescingOrganizationService(service=service, single_flight=organization_single_flight)
+    if config.response_cache_enabled:
+        return CachedOrganizationService(
+            service=service,
+            backend=response_cache_backend,
+            data_version=organization_data_version,
+            ttl_seconds=config.response_cache_ttl_seconds,
+        )
+    return service
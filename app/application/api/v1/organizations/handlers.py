@@ -1,15 +1,20 @@
 import uuid
 from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.api.schemas import ErrorSchema
-from application.api.v1.organizations.schemas import OrganizationResponseSchema, ListOrganizationResponseSchema
-from domain.db_session import get_db
-from domain.entities.buildings import Buildings
-from domain.entities.organizations import Organization
-from logic.exceptions.organizations import OrganizationNotFoundException, OrganizationWithActivityNotFoundException, OrganizationWithBuildingNotFoundException, OrganizationWithNameNotFoundException
-from logic.services.organizations import ORMOrganizationService, BaseOrganizationService
+from application.api.v1.organizations.dependencies import get_organization_service
+from application.api.v1.organizations.responses import cluster_list_response, encode_ndjson, lookup_response, organization_list_response, organization_response, page_response, suggestion_list_response
+from application.api.v1.organizations.schemas import BatchOrganizationCreateRequestSchema, BatchOrganizationDeleteRequestSchema, BatchOrganizationResponseSchema, BatchOrganizationUpsertRequestSchema, ListOrganizationClusterResponseSchema, ListOrganizationResponseSchema, ListOrganizationSuggestionResponseSchema, OrganizationLookupRequestSchema, OrganizationLookupResponseSchema, OrganizationResponseSchema, PageOrganizationResponseSchema
+from domain.db_session import get_db, get_read_db, read_session_router
+from domain.entities.organizations import Organization, OrganizationBatchResult, OrganizationCluster, OrganizationLookupResult, OrganizationSuggestion
+from logic.exceptions.organizations import InvalidOrganizationBatchException, OrganizationNotFoundException, OrganizationWithActivityNotFoundException, OrganizationWithBuildingNotFoundException, OrganizationWithNameNotFoundException
+from logic.exceptions.pagination import InvalidCursorException
+from logic.geo.grid import MAX_CLUSTER_ZOOM
+from logic.pagination import DEFAULT_NEAREST_LIMIT, DEFAULT_PAGE_LIMIT, DEFAULT_STREAM_CHUNK_SIZE, DEFAULT_SUGGESTION_LIMIT, MAX_NEAREST_LIMIT, MAX_PAGE_LIMIT, MAX_STREAM_CHUNK_SIZE, MAX_SUGGESTION_LIMIT, Page
+from logic.services.organizations import BaseOrganizationService
 
 
 router = APIRouter(
@@ -17,12 +22,17 @@ router = APIRouter(
 )
 
 
+LimitQuery = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description='Максимальное количество организаций на странице')
+CursorQuery = Query(None, description='Курсор следующей страницы из поля next_cursor предыдущего ответа')
+
+
 @router.get(
     '/by_area',
     description='Список зданий, находящихся в заданном радиусе относительно точки на карте.',
-    response_model=ListOrganizationResponseSchema,
+    response_model=PageOrganizationResponseSchema,
     responses={
-        status.HTTP_200_OK: {'model': ListOrganizationResponseSchema},
+        status.HTTP_200_OK: {'model': PageOrganizationResponseSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
     }
 )
 async def get_buildings_by_radius(
@@ -30,145 +40,390 @@ async def get_buildings_by_radius(
     max_latitude: float,
     min_longitude: float,
     max_longitude: float,
-    db_session: AsyncSession = Depends(get_db)
+    limit: int = LimitQuery,
+    cursor: str | None = CursorQuery,
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
 ):
-    
-    service: BaseOrganizationService = ORMOrganizationService()
-    organization_list: list[Organization] = await service.get_organization_list_by_area(
+    try:
+        organization_page: Page[Organization] = await service.get_organization_list_by_area(
+            min_latitude=min_latitude,
+            max_latitude=max_latitude,
+            min_longitude=min_longitude,
+            max_longitude=max_longitude,
+            limit=limit,
+            cursor=cursor,
+            db_session=db_session
+        )
+        return page_response(page=organization_page)
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+@router.get(
+    '/clusters',
+    description='Организации в прямоугольной области карты, сгруппированные по тайлам веб-карты уровня масштаба zoom '
+                '(Web Mercator, 2^zoom × 2^zoom тайлов на весь мир): число организаций и зданий и их центр для каждого тайла.',
+    response_model=ListOrganizationClusterResponseSchema,
+    responses={
+        status.HTTP_200_OK: {'model': ListOrganizationClusterResponseSchema},
+    }
+)
+async def get_organization_clusters(
+    min_latitude: float,
+    max_latitude: float,
+    min_longitude: float,
+    max_longitude: float,
+    zoom: int = Query(..., ge=0, le=MAX_CLUSTER_ZOOM, description='Уровень масштаба карты'),
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
+    cluster_list: list[OrganizationCluster] = await service.get_organization_clusters(
         min_latitude=min_latitude,
         max_latitude=max_latitude,
         min_longitude=min_longitude,
         max_longitude=max_longitude,
-        db_session=db_session
+        zoom=zoom,
+        db_session=db_session,
     )
-
-    return [
-        OrganizationResponseSchema.from_entity(entity=entity) for entity in organization_list
-    ]
+    return cluster_list_response(cluster_list=cluster_list)
 
 
 @router.get(
     '/by_radius',
     description='Список зданий, находящихся в заданном радиусе относительно точки на карте.',
-    response_model=ListOrganizationResponseSchema,
+    response_model=PageOrganizationResponseSchema,
     responses={
-        status.HTTP_200_OK: {'model': ListOrganizationResponseSchema},
+        status.HTTP_200_OK: {'model': PageOrganizationResponseSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
     }
 )
 async def get_buildings_by_radius(
-    latitude: float,
-    longitude: float,
-    radius_km: float,
-    db_session: AsyncSession = Depends(get_db)
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(..., gt=0),
+    sort_by_distance: bool = Query(False, description='Отсортировать организации по удалённости от точки'),
+    limit: int = LimitQuery,
+    cursor: str | None = CursorQuery,
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
 ):
-    
-    service: BaseOrganizationService = ORMOrganizationService()
-    organization_list: list[Buildings] = await service.get_organization_list_by_radius(
-        latitude=latitude,
-        longitude=longitude,
-        radius_km=radius_km,
-        db_session=db_session
-    )
+    try:
+        organization_page: Page[Organization] = await service.get_organization_list_by_radius(
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            sort_by_distance=sort_by_distance,
+            limit=limit,
+            cursor=cursor,
+            db_session=db_session
+        )
+        return page_response(page=organization_page)
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
-    return [
-        OrganizationResponseSchema.from_entity(entity=entity) for entity in organization_list
-    ]
 
 @router.get(
-    '/buildings/{pk_building}',
-    description='Получение организаций в конкретном здании.',
+    '/nearest',
+    description='Ближайшие к точке на карте организации, отсортированные по удалённости. '
+                'Можно ограничить деятельностью вместе со всеми вложенными в неё.',
     response_model=ListOrganizationResponseSchema,
     responses={
         status.HTTP_200_OK: {'model': ListOrganizationResponseSchema},
         status.HTTP_404_NOT_FOUND: {'model': ErrorSchema}
     }
 )
-async def get_organization_list_by_building(pk_building: uuid.UUID, db_session: AsyncSession = Depends(get_db)):
+async def get_nearest_organizations(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    limit: int = Query(DEFAULT_NEAREST_LIMIT, ge=1, le=MAX_NEAREST_LIMIT, description='Количество организаций'),
+    activity_name: str | None = Query(None, description='Деятельность, включая вложенные'),
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
+    try:
+        organization_list: list[Organization] = await service.get_nearest_organizations(
+            latitude=latitude,
+            longitude=longitude,
+            limit=limit,
+            activity_name=activity_name.capitalize() if activity_name is not None else None,
+            db_session=db_session,
+        )
+        return organization_list_response(organization_list=organization_list)
+    except OrganizationWithActivityNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=e.message
+        )
+
+@router.get(
+    '/buildings/{pk_building}',
+    description='Получение организаций в конкретном здании.',
+    response_model=PageOrganizationResponseSchema,
+    responses={
+        status.HTTP_200_OK: {'model': PageOrganizationResponseSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema},
+        status.HTTP_404_NOT_FOUND: {'model': ErrorSchema}
+    }
+)
+async def get_organization_list_by_building(
+    pk_building: uuid.UUID,
+    limit: int = LimitQuery,
+    cursor: str | None = CursorQuery,
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
 
-    service: BaseOrganizationService = ORMOrganizationService()
     try:
-        organization_list: list[Organization] = await service.get_organization_list_by_building(pk_building=pk_building, db_session=db_session)
-        return [OrganizationResponseSchema.from_entity(entity=entity) for entity in organization_list]
+        organization_page: Page[Organization] = await service.get_organization_list_by_building(
+            pk_building=pk_building, limit=limit, cursor=cursor, db_session=db_session
+        )
+        return page_response(page=organization_page)
     except OrganizationWithBuildingNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
         )
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
 
 @router.get(
     '/name',
     description='Получение организаций по названию, будет возвращаться список организаций с вхождением строки, которую ввели.',
-    response_model=ListOrganizationResponseSchema,
+    response_model=PageOrganizationResponseSchema,
     responses={
-        status.HTTP_200_OK: {'model': ListOrganizationResponseSchema},
+        status.HTTP_200_OK: {'model': PageOrganizationResponseSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema},
         status.HTTP_404_NOT_FOUND: {'model': ErrorSchema}
     }
 )
-async def get_organization_list_by_name(name: str = Query(..., description='Название организации'), db_session: AsyncSession = Depends(get_db)):
-    service: BaseOrganizationService = ORMOrganizationService()
+async def get_organization_list_by_name(
+    name: str = Query(..., description='Название организации'),
+    ranked: bool = Query(False, description='Сортировать по похожести названия на строку поиска'),
+    limit: int = LimitQuery,
+    cursor: str | None = CursorQuery,
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
     try:
-        organization_list: list[Organization] = await service.get_organization_list_by_name(name=name, db_session=db_session)
-        return [OrganizationResponseSchema.from_entity(entity=entity) for entity in organization_list]
+        organization_page: Page[Organization] = await service.get_organization_list_by_name(
+            name=name, ranked=ranked, limit=limit, cursor=cursor, db_session=db_session
+        )
+        return page_response(page=organization_page)
     except OrganizationWithNameNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
         )
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+@router.get(
+    '/autocomplete',
+    description='Подсказки по началу названия организации (без учёта регистра): идентификатор и название.',
+    response_model=ListOrganizationSuggestionResponseSchema,
+    responses={
+        status.HTTP_200_OK: {'model': ListOrganizationSuggestionResponseSchema}
+    }
+)
+async def get_organization_suggestions(
+    prefix: str = Query(..., min_length=1, description='Начало названия организации'),
+    limit: int = Query(DEFAULT_SUGGESTION_LIMIT, ge=1, le=MAX_SUGGESTION_LIMIT, description='Количество подсказок'),
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
+    suggestion_list: list[OrganizationSuggestion] = await service.get_organization_suggestions(
+        prefix=prefix, limit=limit, db_session=db_session
+    )
+    return suggestion_list_response(suggestion_list=suggestion_list)
 
 
 @router.get(
         '/single_activity',
         description='Получение организаций только по определённому виду деятельности, не включая вложенные.',
-        response_model=ListOrganizationResponseSchema,
+        response_model=PageOrganizationResponseSchema,
         responses={
-            status.HTTP_200_OK: {'model': ListOrganizationResponseSchema},
+            status.HTTP_200_OK: {'model': PageOrganizationResponseSchema},
+            status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema},
             status.HTTP_404_NOT_FOUND: {'model': ErrorSchema}
         }
 )
-async def get_organization_by_activity(activity_name: str = Query(..., description="Название деятельности"), db_session: AsyncSession = Depends(get_db)):
-    service: BaseOrganizationService = ORMOrganizationService()
+async def get_organization_by_activity(
+    activity_name: str = Query(..., description="Название деятельности"),
+    limit: int = LimitQuery,
+    cursor: str | None = CursorQuery,
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
     try:
-        organization_list: list[Organization] = await service.get_organization_list_by_single_activity(activity_name=activity_name.capitalize(), db_session=db_session)
-        return [OrganizationResponseSchema.from_entity(entity=entity) for entity in organization_list]
+        organization_page: Page[Organization] = await service.get_organization_list_by_single_activity(
+            activity_name=activity_name.capitalize(), limit=limit, cursor=cursor, db_session=db_session
+        )
+        return page_response(page=organization_page)
     except OrganizationWithActivityNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
         )
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
 
 @router.get(
     '/activity',
     description='Получение организаций по виду деятельности, включая вложенные деятельности.',
-    response_model=ListOrganizationResponseSchema,
+    response_model=PageOrganizationResponseSchema,
     responses={
-        status.HTTP_200_OK: {'model': ListOrganizationResponseSchema},
+        status.HTTP_200_OK: {'model': PageOrganizationResponseSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema},
         status.HTTP_404_NOT_FOUND: {'model': ErrorSchema}
     }
 )
-async def get_organization_by_activity(activity_name: str = Query(..., description="Название деятельности"), db_session: AsyncSession = Depends(get_db)):
-    service: BaseOrganizationService = ORMOrganizationService()
+async def get_organization_by_activity(
+    activity_name: str = Query(..., description="Название деятельности"),
+    limit: int = LimitQuery,
+    cursor: str | None = CursorQuery,
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
     try:
-        organization_list: list[Organization] = await service.get_organization_list_by_activity(activity_name=activity_name.capitalize(), db_session=db_session)
-        return [OrganizationResponseSchema.from_entity(entity=entity) for entity in organization_list]
+        organization_page: Page[Organization] = await service.get_organization_list_by_activity(
+            activity_name=activity_name.capitalize(), limit=limit, cursor=cursor, db_session=db_session
+        )
+        return page_response(page=organization_page)
     except OrganizationWithActivityNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
         )
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
 
 @router.get(
     '/',
-    response_model=ListOrganizationResponseSchema,
+    response_model=PageOrganizationResponseSchema,
     description='Получение всех организаций.',
     responses={
-        status.HTTP_200_OK: {'model': ListOrganizationResponseSchema}
+        status.HTTP_200_OK: {'model': PageOrganizationResponseSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
     },
 )
-async def get_organization_list(db_session: AsyncSession = Depends(get_db)):
-
-    service: BaseOrganizationService = ORMOrganizationService()
-    organization_list: list[Organization] = await service.get_organization_list(db_session=db_session)
-    return [OrganizationResponseSchema.from_entity(entity=entity) for entity in organization_list]
+async def get_organization_list(
+    limit: int = LimitQuery,
+    cursor: str | None = CursorQuery,
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
+    try:
+        organization_page: Page[Organization] = await service.get_organization_list(
+            limit=limit, cursor=cursor, db_session=db_session
+        )
+        return page_response(page=organization_page)
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     
 
+@router.get(
+    '/export',
+    description='Выгрузка всех организаций в формате NDJSON (одна организация в строке) потоком, без загрузки всего каталога в память.',
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {'content': {'application/x-ndjson': {}}}
+    },
+)
+async def export_organization_list(
+    chunk_size: int = Query(DEFAULT_STREAM_CHUNK_SIZE, ge=1, le=MAX_STREAM_CHUNK_SIZE, description='Количество организаций, читаемых из БД за раз'),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
+
+    # Сессия открывается внутри генератора: зависимость get_read_db закрывается раньше, чем отдаётся тело ответа.
+    async def generate_ndjson():
+        async with read_session_router.session() as db_session:
+            async for organization_chunk in service.stream_organization_list(db_session=db_session, chunk_size=chunk_size):
+                yield encode_ndjson(organization_list=organization_chunk)
+
+    return StreamingResponse(generate_ndjson(), media_type='application/x-ndjson')
+
+
+@router.post(
+    '/lookup',
+    description='Получение организаций по списку идентификаторов одним запросом. Организации возвращаются в порядке запроса, '
+                'отсутствующие идентификаторы перечисляются в missing_pks.',
+    response_model=OrganizationLookupResponseSchema,
+    responses={
+        status.HTTP_200_OK: {'model': OrganizationLookupResponseSchema},
+    }
+)
+async def lookup_organizations(
+    lookup: OrganizationLookupRequestSchema,
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
+    result: OrganizationLookupResult = await service.get_organizations_by_ids(db_session=db_session, pks=lookup.pks)
+    return lookup_response(result=result)
+
+
+@router.post(
+    '/batch',
+    description='Пакетное создание организаций одной многострочной вставкой. Организации с уже существующим pk пропускаются.',
+    response_model=BatchOrganizationResponseSchema,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {'model': BatchOrganizationResponseSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
+    }
+)
+async def create_organization_batch(
+    batch: BatchOrganizationCreateRequestSchema,
+    db_session: AsyncSession = Depends(get_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
+    try:
+        result: OrganizationBatchResult = await service.create_organizations(
+            db_session=db_session, organizations=[item.to_entity() for item in batch.items]
+        )
+        return BatchOrganizationResponseSchema.from_entity(entity=result)
+    except InvalidOrganizationBatchException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+@router.put(
+    '/batch',
+    description='Пакетное создание или обновление организаций по pk вместе со зданием и набором деятельностей.',
+    response_model=BatchOrganizationResponseSchema,
+    responses={
+        status.HTTP_200_OK: {'model': BatchOrganizationResponseSchema},
+        status.HTTP_400_BAD_REQUEST: {'model': ErrorSchema}
+    }
+)
+async def upsert_organization_batch(
+    batch: BatchOrganizationUpsertRequestSchema,
+    db_session: AsyncSession = Depends(get_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
+    try:
+        result: OrganizationBatchResult = await service.upsert_organizations(
+            db_session=db_session, organizations=[item.to_entity() for item in batch.items]
+        )
+        return BatchOrganizationResponseSchema.from_entity(entity=result)
+    except InvalidOrganizationBatchException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+@router.post(
+    '/batch/delete',
+    description='Пакетное удаление организаций и их связей с деятельностями.',
+    response_model=BatchOrganizationResponseSchema,
+    responses={
+        status.HTTP_200_OK: {'model': BatchOrganizationResponseSchema},
+    }
+)
+async def delete_organization_batch(
+    batch: BatchOrganizationDeleteRequestSchema,
+    db_session: AsyncSession = Depends(get_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
+    result: OrganizationBatchResult = await service.delete_organizations(db_session=db_session, pks=batch.pks)
+    return BatchOrganizationResponseSchema.from_entity(entity=result)
+
+
 @router.get(
     '/{organization_pk}',
     response_model=OrganizationResponseSchema,
@@ -178,14 +433,14 @@ async def get_organization_list(db_session: AsyncSession = Depends(get_db)):
         status.HTTP_404_NOT_FOUND: {'model': ErrorSchema}
     }
 )
-async def get_organization(organization_pk: uuid.UUID, db_session: AsyncSession = Depends(get_db)):
-
-    service: BaseOrganizationService = ORMOrganizationService()
+async def get_organization(
+    organization_pk: uuid.UUID,
+    db_session: AsyncSession = Depends(get_read_db),
+    service: BaseOrganizationService = Depends(get_organization_service),
+):
 
     try:
         organization: Organization = await service.get_organization_by_id(pk=organization_pk, db_session=db_session)
-        return OrganizationResponseSchema.from_entity(entity=organization)
+        return organization_response(entity=organization)
     except OrganizationNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
-
-
@@ -0,0 +1,108 @@
+from typing import Any
+import uuid
+
+from fastapi import Response
+import orjson
+
+from application.api.v1.organizations.schemas import ListOrganizationResponseSchema, OrganizationClusterResponseSchema, OrganizationLookupResponseSchema, OrganizationResponseSchema, OrganizationSuggestionResponseSchema, PageOrganizationResponseSchema
+from domain.entities.organizations import Organization, OrganizationCluster, OrganizationLookupResult, OrganizationSuggestion
+from infra.metrics import measure
+from logic.pagination import Page
+from settings.config import config
+
+
+def _encode_default(value: Any) -> str:
+    # asyncpg возвращает собственный подкласс UUID, который orjson не кодирует нативно.
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_encode_default)
+
+
+def organization_list_content(organization_list: list[Organization]) -> list[dict[str, Any]]:
+    # orjson обходит slots-dataclass через getattr по каждому полю, что в разы медленнее словаря.
+    # Сущности разворачиваются в словари явно, а словарь здания собирается один раз на здание.
+    building_content = {}
+    content = []
+    for entity in organization_list:
+        building = entity.building
+        building_dict = building_content.get(building.pk)
+        if building_dict is None:
+            building_dict = building_content[building.pk] = {
+                'pk': building.pk,
+                'address': building.address,
+                'latitude': building.latitude,
+                'longitude': building.longitude,
+            }
+        content.append({
+            'pk': entity.pk,
+            'title': entity.title,
+            'phone_number_list': entity.phone_number_list,
+            'building': building_dict,
+            'activities': entity.activities,
+            'distance_km': entity.distance_km,
+        })
+    return content
+
+
+class ORJSONEntityResponse(Response):
+    # Выход сервиса уже типизирован: dataclass-сущности кодируются в байты напрямую,
+    # без сборки pydantic-схем и повторной валидации по response_model.
+    media_type = 'application/json'
+
+    def render(self, content: Any) -> bytes:
+        with measure('serialization'):
+            return dumps(content)
+
+
+def page_response(page: Page[Organization]) -> Response | PageOrganizationResponseSchema:
+    if config.fast_serialization_enabled:
+        return ORJSONEntityResponse({'items': organization_list_content(page.items), 'next_cursor': page.next_cursor})
+    return PageOrganizationResponseSchema.from_page(page=page)
+
+
+def organization_response(entity: Organization) -> Response | OrganizationResponseSchema:
+    if config.fast_serialization_enabled:
+        return ORJSONEntityResponse(organization_list_content([entity])[0])
+    return OrganizationResponseSchema.from_entity(entity=entity)
+
+
+def organization_list_response(organization_list: list[Organization]) -> Response | ListOrganizationResponseSchema:
+    if config.fast_serialization_enabled:
+        return ORJSONEntityResponse(organization_list_content(organization_list))
+    return [OrganizationResponseSchema.from_entity(entity=entity) for entity in organization_list]
+
+
+def lookup_response(result: OrganizationLookupResult) -> Response | OrganizationLookupResponseSchema:
+    if config.fast_serialization_enabled:
+        return ORJSONEntityResponse({'items': organization_list_content(result.items), 'missing_pks': result.missing_pks})
+    return OrganizationLookupResponseSchema.from_entity(entity=result)
+
+
+def cluster_list_response(
+    cluster_list: list[OrganizationCluster],
+) -> Response | list[OrganizationClusterResponseSchema]:
+    if config.fast_serialization_enabled:
+        return ORJSONEntityResponse(cluster_list)
+    return [OrganizationClusterResponseSchema.from_entity(entity=entity) for entity in cluster_list]
+
+
+def suggestion_list_response(
+    suggestion_list: list[OrganizationSuggestion],
+) -> Response | list[OrganizationSuggestionResponseSchema]:
+    if config.fast_serialization_enabled:
+        return ORJSONEntityResponse(suggestion_list)
+    return [OrganizationSuggestionResponseSchema.from_entity(entity=entity) for entity in suggestion_list]
+
+
+def encode_ndjson(organization_list: list[Organization]) -> bytes:
+    with measure('serialization'):
+        if config.fast_serialization_enabled:
+            return b''.join(dumps(content) + b'\n' for content in organization_list_content(organization_list))
+        return ''.join(
+            OrganizationResponseSchema.from_entity(entity=entity).model_dump_json() + '\n'
+            for entity in organization_list
+        ).encode()
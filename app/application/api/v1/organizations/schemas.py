@@ -1,9 +1,29 @@
-from typing import Any
 import uuid
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from domain.entities.buildings import Buildings
-from domain.entities.organizations import Organization
+from domain.entities.organizations import Organization, OrganizationBatchResult, OrganizationCluster, OrganizationDraft, OrganizationLookupResult, OrganizationSuggestion
+from logic.pagination import Page
+from logic.services.organizations import MAX_LOOKUP_BATCH_SIZE, MAX_WRITE_BATCH_SIZE
+
+
+class BuildingResponseSchema(BaseModel):
+
+    pk: uuid.UUID
+    address: str
+    latitude: float
+    longitude: float
+
+    @classmethod
+    def from_entity(cls, entity: Buildings) -> "BuildingResponseSchema":
+        return BuildingResponseSchema(
+            pk=entity.pk,
+            address=entity.address,
+            latitude=entity.latitude,
+            longitude=entity.longitude
+        )
+
+ListBuildingReponseSchema = list[BuildingResponseSchema]
 
 
 class OrganizationResponseSchema(BaseModel):
@@ -11,8 +31,9 @@ class OrganizationResponseSchema(BaseModel):
     pk: uuid.UUID
     title: str
     phone_number_list: list[str]
-    building: dict[str, Any]
+    building: BuildingResponseSchema
     activities: list[str]
+    distance_km: float | None = None
 
     @classmethod
     def from_entity(cls, entity: Organization) -> "OrganizationResponseSchema":
@@ -20,27 +41,125 @@ class OrganizationResponseSchema(BaseModel):
             pk=entity.pk,
             title=entity.title,
             phone_number_list=entity.phone_number_list,
-            building=entity.building,
-            activities=entity.activities
+            building=BuildingResponseSchema.from_entity(entity=entity.building),
+            activities=entity.activities,
+            distance_km=entity.distance_km,
         )
 
 ListOrganizationResponseSchema = list[OrganizationResponseSchema]
 
 
-class BuildingResponseSchema(BaseModel):
+class PageOrganizationResponseSchema(BaseModel):
+
+    items: ListOrganizationResponseSchema
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_page(cls, page: Page[Organization]) -> "PageOrganizationResponseSchema":
+        return PageOrganizationResponseSchema(
+            items=[OrganizationResponseSchema.from_entity(entity=entity) for entity in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+
+class OrganizationLookupRequestSchema(BaseModel):
+
+    pks: list[uuid.UUID] = Field(min_length=1, max_length=MAX_LOOKUP_BATCH_SIZE)
+
+
+class OrganizationLookupResponseSchema(BaseModel):
+
+    items: ListOrganizationResponseSchema
+    missing_pks: list[uuid.UUID]
+
+    @classmethod
+    def from_entity(cls, entity: OrganizationLookupResult) -> "OrganizationLookupResponseSchema":
+        return OrganizationLookupResponseSchema(
+            items=[OrganizationResponseSchema.from_entity(entity=organization) for organization in entity.items],
+            missing_pks=entity.missing_pks,
+        )
+
+
+class OrganizationClusterResponseSchema(BaseModel):
 
-    pk: uuid.UUID
-    address: str
     latitude: float
     longitude: float
+    organization_count: int
+    building_count: int
 
     @classmethod
-    def from_entity(cls, entity: Buildings) -> "BuildingResponseSchema":
-        return BuildingResponseSchema(
-            pk=entity.pk,
-            address=entity.address,
+    def from_entity(cls, entity: OrganizationCluster) -> "OrganizationClusterResponseSchema":
+        return OrganizationClusterResponseSchema(
             latitude=entity.latitude,
-            longitude=entity.longitude
+            longitude=entity.longitude,
+            organization_count=entity.organization_count,
+            building_count=entity.building_count,
         )
 
-ListBuildingReponseSchema = list[BuildingResponseSchema]
+ListOrganizationClusterResponseSchema = list[OrganizationClusterResponseSchema]
+
+
+class OrganizationSuggestionResponseSchema(BaseModel):
+
+    pk: uuid.UUID
+    title: str
+
+    @classmethod
+    def from_entity(cls, entity: OrganizationSuggestion) -> "OrganizationSuggestionResponseSchema":
+        return OrganizationSuggestionResponseSchema(
+            pk=entity.pk,
+            title=entity.title,
+        )
+
+ListOrganizationSuggestionResponseSchema = list[OrganizationSuggestionResponseSchema]
+
+
+class OrganizationWriteRequestSchema(BaseModel):
+
+    pk: uuid.UUID | None = None
+    title: str
+    phone_number_list: list[str] = []
+    building_pk: uuid.UUID
+    activity_pks: list[uuid.UUID] = []
+
+    def to_entity(self) -> OrganizationDraft:
+        return OrganizationDraft(
+            pk=self.pk,
+            title=self.title,
+            phone_number_list=self.phone_number_list,
+            building_pk=self.building_pk,
+            activity_pks=self.activity_pks,
+        )
+
+
+class OrganizationUpsertRequestSchema(OrganizationWriteRequestSchema):
+
+    pk: uuid.UUID
+
+
+class BatchOrganizationCreateRequestSchema(BaseModel):
+
+    items: list[OrganizationWriteRequestSchema] = Field(min_length=1, max_length=MAX_WRITE_BATCH_SIZE)
+
+
+class BatchOrganizationUpsertRequestSchema(BaseModel):
+
+    items: list[OrganizationUpsertRequestSchema] = Field(min_length=1, max_length=MAX_WRITE_BATCH_SIZE)
+
+
+class BatchOrganizationDeleteRequestSchema(BaseModel):
+
+    pks: list[uuid.UUID] = Field(min_length=1, max_length=MAX_WRITE_BATCH_SIZE)
+
+
+class BatchOrganizationResponseSchema(BaseModel):
+
+    affected_pks: list[uuid.UUID]
+    skipped_pks: list[uuid.UUID]
+
+    @classmethod
+    def from_entity(cls, entity: OrganizationBatchResult) -> "BatchOrganizationResponseSchema":
+        return BatchOrganizationResponseSchema(
+            affected_pks=entity.affected_pks,
+            skipped_pks=entity.skipped_pks,
+        )
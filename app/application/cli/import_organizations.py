@@ -0,0 +1,78 @@
+"""Массовый импорт организаций, зданий и связей с деятельностями из CSV или NDJSON.
+
+Запуск из корня репозитория:
+
+    PYTHONPATH=app python -m application.cli.import_organizations organizations.ndjson --batch-size 10000
+
+Ключи зданий и организаций детерминированы (uuid5), поэтому повторный запуск на том же файле
+обновляет уже загруженные строки, а не создаёт дубликаты.
+"""
+import argparse
+import asyncio
+import sys
+
+import asyncpg
+
+from domain.db_session import engine
+from infra.importers.organizations import ImportProgress, OrganizationBulkImporter, read_csv, read_ndjson
+
+
+def print_progress(progress: ImportProgress) -> None:
+    print(
+        f'{progress.rows:>12,} строк  {progress.batches:>6} пачек  '
+        f'{progress.elapsed_seconds:8.1f} с  {progress.rows_per_second:12,.0f} строк/с',
+        file=sys.stderr,
+    )
+
+
+async def run(args: argparse.Namespace) -> ImportProgress:
+    source = sys.stdin if args.path == '-' else open(args.path, encoding='utf-8', newline='')
+    input_format = args.format or ('csv' if args.path.endswith('.csv') else 'ndjson')
+    records = read_csv(source) if input_format == 'csv' else read_ndjson(source)
+
+    connection = await asyncpg.connect(engine.url.set(drivername='postgresql').render_as_string(hide_password=False))
+    try:
+        importer = OrganizationBulkImporter(
+            connection=connection, create_missing_activities=args.create_missing_activities
+        )
+        await importer.prepare()
+        return await importer.import_records(records, batch_size=args.batch_size, on_batch=print_progress)
+    finally:
+        await connection.close()
+        if source is not sys.stdin:
+            source.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('path', help="Файл CSV или NDJSON; '-' — стандартный ввод")
+    parser.add_argument('--format', choices=('csv', 'ndjson'), help='По умолчанию определяется по расширению')
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument(
+        '--create-missing-activities',
+        action='store_true',
+        help='Создавать неизвестные деятельности корневыми вместо пропуска связей с ними',
+    )
+    parser.add_argument(
+        '--target-rows-per-second',
+        type=float,
+        help='Ожидаемая пропускная способность; если она не достигнута, код возврата 1',
+    )
+    args = parser.parse_args()
+
+    progress = asyncio.run(run(args))
+
+    print(
+        f'Импортировано {progress.rows:,} строк за {progress.elapsed_seconds:.1f} с '
+        f'({progress.rows_per_second:,.0f} строк/с)',
+        file=sys.stderr,
+    )
+    if progress.unknown_activity_names:
+        print(f'Неизвестные деятельности пропущены: {", ".join(sorted(progress.unknown_activity_names))}', file=sys.stderr)
+    if args.target_rows_per_second is not None and progress.rows_per_second < args.target_rows_per_second:
+        print(f'Целевая скорость {args.target_rows_per_second:,.0f} строк/с не достигнута', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
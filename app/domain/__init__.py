@@ -4,3 +4,4 @@ from domain.models.base import TimestampedDbModel
 from domain.models.activities.models import *
 from domain.models.buildings.models import *
 from domain.models.organizations.models import *
+from domain.models.versions.models import *
@@ -1,13 +1,35 @@
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from settings.config import config
+from infra.metrics import instrument_engine
+from infra.pool import InstrumentedAsyncAdaptedQueuePool
+from infra.replicas import ReadSessionRouter
+from settings.config import Config, config
 
 
 DATABASE_URL = config.database_dsn
 
-engine = create_async_engine(DATABASE_URL, echo=True)
+
+def create_engine_from_config(config: Config, url: str | None = None) -> AsyncEngine:
+    engine = create_async_engine(
+        url or config.database_dsn,
+        echo=config.db_echo,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout_seconds,
+        pool_recycle=config.db_pool_recycle_seconds,
+        pool_pre_ping=config.db_pool_pre_ping,
+        # Кэш подготовленных выражений asyncpg на каждом соединении.
+        connect_args={'prepared_statement_cache_size': config.db_statement_cache_size},
+    )
+    if config.metrics_enabled:
+        instrument_engine(engine)
+    return engine
+
+
+engine = create_engine_from_config(config)
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
@@ -15,9 +37,22 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+read_session_router = ReadSessionRouter(
+    primary=engine,
+    replicas=[create_engine_from_config(config, url=dsn) for dsn in config.postgres_replica_dsns],
+    strategy=config.replica_routing_strategy,
+    health_check_interval_seconds=config.replica_health_check_seconds,
+)
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    # Сессия только для чтения: реплика по выбранной стратегии, при её недоступности — primary.
+    async with read_session_router.session() as session:
+        yield session
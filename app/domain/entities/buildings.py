@@ -2,10 +2,10 @@ from dataclasses import dataclass
 import uuid
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Buildings:
 
     pk: uuid.UUID
     address: str
     latitude: float
-    longitude: float
\ No newline at end of file
+    longitude: float
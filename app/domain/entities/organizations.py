@@ -1,14 +1,57 @@
 from dataclasses import dataclass
-from typing import Any
 import uuid
 
+from domain.entities.buildings import Buildings
 
-@dataclass
+
+# frozen не используется: на выгрузках в сотни тысяч строк он вдвое замедляет __init__.
+# Здание — общий неизменяемый Buildings, его не меняют через организацию.
+@dataclass(slots=True)
 class Organization:
 
     pk: uuid.UUID
     title: str
     phone_number_list: list[str]
-    building: dict[str, Any]
+    building: Buildings
     activities: list[str]
+    distance_km: float | None = None
+
+
+@dataclass(slots=True)
+class OrganizationSuggestion:
+
+    pk: uuid.UUID
+    title: str
+
+
+@dataclass(slots=True)
+class OrganizationDraft:
+
+    title: str
+    phone_number_list: list[str]
+    building_pk: uuid.UUID
+    activity_pks: list[uuid.UUID]
+    pk: uuid.UUID | None = None
+
+
+@dataclass(slots=True)
+class OrganizationBatchResult:
+
+    affected_pks: list[uuid.UUID]
+    skipped_pks: list[uuid.UUID]
+
+
+@dataclass(slots=True)
+class OrganizationLookupResult:
+
+    items: list[Organization]
+    missing_pks: list[uuid.UUID]
+
+
+@dataclass(slots=True)
+class OrganizationCluster:
 
+    latitude: float
+    longitude: float
+    organization_count: int
+    building_count: int
@@ -10,6 +10,9 @@ organization_activity = sa.Table(
     TimestampedDbModel.metadata,
     sa.Column("organization_pk", sa.ForeignKey("organization.pk"), primary_key=True),
     sa.Column("activity_pk", sa.ForeignKey("activity.pk"), primary_key=True),
+    sa.UniqueConstraint(
+        "organization_pk", "activity_pk", name="uq_organization_activity_organization_pk_activity_pk"
+    ),
     extend_existing=True,
 )
 
@@ -17,8 +20,8 @@ organization_activity = sa.Table(
 class Activity(TimestampedDbModel):
     __tablename__ = "activity"
     
-    name: Mapped[str] = mapped_column(sa.String, nullable=False)
-    parent_pk: Mapped[int | None] = mapped_column(sa.ForeignKey("activity.pk"), nullable=True)
+    name: Mapped[str] = mapped_column(sa.String, nullable=False, index=True)
+    parent_pk: Mapped[int | None] = mapped_column(sa.ForeignKey("activity.pk"), nullable=True, index=True)
 
     parent = relationship(
         "Activity",
@@ -8,6 +8,14 @@ from domain.models.base import TimestampedDbModel
 
 class Building(TimestampedDbModel):
     __tablename__ = "building"
+    __table_args__ = (
+        sa.Index("ix_building_latitude_longitude", "latitude", "longitude"),
+        sa.Index(
+            "ix_building_earth_location",
+            sa.text("ll_to_earth(latitude, longitude)"),
+            postgresql_using="gist",
+        ),
+    )
 
     address: Mapped[str] = mapped_column(sa.String, nullable=False)
     latitude: Mapped[float] = mapped_column(sa.Float, nullable=False)
@@ -1,4 +1,5 @@
 from typing import List
+import uuid
 import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql.array import ARRAY
@@ -9,14 +10,51 @@ from domain.models.activities.models import organization_activity
 
 class Organization(TimestampedDbModel):
     __tablename__ = "organization"
+    __table_args__ = (
+        sa.Index(
+            "ix_organization_name_trgm",
+            sa.text("lower(name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
 
     name: Mapped[str] = mapped_column(sa.String, nullable=False)
 
     phone_numbers: Mapped[List[str]] = mapped_column(ARRAY(sa.String), nullable=False)
 
-    building_pk: Mapped[int] = mapped_column(sa.ForeignKey("building.pk"))
+    building_pk: Mapped[int] = mapped_column(sa.ForeignKey("building.pk"), index=True)
     building = relationship('Building', back_populates="organizations")
 
     activities = relationship(
         'Activity', secondary=organization_activity, back_populates="organizations"
-    )
\ No newline at end of file
+    )
+
+class OrganizationReadModel(TimestampedDbModel):
+    # Денормализованная копия организации со зданием и деятельностями для чтения.
+    # Заполняется только триггерами на organization, organization_activity, building и activity.
+    __tablename__ = "organization_read_model"
+    __table_args__ = (
+        sa.Index(
+            "ix_organization_read_model_name_trgm",
+            sa.text("lower(name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        sa.Index("ix_organization_read_model_activity_pks", "activity_pks", postgresql_using="gin"),
+        sa.Index("ix_organization_read_model_activity_names", "activity_names", postgresql_using="gin"),
+    )
+
+    name: Mapped[str] = mapped_column(sa.String, nullable=False)
+
+    phone_numbers: Mapped[List[str]] = mapped_column(ARRAY(sa.String), nullable=False)
+
+    building_pk: Mapped[uuid.UUID] = mapped_column(sa.UUID, nullable=False, index=True)
+    building_address: Mapped[str] = mapped_column(sa.String, nullable=False)
+    building_latitude: Mapped[float] = mapped_column(sa.Float, nullable=False)
+    building_longitude: Mapped[float] = mapped_column(sa.Float, nullable=False)
+
+    activity_pks: Mapped[List[uuid.UUID]] = mapped_column(
+        ARRAY(sa.UUID), nullable=False, server_default=sa.text("'{}'")
+    )
+    activity_names: Mapped[List[str]] = mapped_column(
+        ARRAY(sa.String), nullable=False, server_default=sa.text("'{}'")
+    )
@@ -0,0 +1,13 @@
+import sqlalchemy as sa
+
+from domain.models.base import TimestampedDbModel
+
+
+# Счётчик изменений по таблицам. Увеличивается только триггерами в той же транзакции, что и сами
+# изменения, поэтому новое значение становится видно вместе с данными, независимо от updated_at.
+table_version = sa.Table(
+    "table_version",
+    TimestampedDbModel.metadata,
+    sa.Column("table_name", sa.String, primary_key=True),
+    sa.Column("version", sa.BigInteger, nullable=False, server_default=sa.text("0")),
+)
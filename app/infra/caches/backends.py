@@ -0,0 +1,104 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import pickle
+import time
+from typing import Any, Protocol
+
+from settings.config import config
+
+
+class BaseCacheBackend(ABC):
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        ...
+
+
+@dataclass
+class InMemoryCacheBackend(BaseCacheBackend):
+
+    max_entries: int = 10000
+
+    # Порядок ключей — порядок использования: в начале самые давно не читанные записи.
+    _entries: OrderedDict[str, tuple[float, Any]] = field(default_factory=OrderedDict, init=False)
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisClient(Protocol):
+    # Подмножество API redis.asyncio.Redis, которым пользуется бэкенд.
+
+    async def get(self, name: str) -> bytes | None:
+        ...
+
+    async def set(self, name: str, value: bytes, px: int | None = None) -> Any:
+        ...
+
+    async def delete(self, *names: str) -> Any:
+        ...
+
+    def scan_iter(self, match: str | None = None) -> Any:
+        ...
+
+
+@dataclass
+class RedisCacheBackend(BaseCacheBackend):
+
+    client: RedisClient
+    key_prefix: str = 'organizations:'
+
+    async def get(self, key: str) -> Any | None:
+        payload = await self.client.get(self.key_prefix + key)
+        if payload is None:
+            return None
+        return pickle.loads(payload)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        await self.client.set(self.key_prefix + key, payload, px=max(int(ttl_seconds * 1000), 1))
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=self.key_prefix + '*')]
+        if keys:
+            await self.client.delete(*keys)
+
+
+def create_cache_backend() -> BaseCacheBackend:
+    if config.response_cache_backend == 'redis':
+        # Клиент нужен только этому бэкенду, поэтому импортируется лениво.
+        from redis.asyncio import Redis
+
+        return RedisCacheBackend(client=Redis.from_url(config.response_cache_redis_url))
+    return InMemoryCacheBackend(max_entries=config.response_cache_max_entries)
+
+
+response_cache_backend = create_cache_backend()
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import datetime
+from typing import Mapping
+import uuid
+
+from sqlalchemy import any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.buildings import Buildings
+from domain.models.buildings.models import Building
+from settings.config import config
+
+
+@dataclass
+class BuildingCache:
+
+    max_entries: int = 100_000
+
+    # Здание хранится вместе со своим updated_at; порядок ключей — порядок использования.
+    _entries: OrderedDict[uuid.UUID, tuple[datetime.datetime, Buildings]] = field(default_factory=OrderedDict, init=False)
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    async def get_many(
+        self,
+        db_session: AsyncSession,
+        versions: Mapping[uuid.UUID, datetime.datetime],
+    ) -> dict[uuid.UUID, Buildings]:
+        # versions — updated_at зданий из той же выборки, что и организации.
+        # Запись с другим updated_at устарела и загружается заново вместе с отсутствующими.
+        buildings = {}
+        missing_pks = []
+        for pk, updated_at in versions.items():
+            entry = self._entries.get(pk)
+            if entry is not None and entry[0] == updated_at:
+                self._entries.move_to_end(pk)
+                buildings[pk] = entry[1]
+            else:
+                missing_pks.append(pk)
+
+        self.hits += len(buildings)
+        self.misses += len(missing_pks)
+        if not missing_pks:
+            return buildings
+
+        stmt = (
+            select(Building.pk, Building.address, Building.latitude, Building.longitude, Building.updated_at)
+            # Один параметр-массив вместо параметра на здание: в радиусе их может быть больше лимита протокола.
+            .filter(Building.pk == any_(literal(missing_pks, ARRAY(UUID))))
+        )
+        for row in (await db_session.execute(stmt)).all():
+            building = Buildings(pk=row.pk, address=row.address, latitude=row.latitude, longitude=row.longitude)
+            self._entries[row.pk] = (row.updated_at, building)
+            self._entries.move_to_end(row.pk)
+            buildings[row.pk] = building
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return buildings
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+building_cache = BuildingCache(max_entries=config.building_cache_max_entries)
@@ -0,0 +1,52 @@
+import asyncio
+from dataclasses import dataclass, field
+import hashlib
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.models.activities.models import Activity, organization_activity
+from domain.models.buildings.models import Building
+from domain.models.organizations.models import Organization
+from infra.table_versions import fetch_table_versions
+from settings.config import config
+
+
+@dataclass
+class TableDataVersion:
+
+    table_names: tuple[str, ...]
+    check_interval_seconds: float = 1.0
+
+    _version: str | None = field(default=None, init=False)
+    _checked_at: float = field(default=0.0, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    def _is_fresh(self) -> bool:
+        return self._version is not None and time.monotonic() - self._checked_at < self.check_interval_seconds
+
+    async def get(self, db_session: AsyncSession) -> str:
+        # Версия — отпечаток счётчиков изменений таблиц: любое изменение данных даёт новое пространство ключей.
+        if self._is_fresh() or (self._version is not None and self._lock.locked()):
+            return self._version
+
+        async with self._lock:
+            if not self._is_fresh():
+                versions = await fetch_table_versions(db_session=db_session, table_names=self.table_names)
+                self._version = hashlib.sha1(repr(sorted(versions.items())).encode()).hexdigest()[:16]
+                self._checked_at = time.monotonic()
+            return self._version
+
+    def invalidate(self) -> None:
+        self._checked_at = 0.0
+
+
+organization_data_version = TableDataVersion(
+    table_names=(
+        Organization.__tablename__,
+        organization_activity.name,
+        Building.__tablename__,
+        Activity.__tablename__,
+    ),
+    check_interval_seconds=config.response_cache_version_check_seconds,
+)
@@ -0,0 +1,61 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from infra.metrics import coalesced_requests_total
+
+
+ResultT = TypeVar('ResultT')
+
+
+@dataclass
+class SingleFlight:
+    # Одинаковые одновременные вызовы выполняются один раз: первый (ведущий) выполняет загрузку сам,
+    # в своей сессии, остальные ждут его результат. После завершения ничего не хранится.
+
+    _in_flight: dict[tuple, asyncio.Future] = field(default_factory=dict, init=False)
+    # Запись увеличивает поколение: вызовы после неё не присоединяются к загрузкам, начатым до неё.
+    _generation: int = field(default=0, init=False)
+
+    async def run(self, name: str, key: Hashable, load: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        while True:
+            flight_key = (self._generation, name, key)
+            future = self._in_flight.get(flight_key)
+            if future is None:
+                return await self._lead(flight_key, load)
+
+            coalesced_requests_total.inc(name)
+            # wait, а не await future: отмена ожидающего не отменяет загрузку ведущего.
+            await asyncio.wait((future,))
+            if not future.cancelled():
+                return future.result()
+            # Ведущий отменён (клиент отключился) — загрузку выполняет один из ожидавших.
+
+    async def _lead(self, flight_key: tuple, load: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        future = asyncio.get_running_loop().create_future()
+        # Исключение получают ожидающие; если их нет, asyncio не должен ругаться.
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._in_flight[flight_key] = future
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(flight_key) is future:
+                del self._in_flight[flight_key]
+
+    def advance(self) -> None:
+        self._generation += 1
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+
+organization_single_flight = SingleFlight()
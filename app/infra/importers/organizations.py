@@ -0,0 +1,242 @@
+import csv
+from dataclasses import dataclass, field
+import json
+import time
+from typing import Callable, Iterable, Iterator, TextIO
+import uuid
+
+import asyncpg
+
+
+# Фиксированное пространство имён uuid5: повторный импорт того же файла даёт те же ключи.
+IMPORT_NAMESPACE = uuid.UUID('6f1c2a34-9d5e-4b7a-8c21-3e0f9a4b5d17')
+
+CSV_LIST_SEPARATOR = ';'
+
+
+@dataclass(frozen=True)
+class ImportedOrganization:
+
+    pk: uuid.UUID
+    name: str
+    phone_numbers: list[str]
+    building_pk: uuid.UUID
+    address: str
+    latitude: float
+    longitude: float
+    activity_names: list[str]
+
+
+@dataclass
+class ImportProgress:
+
+    rows: int = 0
+    batches: int = 0
+    unknown_activity_names: set[str] = field(default_factory=set)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def building_key(address: str, latitude: float, longitude: float) -> uuid.UUID:
+    return uuid.uuid5(IMPORT_NAMESPACE, f'building\x1f{address}\x1f{latitude:.7f}\x1f{longitude:.7f}')
+
+
+def organization_key(name: str, building_pk: uuid.UUID) -> uuid.UUID:
+    return uuid.uuid5(IMPORT_NAMESPACE, f'organization\x1f{name}\x1f{building_pk}')
+
+
+def _to_record(raw: dict) -> ImportedOrganization:
+    building = raw.get('building') or raw
+    address = building['address'].strip()
+    latitude = float(building['latitude'])
+    longitude = float(building['longitude'])
+    name = raw['name'].strip()
+    building_pk = uuid.UUID(raw['building_pk']) if raw.get('building_pk') else building_key(address, latitude, longitude)
+    return ImportedOrganization(
+        pk=uuid.UUID(raw['pk']) if raw.get('pk') else organization_key(name, building_pk),
+        name=name,
+        phone_numbers=list(raw.get('phone_numbers') or []),
+        building_pk=building_pk,
+        address=address,
+        latitude=latitude,
+        longitude=longitude,
+        activity_names=list(raw.get('activities') or []),
+    )
+
+
+def read_ndjson(source: TextIO) -> Iterator[ImportedOrganization]:
+    # {"name": ..., "phone_numbers": [...], "building": {"address": ..., "latitude": ..., "longitude": ...}, "activities": [...]}
+    for line in source:
+        if line.strip():
+            yield _to_record(json.loads(line))
+
+
+def read_csv(source: TextIO) -> Iterator[ImportedOrganization]:
+    # Столбцы: name, phone_numbers, address, latitude, longitude, activities; списки разделены ';'.
+    for row in csv.DictReader(source):
+        yield _to_record({
+            **row,
+            'phone_numbers': [value.strip() for value in (row.get('phone_numbers') or '').split(CSV_LIST_SEPARATOR) if value.strip()],
+            'activities': [value.strip() for value in (row.get('activities') or '').split(CSV_LIST_SEPARATOR) if value.strip()],
+        })
+
+
+def read_batches(records: Iterable[ImportedOrganization], batch_size: int) -> Iterator[list[ImportedOrganization]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+STAGING_TABLES = (
+    'CREATE TEMP TABLE IF NOT EXISTS import_building '
+    '(pk uuid, address text, latitude float8, longitude float8) ON COMMIT DELETE ROWS',
+    'CREATE TEMP TABLE IF NOT EXISTS import_organization '
+    '(pk uuid, name text, phone_numbers text[], building_pk uuid) ON COMMIT DELETE ROWS',
+    'CREATE TEMP TABLE IF NOT EXISTS import_organization_activity '
+    '(organization_pk uuid, activity_pk uuid) ON COMMIT DELETE ROWS',
+)
+
+# Строки, совпадающие с уже сохранёнными, не обновляются: повторный импорт не трогает updated_at
+# и не запускает пересчёт read model.
+UPSERT_STATEMENTS = (
+    """
+    INSERT INTO building (pk, address, latitude, longitude)
+    SELECT DISTINCT ON (pk) pk, address, latitude, longitude FROM import_building
+    ON CONFLICT (pk) DO UPDATE SET
+        address = EXCLUDED.address,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        updated_at = now()
+    WHERE (building.address, building.latitude, building.longitude)
+        IS DISTINCT FROM (EXCLUDED.address, EXCLUDED.latitude, EXCLUDED.longitude)
+    """,
+    """
+    INSERT INTO organization (pk, name, phone_numbers, building_pk)
+    SELECT DISTINCT ON (pk) pk, name, phone_numbers, building_pk FROM import_organization
+    ON CONFLICT (pk) DO UPDATE SET
+        name = EXCLUDED.name,
+        phone_numbers = EXCLUDED.phone_numbers,
+        building_pk = EXCLUDED.building_pk,
+        updated_at = now()
+    WHERE (organization.name, organization.phone_numbers, organization.building_pk)
+        IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.phone_numbers, EXCLUDED.building_pk)
+    """,
+    # Набор деятельностей из файла заменяет прежний: лишние связи удаляются, новые добавляются.
+    # Связи не имеют своего updated_at, поэтому у затронутых организаций он сдвигается явно:
+    # updated_at организации отражает и смену её деятельностей.
+    """
+    WITH removed AS (
+        DELETE FROM organization_activity
+        WHERE organization_pk IN (SELECT pk FROM import_organization)
+          AND NOT EXISTS (
+              SELECT 1 FROM import_organization_activity
+              WHERE import_organization_activity.organization_pk = organization_activity.organization_pk
+                AND import_organization_activity.activity_pk = organization_activity.activity_pk
+          )
+        RETURNING organization_pk
+    ), added AS (
+        INSERT INTO organization_activity (organization_pk, activity_pk)
+        SELECT DISTINCT organization_pk, activity_pk FROM import_organization_activity
+        WHERE NOT EXISTS (
+            SELECT 1 FROM organization_activity
+            WHERE organization_activity.organization_pk = import_organization_activity.organization_pk
+              AND organization_activity.activity_pk = import_organization_activity.activity_pk
+        )
+        ON CONFLICT (organization_pk, activity_pk) DO NOTHING
+        RETURNING organization_pk
+    )
+    UPDATE organization SET updated_at = now()
+    WHERE pk IN (SELECT organization_pk FROM removed UNION SELECT organization_pk FROM added)
+    """,
+)
+
+
+@dataclass
+class OrganizationBulkImporter:
+
+    connection: asyncpg.Connection
+    create_missing_activities: bool = False
+
+    _activity_pks: dict[str, uuid.UUID] = field(default_factory=dict, init=False)
+
+    async def prepare(self) -> None:
+        for statement in STAGING_TABLES:
+            await self.connection.execute(statement)
+        # При одинаковых названиях берётся самая ранняя деятельность.
+        rows = await self.connection.fetch(
+            'SELECT DISTINCT ON (name) name, pk FROM activity ORDER BY name, created_at, pk'
+        )
+        self._activity_pks = {row['name']: row['pk'] for row in rows}
+
+    async def import_records(
+        self,
+        records: Iterable[ImportedOrganization],
+        batch_size: int,
+        on_batch: Callable[[ImportProgress], None] | None = None,
+    ) -> ImportProgress:
+        progress = ImportProgress()
+        for batch in read_batches(records, batch_size=batch_size):
+            await self._import_batch(batch, progress=progress)
+            progress.rows += len(batch)
+            progress.batches += 1
+            if on_batch is not None:
+                on_batch(progress)
+        return progress
+
+    async def _resolve_activity_pks(self, batch: list[ImportedOrganization], progress: ImportProgress) -> None:
+        missing_names = {
+            name for record in batch for name in record.activity_names if name not in self._activity_pks
+        }
+        if not missing_names:
+            return
+        if not self.create_missing_activities:
+            progress.unknown_activity_names |= missing_names
+            return
+
+        # Новые деятельности создаются корневыми, с детерминированным ключом по названию.
+        created = {name: uuid.uuid5(IMPORT_NAMESPACE, f'activity\x1f{name}') for name in missing_names}
+        await self.connection.executemany(
+            'INSERT INTO activity (pk, name) VALUES ($1, $2) ON CONFLICT (pk) DO NOTHING',
+            [(pk, name) for name, pk in created.items()],
+        )
+        self._activity_pks.update(created)
+
+    async def _import_batch(self, batch: list[ImportedOrganization], progress: ImportProgress) -> None:
+        async with self.connection.transaction():
+            await self._resolve_activity_pks(batch, progress=progress)
+
+            await self.connection.copy_records_to_table(
+                'import_building',
+                records=[(record.building_pk, record.address, record.latitude, record.longitude) for record in batch],
+                columns=('pk', 'address', 'latitude', 'longitude'),
+            )
+            await self.connection.copy_records_to_table(
+                'import_organization',
+                records=[(record.pk, record.name, record.phone_numbers, record.building_pk) for record in batch],
+                columns=('pk', 'name', 'phone_numbers', 'building_pk'),
+            )
+            await self.connection.copy_records_to_table(
+                'import_organization_activity',
+                records=[
+                    (record.pk, self._activity_pks[name])
+                    for record in batch
+                    for name in record.activity_names
+                    if name in self._activity_pks
+                ],
+                columns=('organization_pk', 'activity_pk'),
+            )
+            for statement in UPSERT_STATEMENTS:
+                await self.connection.execute(statement)
+
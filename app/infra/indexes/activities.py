@@ -0,0 +1,78 @@
+import asyncio
+from dataclasses import dataclass, field
+import time
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.models.activities.models import Activity
+from infra.table_versions import fetch_table_version
+from settings.config import config
+
+
+@dataclass
+class ActivityTaxonomyCache:
+
+    ttl_seconds: float = 60.0
+
+    _pks_by_name: dict[str, tuple[uuid.UUID, ...]] = field(default_factory=dict, init=False)
+    _descendant_pks: dict[uuid.UUID, frozenset[uuid.UUID]] = field(default_factory=dict, init=False)
+    _version: int | None = field(default=None, init=False)
+    _checked_at: float = field(default=0.0, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    @property
+    def is_ready(self) -> bool:
+        return self._version is not None
+
+    async def refresh(self, db_session: AsyncSession, force: bool = False) -> None:
+        async with self._lock:
+            version = await fetch_table_version(db_session=db_session, table_name=Activity.__tablename__)
+            self._checked_at = time.monotonic()
+            if not force and version == self._version:
+                return
+
+            rows = (await db_session.execute(select(Activity.pk, Activity.name, Activity.parent_pk))).all()
+            pks_by_name: dict[str, list[uuid.UUID]] = {}
+            children: dict[uuid.UUID, list[uuid.UUID]] = {}
+            for row in rows:
+                pks_by_name.setdefault(row.name, []).append(row.pk)
+                if row.parent_pk is not None:
+                    children.setdefault(row.parent_pk, []).append(row.pk)
+
+            descendant_pks = {}
+            for row in rows:
+                subtree = {row.pk}
+                stack = [row.pk]
+                while stack:
+                    for child_pk in children.get(stack.pop(), ()):
+                        if child_pk not in subtree:
+                            subtree.add(child_pk)
+                            stack.append(child_pk)
+                descendant_pks[row.pk] = frozenset(subtree)
+
+            self._pks_by_name = {name: tuple(pks) for name, pks in pks_by_name.items()}
+            self._descendant_pks = descendant_pks
+            self._version = version
+
+    async def ensure_fresh(self, db_session: AsyncSession) -> None:
+        if not self.is_ready:
+            await self.refresh(db_session=db_session)
+            return
+        if self._lock.locked() or time.monotonic() - self._checked_at < self.ttl_seconds:
+            return
+        await self.refresh(db_session=db_session)
+
+    def invalidate(self) -> None:
+        # Сигнал об изменении дерева: следующий ensure_fresh сверит версию таблицы сразу, не дожидаясь TTL.
+        self._checked_at = 0.0
+
+    def get_activity_pks(self, name: str) -> tuple[uuid.UUID, ...]:
+        return self._pks_by_name.get(name, ())
+
+    def get_descendant_pks(self, name: str) -> frozenset[uuid.UUID]:
+        return frozenset().union(*(self._descendant_pks[pk] for pk in self.get_activity_pks(name)))
+
+
+activity_taxonomy_cache = ActivityTaxonomyCache(ttl_seconds=config.activity_cache_ttl_seconds)
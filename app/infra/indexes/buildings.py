@@ -0,0 +1,105 @@
+import asyncio
+from dataclasses import dataclass, field
+import math
+import time
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.models.buildings.models import Building
+from infra.table_versions import fetch_table_version
+from settings.config import config
+
+
+@dataclass(frozen=True)
+class IndexedBuilding:
+
+    pk: uuid.UUID
+    latitude: float
+    longitude: float
+
+
+@dataclass
+class BuildingSpatialIndex:
+
+    cell_size_degrees: float = 0.5
+    refresh_interval_seconds: float = 5.0
+
+    _cells: dict[tuple[int, int], list[IndexedBuilding]] = field(default_factory=dict, init=False)
+    _version: int | None = field(default=None, init=False)
+    _checked_at: float = field(default=0.0, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    @property
+    def is_ready(self) -> bool:
+        return self._version is not None
+
+    async def refresh(self, db_session: AsyncSession, force: bool = False) -> None:
+        async with self._lock:
+            version = await fetch_table_version(db_session=db_session, table_name=Building.__tablename__)
+            self._checked_at = time.monotonic()
+            if not force and version == self._version:
+                return
+
+            rows = (await db_session.execute(select(Building.pk, Building.latitude, Building.longitude))).all()
+            cells: dict[tuple[int, int], list[IndexedBuilding]] = {}
+            for row in rows:
+                building = IndexedBuilding(pk=row.pk, latitude=row.latitude, longitude=row.longitude)
+                cells.setdefault(self._cell_of(building.latitude, building.longitude), []).append(building)
+
+            self._cells = cells
+            self._version = version
+
+    async def ensure_fresh(self, db_session: AsyncSession) -> None:
+        if not self.is_ready:
+            await self.refresh(db_session=db_session)
+            return
+        # Пока идёт перестроение, запросы обслуживаются по предыдущему снимку.
+        if self._lock.locked() or time.monotonic() - self._checked_at < self.refresh_interval_seconds:
+            return
+        await self.refresh(db_session=db_session)
+
+    def get_buildings_in_area(
+        self,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+    ) -> list[IndexedBuilding]:
+        min_row, min_column = self._cell_of(min_latitude, min_longitude)
+        max_row, max_column = self._cell_of(max_latitude, max_longitude)
+        cells = self._cells
+
+        if (max_row - min_row + 1) * (max_column - min_column + 1) > len(cells):
+            candidate_cells = [
+                buildings for (row, column), buildings in cells.items()
+                if min_row <= row <= max_row and min_column <= column <= max_column
+            ]
+        else:
+            candidate_cells = [
+                cells[(row, column)]
+                for row in range(min_row, max_row + 1)
+                for column in range(min_column, max_column + 1)
+                if (row, column) in cells
+            ]
+
+        return [
+            building
+            for buildings in candidate_cells
+            for building in buildings
+            if min_latitude <= building.latitude <= max_latitude
+            and min_longitude <= building.longitude <= max_longitude
+        ]
+
+    def _cell_of(self, latitude: float, longitude: float) -> tuple[int, int]:
+        return (
+            math.floor(latitude / self.cell_size_degrees),
+            math.floor(longitude / self.cell_size_degrees),
+        )
+
+
+building_spatial_index = BuildingSpatialIndex(
+    cell_size_degrees=config.spatial_index_cell_size_degrees,
+    refresh_interval_seconds=config.spatial_index_refresh_seconds,
+)
@@ -0,0 +1,151 @@
+import asyncio
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import datetime
+import logging
+from typing import Callable
+import uuid
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.organizations import OrganizationSuggestion
+from domain.models.organizations.models import Organization
+from infra.table_versions import fetch_table_version
+from settings.config import config
+
+
+logger = logging.getLogger(__name__)
+
+
+def name_key(title: str) -> str:
+    # Та же нормализация, что и lower() в SQL-поиске по префиксу: casefold() разошёлся бы с ним (Straße → strasse).
+    return title.lower()
+
+
+@dataclass
+class OrganizationNameIndex:
+
+    refresh_interval_seconds: float = 5.0
+    bulk_threshold: int = 64
+    # updated_at — время начала транзакции, а видна она становится только после коммита:
+    # дельта перечитывает окно назад, чтобы не пропустить строки из закоммитившихся позже транзакций.
+    lookback_seconds: float = 300.0
+
+    # Отсортированные по ключу параллельные массивы: поиск по префиксу — bisect + срез.
+    _keys: list[str] = field(default_factory=list, init=False)
+    _pks: list[uuid.UUID] = field(default_factory=list, init=False)
+    _titles: list[str] = field(default_factory=list, init=False)
+    _keys_by_pk: dict[uuid.UUID, str] = field(default_factory=dict, init=False)
+    _version: int | None = field(default=None, init=False)
+    _updated_at: datetime.datetime | None = field(default=None, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    @property
+    def is_ready(self) -> bool:
+        return self._version is not None
+
+    async def refresh(self, db_session: AsyncSession, force: bool = False) -> None:
+        async with self._lock:
+            version = await fetch_table_version(db_session=db_session, table_name=Organization.__tablename__)
+            if not force and version == self._version:
+                return
+
+            if force or not self.is_ready or self._updated_at is None:
+                await self._rebuild(db_session=db_session)
+            else:
+                stmt = select(Organization.pk, Organization.name, Organization.updated_at).filter(
+                    Organization.updated_at >= self._updated_at - datetime.timedelta(seconds=self.lookback_seconds)
+                )
+                rows = (await db_session.execute(stmt)).all()
+                self.add_many([(row.pk, row.name) for row in rows])
+                self._updated_at = max([self._updated_at, *(row.updated_at for row in rows)])
+                # Удаления не двигают updated_at — расхождение по количеству лечится полной перестройкой.
+                row_count = (await db_session.execute(select(func.count()).select_from(Organization))).scalar_one()
+                if len(self._pks) != row_count:
+                    await self._rebuild(db_session=db_session)
+
+            self._version = version
+
+    async def run_refresh_loop(self, session_factory: Callable[[], AsyncSession]) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval_seconds)
+            try:
+                async with session_factory() as db_session:
+                    await self.refresh(db_session=db_session)
+            except Exception:
+                logger.exception('Не удалось обновить индекс названий организаций')
+
+    def add(self, pk: uuid.UUID, title: str) -> None:
+        self.discard(pk=pk)
+        key = name_key(title)
+        position = bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self._pks.insert(position, pk)
+        self._titles.insert(position, title)
+        self._keys_by_pk[pk] = key
+
+    def discard(self, pk: uuid.UUID) -> None:
+        key = self._keys_by_pk.pop(pk, None)
+        if key is None:
+            return
+        position = bisect_left(self._keys, key)
+        while self._pks[position] != pk:
+            position += 1
+        del self._keys[position], self._pks[position], self._titles[position]
+
+    def add_many(self, entries: list[tuple[uuid.UUID, str]]) -> None:
+        if len(entries) <= self.bulk_threshold:
+            for pk, title in entries:
+                self.add(pk=pk, title=title)
+            return
+        # Для крупных пакетов вставка по одному — квадратичная; дешевле одна пересортировка почти упорядоченных массивов.
+        changed_pks = {pk for pk, _ in entries}
+        merged = sorted(
+            [
+                (key, pk, title)
+                for key, pk, title in zip(self._keys, self._pks, self._titles)
+                if pk not in changed_pks
+            ]
+            + [(name_key(title), pk, title) for pk, title in entries]
+        )
+        self._set_entries(merged)
+
+    def discard_many(self, pks: list[uuid.UUID]) -> None:
+        if len(pks) <= self.bulk_threshold:
+            for pk in pks:
+                self.discard(pk=pk)
+            return
+        removed_pks = set(pks)
+        self._set_entries([
+            (key, pk, title)
+            for key, pk, title in zip(self._keys, self._pks, self._titles)
+            if pk not in removed_pks
+        ])
+
+    def suggest(self, prefix: str, limit: int) -> list[OrganizationSuggestion]:
+        key = name_key(prefix)
+        keys = self._keys
+        position = bisect_left(keys, key)
+        suggestions = []
+        while position < len(keys) and len(suggestions) < limit and keys[position].startswith(key):
+            suggestions.append(OrganizationSuggestion(pk=self._pks[position], title=self._titles[position]))
+            position += 1
+        return suggestions
+
+    async def _rebuild(self, db_session: AsyncSession) -> None:
+        rows = (await db_session.execute(select(Organization.pk, Organization.name, Organization.updated_at))).all()
+        self._set_entries(sorted((name_key(row.name), row.pk, row.name) for row in rows))
+        self._updated_at = max((row.updated_at for row in rows), default=None)
+
+    def _set_entries(self, entries: list[tuple[str, uuid.UUID, str]]) -> None:
+        self._keys = [key for key, _, _ in entries]
+        self._pks = [pk for _, pk, _ in entries]
+        self._titles = [title for _, _, title in entries]
+        self._keys_by_pk = {pk: key for key, pk, _ in entries}
+
+
+organization_name_index = OrganizationNameIndex(
+    refresh_interval_seconds=config.autocomplete_index_refresh_seconds,
+    lookback_seconds=config.autocomplete_index_lookback_seconds,
+)
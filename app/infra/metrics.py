@@ -0,0 +1,224 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Iterable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+DEFAULT_SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_COUNT_BUCKETS = (1, 2, 3, 5, 10, 25, 50, 100)
+
+
+@dataclass
+class RequestTimings:
+
+    sql_statements: int = 0
+    db_seconds: float = 0.0
+    hydration_seconds: float = 0.0
+    serialization_seconds: float = 0.0
+
+
+# Замеры текущего запроса; вне HTTP-запроса (lifespan, фоновые задачи, CLI) — None.
+current_request_timings: ContextVar[RequestTimings | None] = ContextVar('current_request_timings', default=None)
+
+
+@contextmanager
+def measure(phase: str) -> Iterator[None]:
+    # phase — 'hydration' или 'serialization'.
+    timings = current_request_timings.get()
+    if timings is None:
+        yield
+        return
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        attribute = f'{phase}_seconds'
+        setattr(timings, attribute, getattr(timings, attribute) + time.perf_counter() - started_at)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(label_names: tuple[str, ...], label_values: tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_metric(name: str, metric_type: str, description: str, samples: Iterable[tuple[str, float]]) -> list[str]:
+    # samples — пары (суффикс имени с метками, значение) в текстовом формате Prometheus 0.0.4.
+    lines = [f'# HELP {name} {description}', f'# TYPE {name} {metric_type}']
+    lines.extend(f'{name}{suffix} {_format_value(value)}' for suffix, value in samples)
+    return lines
+
+
+@dataclass
+class Counter:
+
+    name: str
+    description: str
+    label_names: tuple[str, ...] = ()
+
+    _values: dict[tuple[str, ...], float] = field(default_factory=dict, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return render_metric(
+            self.name,
+            'counter',
+            self.description,
+            ((format_labels(self.label_names, label_values), value) for label_values, value in values),
+        )
+
+
+@dataclass
+class Histogram:
+
+    name: str
+    description: str
+    label_names: tuple[str, ...] = ()
+    buckets: tuple[float, ...] = DEFAULT_SECONDS_BUCKETS
+
+    # По каждому набору меток: счётчики корзин (не накопительные), сумма и количество наблюдений.
+    _series: dict[tuple[str, ...], tuple[list[int], list[float]]] = field(default_factory=dict, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def observe(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = ([0] * (len(self.buckets) + 1), [0.0, 0])
+            bucket_counts, totals = series
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    bucket_counts[index] += 1
+                    break
+            else:
+                bucket_counts[-1] += 1
+            totals[0] += value
+            totals[1] += 1
+
+    def render(self) -> list[str]:
+        with self._lock:
+            series = sorted(
+                (label_values, (list(bucket_counts), list(totals)))
+                for label_values, (bucket_counts, totals) in self._series.items()
+            )
+
+        samples = []
+        for label_values, (bucket_counts, (total, count)) in series:
+            cumulative = 0
+            for upper_bound, bucket_count in zip((*self.buckets, float('inf')), bucket_counts):
+                cumulative += bucket_count
+                le = '+Inf' if upper_bound == float('inf') else _format_value(upper_bound)
+                bucket_label = f'le="{le}"'
+                samples.append((f'_bucket{format_labels(self.label_names, label_values, extra=bucket_label)}', cumulative))
+            samples.append((f'_sum{format_labels(self.label_names, label_values)}', total))
+            samples.append((f'_count{format_labels(self.label_names, label_values)}', count))
+        return render_metric(self.name, 'histogram', self.description, samples)
+
+
+@dataclass
+class MetricsRegistry:
+
+    _metrics: list[Counter | Histogram] = field(default_factory=list, init=False)
+
+    def counter(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> Counter:
+        counter = Counter(name=name, description=description, label_names=label_names)
+        self._metrics.append(counter)
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_SECONDS_BUCKETS,
+    ) -> Histogram:
+        histogram = Histogram(name=name, description=description, label_names=label_names, buckets=buckets)
+        self._metrics.append(histogram)
+        return histogram
+
+    def render(self) -> list[str]:
+        return [line for metric in self._metrics for line in metric.render()]
+
+
+metrics_registry = MetricsRegistry()
+
+REQUEST_LABELS = ('method', 'route')
+
+http_requests_total = metrics_registry.counter(
+    'organizations_http_requests_total', 'Обработанные HTTP-запросы.', ('method', 'route', 'status')
+)
+http_request_duration_seconds = metrics_registry.histogram(
+    'organizations_http_request_duration_seconds', 'Время обработки HTTP-запроса, включая отправку тела.', REQUEST_LABELS
+)
+request_sql_statements = metrics_registry.histogram(
+    'organizations_request_sql_statements',
+    'SQL-выражений на один HTTP-запрос; рост — признак N+1.',
+    REQUEST_LABELS,
+    buckets=STATEMENT_COUNT_BUCKETS,
+)
+request_db_seconds = metrics_registry.histogram(
+    'organizations_request_db_seconds', 'Суммарное время SQL-выражений за HTTP-запрос.', REQUEST_LABELS
+)
+request_hydration_seconds = metrics_registry.histogram(
+    'organizations_request_hydration_seconds', 'Построение сущностей из строк выборки за HTTP-запрос.', REQUEST_LABELS
+)
+request_serialization_seconds = metrics_registry.histogram(
+    'organizations_request_serialization_seconds', 'Кодирование тела ответа за HTTP-запрос.', REQUEST_LABELS
+)
+coalesced_requests_total = metrics_registry.counter(
+    'organizations_coalesced_requests_total',
+    'Вызовы сервиса, присоединившиеся к уже идущему одинаковому запросу вместо своего.',
+    ('query',),
+)
+db_statements_total = metrics_registry.counter(
+    'organizations_db_statements_total', 'Выполненные SQL-выражения, включая фоновые задачи.'
+)
+db_statement_duration_seconds = metrics_registry.histogram(
+    'organizations_db_statement_duration_seconds', 'Время выполнения одного SQL-выражения.'
+)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    # Время считается от отправки выражения до получения результата; выборка
+    # серверным курсором (yield_per) после первого ответа сюда не входит.
+    @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault('query_started_at', []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info['query_started_at'].pop()
+        db_statements_total.inc()
+        db_statement_duration_seconds.observe(elapsed)
+
+        timings = current_request_timings.get()
+        if timings is not None:
+            timings.sql_statements += 1
+            timings.db_seconds += elapsed
+
+    @event.listens_for(engine.sync_engine, 'handle_error')
+    def handle_error(exception_context) -> None:
+        # after_cursor_execute для упавшего выражения не вызывается.
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('query_started_at'):
+            connection.info['query_started_at'].pop()
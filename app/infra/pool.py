@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+@dataclass
+class PoolMetrics:
+
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    waits: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.waits += 1
+            self.timeouts += timed_out
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    # Пул с подсчётом выдач соединений и времени ожидания свободного соединения.
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+        if '_dispatch' in kwargs:
+            # Пересоздание пула (recreate) копирует слушателей вместе с dispatch.
+            return
+        metrics = self.metrics
+        event.listen(self, 'connect', lambda *_: metrics.increment('connects'))
+        event.listen(self, 'checkout', lambda *_: metrics.increment('checkouts'))
+        event.listen(self, 'checkin', lambda *_: metrics.increment('checkins'))
+        event.listen(self, 'invalidate', lambda *_: metrics.increment('invalidations'))
+
+    def _do_get(self):
+        # Ждать приходится только когда свободных соединений нет и лимит overflow исчерпан.
+        is_exhausted = self.checkedin() == 0 and -1 < self._max_overflow <= self.overflow()
+        if not is_exhausted:
+            return super()._do_get()
+
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_wait(time.perf_counter() - started_at, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - started_at)
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
@@ -0,0 +1,85 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import itertools
+import logging
+from typing import AsyncIterator, Literal
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+
+logger = logging.getLogger(__name__)
+
+ConnectionErrors = (SQLAlchemyError, OSError, asyncio.TimeoutError)
+
+
+@dataclass
+class ReadSessionRouter:
+
+    primary: AsyncEngine
+    replicas: list[AsyncEngine] = field(default_factory=list)
+    strategy: Literal['round_robin', 'least_connections'] = 'round_robin'
+    health_check_interval_seconds: float = 5.0
+    health_check_timeout_seconds: float = 2.0
+
+    _unhealthy: set[AsyncEngine] = field(default_factory=set, init=False)
+    _counter: itertools.count = field(default_factory=itertools.count, init=False)
+
+    def is_healthy(self, engine: AsyncEngine) -> bool:
+        return engine not in self._unhealthy
+
+    def _get_candidates(self) -> list[AsyncEngine]:
+        healthy_replicas = [replica for replica in self.replicas if self.is_healthy(replica)]
+        if not healthy_replicas:
+            return []
+        if self.strategy == 'least_connections':
+            return sorted(healthy_replicas, key=lambda replica: replica.pool.checkedout())
+        start = next(self._counter) % len(healthy_replicas)
+        return healthy_replicas[start:] + healthy_replicas[:start]
+
+    def _mark_unhealthy(self, engine: AsyncEngine, error: BaseException) -> None:
+        if engine not in self._unhealthy:
+            logger.warning('Реплика %s недоступна: %r', engine.url.render_as_string(hide_password=True), error)
+        self._unhealthy.add(engine)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        # Соединение берётся лениво, при первом запросе: сессия, которая ждёт общий результат
+        # или обслуживается из памяти, не держит соединение из пула.
+        candidates = self._get_candidates()
+        engine = candidates[0] if candidates else self.primary
+        async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+            try:
+                yield session
+            except ConnectionErrors as e:
+                # Следующие запросы уйдут на другую реплику или на primary, пока проверка здоровья её не вернёт.
+                if engine is not self.primary and self._is_connection_failure(e):
+                    self._mark_unhealthy(engine, error=e)
+                raise
+
+    @staticmethod
+    def _is_connection_failure(error: BaseException) -> bool:
+        if isinstance(error, DBAPIError):
+            return error.connection_invalidated
+        return isinstance(error, (OSError, asyncio.TimeoutError))
+
+    async def check_health(self) -> None:
+        for replica in self.replicas:
+            try:
+                await asyncio.wait_for(self._ping(replica), timeout=self.health_check_timeout_seconds)
+            except ConnectionErrors as e:
+                self._mark_unhealthy(replica, error=e)
+            else:
+                self._unhealthy.discard(replica)
+
+    async def run_health_check_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval_seconds)
+            await self.check_health()
+
+    @staticmethod
+    async def _ping(engine: AsyncEngine) -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
@@ -0,0 +1,19 @@
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.models.versions.models import table_version
+
+
+async def fetch_table_versions(db_session: AsyncSession, table_names: Iterable[str]) -> dict[str, int]:
+    # Версию нужно читать до самих данных: тогда загруженный снимок не старше запомненной версии.
+    stmt = select(table_version.c.table_name, table_version.c.version).filter(
+        table_version.c.table_name.in_(list(table_names))
+    )
+    return {row.table_name: row.version for row in (await db_session.execute(stmt)).all()}
+
+
+async def fetch_table_version(db_session: AsyncSession, table_name: str) -> int:
+    versions = await fetch_table_versions(db_session=db_session, table_names=(table_name,))
+    return versions[table_name]
@@ -40,3 +40,13 @@ class OrganizationWithBuildingNotFoundException(LogicException):
     @property
     def message(self):
         return f'Организаций в здании "{self.pk_building}" нет.'
+
+
+@dataclass(eq=False)
+class InvalidOrganizationBatchException(LogicException):
+
+    detail: str
+
+    @property
+    def message(self):
+        return f'Пакет организаций не сохранён: {self.detail}'
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from logic.exceptions.base import LogicException
+
+
+@dataclass(eq=False)
+class InvalidCursorException(LogicException):
+
+    cursor: str
+
+    @property
+    def message(self):
+        return f'Некорректный курсор пагинации "{self.cursor}".'
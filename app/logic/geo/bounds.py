@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+import math
+
+
+EARTH_MEAN_RADIUS_KM = 6371.0088
+
+# Минимальный радиус кривизны меридиана WGS-84 (на экваторе): по нему угол,
+# соответствующий радиусу, максимален, поэтому рамка покрывает геодезический круг.
+EARTH_MIN_CURVATURE_RADIUS_KM = 6335.439
+
+# Запас на расхождение сферы и эллипсоида (не более ~0.56%).
+RADIUS_SLACK = 1.01
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+
+    min_latitude: float
+    max_latitude: float
+    min_longitude: float
+    max_longitude: float
+
+
+def bounding_boxes_for_radius(latitude: float, longitude: float, radius_km: float) -> list[BoundingBox]:
+    angular_radius = radius_km * RADIUS_SLACK / EARTH_MIN_CURVATURE_RADIUS_KM
+    if angular_radius >= math.pi:
+        return [BoundingBox(-90.0, 90.0, -180.0, 180.0)]
+
+    delta_latitude = math.degrees(angular_radius)
+    min_latitude = latitude - delta_latitude
+    max_latitude = latitude + delta_latitude
+
+    # Круг накрывает полюс — по долготе ограничений нет.
+    if min_latitude <= -90.0 or max_latitude >= 90.0:
+        return [BoundingBox(max(min_latitude, -90.0), min(max_latitude, 90.0), -180.0, 180.0)]
+
+    delta_longitude = math.degrees(math.asin(min(1.0, math.sin(angular_radius) / math.cos(math.radians(latitude)))))
+    min_longitude = longitude - delta_longitude
+    max_longitude = longitude + delta_longitude
+
+    if delta_longitude >= 180.0:
+        return [BoundingBox(min_latitude, max_latitude, -180.0, 180.0)]
+
+    # Рамка пересекает антимеридиан — разбиваем её на две.
+    if min_longitude < -180.0:
+        return [
+            BoundingBox(min_latitude, max_latitude, min_longitude + 360.0, 180.0),
+            BoundingBox(min_latitude, max_latitude, -180.0, max_longitude),
+        ]
+    if max_longitude > 180.0:
+        return [
+            BoundingBox(min_latitude, max_latitude, min_longitude, 180.0),
+            BoundingBox(min_latitude, max_latitude, -180.0, max_longitude - 360.0),
+        ]
+
+    return [BoundingBox(min_latitude, max_latitude, min_longitude, max_longitude)]
@@ -0,0 +1,131 @@
+import math
+
+import numpy as np
+from geopy.distance import geodesic
+
+from logic.geo.bounds import EARTH_MEAN_RADIUS_KM, EARTH_MIN_CURVATURE_RADIUS_KM, RADIUS_SLACK
+
+
+# Эллипсоид WGS-84 — тот же, что использует geopy.distance.geodesic.
+WGS84_A_KM = 6378.137
+WGS84_F = 1 / 298.257223563
+WGS84_B_KM = (1 - WGS84_F) * WGS84_A_KM
+
+# В пределах этого допуска от границы радиуса расстояние пересчитывается через geodesic,
+# чтобы результат совпадал с поштучной проверкой.
+BOUNDARY_TOLERANCE_KM = 1e-6
+
+# Радиус сферы, на которую earthdistance проецирует координаты (earth() по умолчанию), км.
+EARTHDISTANCE_RADIUS_KM = 6378.168
+
+
+def haversine_distances_km(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+) -> np.ndarray:
+    latitude_rad = np.radians(latitude)
+    latitudes_rad = np.radians(latitudes)
+    half_delta_latitude = (latitudes_rad - latitude_rad) / 2
+    half_delta_longitude = np.radians(np.asarray(longitudes) - longitude) / 2
+
+    a = (
+        np.sin(half_delta_latitude) ** 2
+        + np.cos(latitude_rad) * np.cos(latitudes_rad) * np.sin(half_delta_longitude) ** 2
+    )
+    return 2 * EARTH_MEAN_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def vincenty_distances_km(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    max_iterations: int = 200,
+    tolerance: float = 1e-12,
+) -> np.ndarray:
+    # Обратная задача Винсенти для всех точек сразу. Для почти антиподальных точек
+    # итерации не сходятся — там возвращается NaN.
+    f = WGS84_F
+    delta_longitude = np.radians(np.asarray(longitudes, dtype=float) - longitude)
+    reduced_latitude_1 = np.arctan((1 - f) * np.tan(np.radians(latitude)))
+    reduced_latitudes_2 = np.arctan((1 - f) * np.tan(np.radians(np.asarray(latitudes, dtype=float))))
+    sin_u1, cos_u1 = np.sin(reduced_latitude_1), np.cos(reduced_latitude_1)
+    sin_u2, cos_u2 = np.sin(reduced_latitudes_2), np.cos(reduced_latitudes_2)
+
+    lambda_ = delta_longitude.copy()
+    converged = np.zeros(lambda_.shape, dtype=bool)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(max_iterations):
+            sin_lambda, cos_lambda = np.sin(lambda_), np.cos(lambda_)
+            sin_sigma = np.sqrt(
+                (cos_u2 * sin_lambda) ** 2
+                + (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lambda) ** 2
+            )
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lambda
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(sin_sigma == 0, 0.0, cos_u1 * cos_u2 * sin_lambda / sin_sigma)
+            cos_sq_alpha = 1 - sin_alpha ** 2
+            cos_2sigma_m = np.where(cos_sq_alpha == 0, 0.0, cos_sigma - 2 * sin_u1 * sin_u2 / cos_sq_alpha)
+            c = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
+            next_lambda = delta_longitude + (1 - c) * f * sin_alpha * (
+                sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2))
+            )
+
+            converged = np.abs(next_lambda - lambda_) <= tolerance
+            lambda_ = next_lambda
+            if converged.all():
+                break
+
+        u_sq = cos_sq_alpha * (WGS84_A_KM ** 2 - WGS84_B_KM ** 2) / WGS84_B_KM ** 2
+        a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+        b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+        delta_sigma = b * sin_sigma * (
+            cos_2sigma_m + b / 4 * (
+                cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+                - b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)
+            )
+        )
+        distances = WGS84_B_KM * a * (sigma - delta_sigma)
+
+    return np.where(converged, distances, np.nan)
+
+
+def geodesic_distances_km(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+) -> np.ndarray:
+    distances = vincenty_distances_km(latitude=latitude, longitude=longitude, latitudes=latitudes, longitudes=longitudes)
+
+    # Несошедшиеся точки досчитываем поштучно через geopy.
+    for index in np.flatnonzero(np.isnan(distances)):
+        distances[index] = geodesic((latitude, longitude), (latitudes[index], longitudes[index])).km
+    return distances
+
+
+def geodesic_distances_within_radius(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    radius_km: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    distances = geodesic_distances_km(latitude=latitude, longitude=longitude, latitudes=latitudes, longitudes=longitudes)
+
+    # Точки у самой границы досчитываем поштучно через geopy, чтобы результат совпадал с поштучной проверкой.
+    for index in np.flatnonzero(np.abs(distances - radius_km) <= BOUNDARY_TOLERANCE_KM):
+        distances[index] = geodesic((latitude, longitude), (latitudes[index], longitudes[index])).km
+
+    return distances <= radius_km, distances
+
+
+def min_geodesic_distance_km_for_chord(chord_meters: float) -> float:
+    # Нижняя оценка расстояния по эллипсоиду для точки, чья хорда на сфере earthdistance (оператор <->)
+    # не меньше chord_meters: угол переводится в расстояние по минимальному радиусу кривизны с тем же запасом,
+    # что и у рамок поиска по радиусу.
+    angle = 2 * math.asin(min(1.0, chord_meters / 1000 / (2 * EARTHDISTANCE_RADIUS_KM)))
+    return angle * EARTH_MIN_CURVATURE_RADIUS_KM / RADIUS_SLACK
@@ -0,0 +1,18 @@
+import math
+
+
+MAX_CLUSTER_ZOOM = 20
+
+# Широта, на которой карта в проекции Web Mercator становится квадратом; ближе к полюсам тайлов нет.
+MAX_MERCATOR_LATITUDE = math.degrees(math.atan(math.sinh(math.pi)))
+
+
+def cluster_tile(latitude: float, longitude: float, zoom: int) -> tuple[int, int]:
+    # Строка и столбец тайла веб-карты (Web Mercator, как у OSM и Google): на нулевом уровне один тайл
+    # на весь мир, каждый следующий делит сторону пополам. Строки считаются от севера.
+    tile_count = 2 ** zoom
+    latitude = min(max(latitude, -MAX_MERCATOR_LATITUDE), MAX_MERCATOR_LATITUDE)
+    mercator_y = math.log(math.tan(math.pi / 4 + math.radians(latitude) / 2))
+    row = math.floor((1 - mercator_y / math.pi) / 2 * tile_count)
+    column = math.floor((longitude + 180.0) / 360.0 * tile_count)
+    return min(max(row, 0), tile_count - 1), min(max(column, 0), tile_count - 1)
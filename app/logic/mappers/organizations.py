@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping
+import uuid
+
+from sqlalchemy import Row
+
+from domain.entities.buildings import Buildings
+from domain.entities.organizations import Organization
+from infra.metrics import measure
+
+
+# Организации одного здания в пределах маппера ссылаются на один объект Buildings,
+# поэтому маппер создаётся на выборку, а не на процесс.
+# buildings — здания, уже известные заранее (например, из BuildingCache): для них столбцы
+# building_address/latitude/longitude в строке не нужны.
+@dataclass
+class OrganizationMapper:
+
+    buildings: dict[uuid.UUID, Buildings] = field(default_factory=dict)
+
+    def building(self, row: Row) -> Buildings:
+        building = self.buildings.get(row.building_pk)
+        if building is None:
+            building = self.buildings[row.building_pk] = Buildings(
+                pk=row.building_pk,
+                address=row.building_address,
+                latitude=row.building_latitude,
+                longitude=row.building_longitude,
+            )
+        return building
+
+    def to_entity(self, row: Row, distance_km: float | None = None) -> Organization:
+        return Organization(
+            pk=row.pk,
+            title=row.name,
+            phone_number_list=row.phone_numbers,
+            building=self.building(row),
+            activities=row.activity_names or [],
+            distance_km=distance_km,
+        )
+
+    def to_entities(
+        self,
+        rows: Iterable[Row],
+        distances: Mapping[uuid.UUID, float] | None = None,
+    ) -> list[Organization]:
+        # distances — удалённость по pk здания для выборок по радиусу.
+        with measure('hydration'):
+            if distances is None:
+                return [self.to_entity(row) for row in rows]
+            return [self.to_entity(row, distance_km=distances[row.building_pk]) for row in rows]
@@ -0,0 +1,63 @@
+import base64
+from dataclasses import dataclass
+import datetime
+import json
+from typing import Any, Generic, TypeVar
+import uuid
+
+from logic.exceptions.pagination import InvalidCursorException
+
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+DEFAULT_STREAM_CHUNK_SIZE = 1000
+MAX_STREAM_CHUNK_SIZE = 10000
+
+DEFAULT_SUGGESTION_LIMIT = 10
+MAX_SUGGESTION_LIMIT = 50
+
+DEFAULT_NEAREST_LIMIT = 10
+MAX_NEAREST_LIMIT = 100
+# Первая выборка кандидатов для ближайших: с запасом на расхождение порядка по хорде и по эллипсоиду.
+NEAREST_OVERFETCH_FACTOR = 2
+
+ItemT = TypeVar('ItemT')
+
+
+@dataclass
+class Page(Generic[ItemT]):
+
+    items: list[ItemT]
+    next_cursor: str | None = None
+
+
+def encode_cursor(*values: Any) -> str:
+    def default(value: Any) -> str:
+        if isinstance(value, (datetime.datetime, uuid.UUID)):
+            return str(value)
+        raise TypeError(f'{type(value).__name__} не сериализуется в курсор')
+
+    payload = json.dumps(values, default=default, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    # Курсор непрозрачен для клиента: любая ошибка разбора — это невалидный курсор.
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        return tuple(_parse_cursor_value(value, value_type) for value, value_type in zip(values, types))
+    except (ValueError, TypeError, AttributeError):
+        raise InvalidCursorException(cursor=cursor)
+
+
+def _parse_cursor_value(value: Any, value_type: type) -> Any:
+    if value_type is datetime.datetime:
+        return datetime.datetime.fromisoformat(value)
+    if value_type is uuid.UUID:
+        return uuid.UUID(value)
+    if value_type is float and isinstance(value, (int, float)):
+        return float(value)
+    raise ValueError(value)
@@ -0,0 +1,310 @@
+from dataclasses import dataclass
+import hashlib
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.organizations import Organization as OrganizationEntity, OrganizationBatchResult, OrganizationCluster, OrganizationDraft, OrganizationLookupResult, OrganizationSuggestion
+from infra.caches.backends import BaseCacheBackend
+from infra.caches.versions import TableDataVersion
+from logic.pagination import DEFAULT_NEAREST_LIMIT, DEFAULT_PAGE_LIMIT, DEFAULT_STREAM_CHUNK_SIZE, DEFAULT_SUGGESTION_LIMIT, Page
+from logic.services.organizations import BaseOrganizationService
+
+
+def normalize_float(value: float) -> float:
+    # 55 и 55.0, -0.0 и 0.0 — один и тот же запрос.
+    return float(value) + 0.0
+
+
+@dataclass
+class CachedOrganizationService(BaseOrganizationService):
+
+    service: BaseOrganizationService
+    backend: BaseCacheBackend
+    data_version: TableDataVersion
+    ttl_seconds: float = 60.0
+
+    async def _get_or_load(
+        self,
+        db_session: AsyncSession,
+        query: str,
+        params: dict[str, Any],
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        version = await self.data_version.get(db_session=db_session)
+        params_digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, ensure_ascii=False, default=str).encode()
+        ).hexdigest()
+        key = f'{version}:{query}:{params_digest}'
+
+        value = await self.backend.get(key)
+        if value is None:
+            # Исключения (не найдено, неверный курсор) не кэшируются и пробрасываются как есть.
+            value = await load()
+            await self.backend.set(key, value, ttl_seconds=self.ttl_seconds)
+        return value
+
+    async def get_nearest_organizations(
+        self,
+        db_session: AsyncSession,
+        latitude: float,
+        longitude: float,
+        limit: int = DEFAULT_NEAREST_LIMIT,
+        activity_name: str | None = None,
+    ) -> list[OrganizationEntity]:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='nearest',
+            params={
+                'latitude': normalize_float(latitude),
+                'longitude': normalize_float(longitude),
+                'limit': limit,
+                'activity_name': activity_name,
+            },
+            load=lambda: self.service.get_nearest_organizations(
+                db_session=db_session,
+                latitude=latitude,
+                longitude=longitude,
+                limit=limit,
+                activity_name=activity_name,
+            ),
+        )
+
+    async def get_organization_list_by_area(
+        self,
+        db_session: AsyncSession,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='by_area',
+            params={
+                'min_latitude': normalize_float(min_latitude),
+                'max_latitude': normalize_float(max_latitude),
+                'min_longitude': normalize_float(min_longitude),
+                'max_longitude': normalize_float(max_longitude),
+                'limit': limit,
+                'cursor': cursor,
+            },
+            load=lambda: self.service.get_organization_list_by_area(
+                db_session=db_session,
+                min_latitude=min_latitude,
+                max_latitude=max_latitude,
+                min_longitude=min_longitude,
+                max_longitude=max_longitude,
+                limit=limit,
+                cursor=cursor,
+            ),
+        )
+
+    async def get_organization_clusters(
+        self,
+        db_session: AsyncSession,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+        zoom: int,
+    ) -> list[OrganizationCluster]:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='clusters',
+            params={
+                'min_latitude': normalize_float(min_latitude),
+                'max_latitude': normalize_float(max_latitude),
+                'min_longitude': normalize_float(min_longitude),
+                'max_longitude': normalize_float(max_longitude),
+                'zoom': zoom,
+            },
+            load=lambda: self.service.get_organization_clusters(
+                db_session=db_session,
+                min_latitude=min_latitude,
+                max_latitude=max_latitude,
+                min_longitude=min_longitude,
+                max_longitude=max_longitude,
+                zoom=zoom,
+            ),
+        )
+
+    async def get_organization_list_by_radius(
+        self,
+        db_session: AsyncSession,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        sort_by_distance: bool = False,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='by_radius',
+            params={
+                'latitude': normalize_float(latitude),
+                'longitude': normalize_float(longitude),
+                'radius_km': normalize_float(radius_km),
+                'sort_by_distance': sort_by_distance,
+                'limit': limit,
+                'cursor': cursor,
+            },
+            load=lambda: self.service.get_organization_list_by_radius(
+                db_session=db_session,
+                latitude=latitude,
+                longitude=longitude,
+                radius_km=radius_km,
+                sort_by_distance=sort_by_distance,
+                limit=limit,
+                cursor=cursor,
+            ),
+        )
+
+    async def get_organization_list_by_building(
+        self,
+        db_session: AsyncSession,
+        pk_building: uuid.UUID,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='by_building',
+            params={'pk_building': str(pk_building), 'limit': limit, 'cursor': cursor},
+            load=lambda: self.service.get_organization_list_by_building(
+                db_session=db_session, pk_building=pk_building, limit=limit, cursor=cursor
+            ),
+        )
+
+    async def get_organization_list_by_name(
+        self,
+        db_session: AsyncSession,
+        name: str,
+        ranked: bool = False,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='by_name',
+            params={'name': name, 'ranked': ranked, 'limit': limit, 'cursor': cursor},
+            load=lambda: self.service.get_organization_list_by_name(
+                db_session=db_session, name=name, ranked=ranked, limit=limit, cursor=cursor
+            ),
+        )
+
+    async def get_organization_suggestions(
+        self,
+        db_session: AsyncSession,
+        prefix: str,
+        limit: int = DEFAULT_SUGGESTION_LIMIT,
+    ) -> list[OrganizationSuggestion]:
+        # Индекс в памяти отвечает быстрее, чем проверка версии и поход в кэш; каждое нажатие клавиши
+        # давало бы ещё и отдельную запись в кэше.
+        return await self.service.get_organization_suggestions(db_session=db_session, prefix=prefix, limit=limit)
+
+    async def get_organization_list_by_single_activity(
+        self,
+        db_session: AsyncSession,
+        activity_name: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='by_single_activity',
+            params={'activity_name': activity_name, 'limit': limit, 'cursor': cursor},
+            load=lambda: self.service.get_organization_list_by_single_activity(
+                db_session=db_session, activity_name=activity_name, limit=limit, cursor=cursor
+            ),
+        )
+
+    async def get_organization_list_by_activity(
+        self,
+        db_session: AsyncSession,
+        activity_name: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='by_activity',
+            params={'activity_name': activity_name, 'limit': limit, 'cursor': cursor},
+            load=lambda: self.service.get_organization_list_by_activity(
+                db_session=db_session, activity_name=activity_name, limit=limit, cursor=cursor
+            ),
+        )
+
+    async def get_organization_by_id(self, pk: uuid.UUID, db_session: AsyncSession) -> OrganizationEntity:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='by_id',
+            params={'pk': str(pk)},
+            load=lambda: self.service.get_organization_by_id(pk=pk, db_session=db_session),
+        )
+
+    async def get_organizations_by_ids(
+        self,
+        db_session: AsyncSession,
+        pks: list[uuid.UUID],
+    ) -> OrganizationLookupResult:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='by_ids',
+            params={'pks': [str(pk) for pk in pks]},
+            load=lambda: self.service.get_organizations_by_ids(db_session=db_session, pks=pks),
+        )
+
+    async def get_organization_list(
+        self,
+        db_session: AsyncSession,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._get_or_load(
+            db_session=db_session,
+            query='list',
+            params={'limit': limit, 'cursor': cursor},
+            load=lambda: self.service.get_organization_list(db_session=db_session, limit=limit, cursor=cursor),
+        )
+
+    def stream_organization_list(
+        self,
+        db_session: AsyncSession,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[list[OrganizationEntity]]:
+        # Полная выгрузка не кэшируется: она не повторяется часто и не помещается в кэш целиком.
+        return self.service.stream_organization_list(db_session=db_session, chunk_size=chunk_size)
+
+    async def create_organizations(
+        self,
+        db_session: AsyncSession,
+        organizations: list[OrganizationDraft],
+    ) -> OrganizationBatchResult:
+        result = await self.service.create_organizations(db_session=db_session, organizations=organizations)
+        # Записи через это приложение видны сразу, не дожидаясь интервала проверки версий таблиц.
+        self.data_version.invalidate()
+        return result
+
+    async def upsert_organizations(
+        self,
+        db_session: AsyncSession,
+        organizations: list[OrganizationDraft],
+    ) -> OrganizationBatchResult:
+        result = await self.service.upsert_organizations(db_session=db_session, organizations=organizations)
+        self.data_version.invalidate()
+        return result
+
+    async def delete_organizations(
+        self,
+        db_session: AsyncSession,
+        pks: list[uuid.UUID],
+    ) -> OrganizationBatchResult:
+        result = await self.service.delete_organizations(db_session=db_session, pks=pks)
+        self.data_version.invalidate()
+        return result
@@ -0,0 +1,275 @@
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.organizations import Organization as OrganizationEntity, OrganizationBatchResult, OrganizationCluster, OrganizationDraft, OrganizationLookupResult, OrganizationSuggestion
+from infra.coalescing import SingleFlight
+from logic.pagination import DEFAULT_NEAREST_LIMIT, DEFAULT_PAGE_LIMIT, DEFAULT_STREAM_CHUNK_SIZE, DEFAULT_SUGGESTION_LIMIT, Page
+from logic.services.caching import normalize_float
+from logic.services.organizations import BaseOrganizationService
+
+
+ResultT = TypeVar('ResultT')
+
+
+@dataclass
+class CoalescingOrganizationService(BaseOrganizationService):
+
+    service: BaseOrganizationService
+    single_flight: SingleFlight
+
+    async def _coalesce(
+        self,
+        query: str,
+        params: tuple,
+        load: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        # Загрузка идёт в сессии ведущего запроса: ожидающие не берут из пула второе соединение.
+        return await self.single_flight.run(query, params, load)
+
+    async def get_nearest_organizations(
+        self,
+        db_session: AsyncSession,
+        latitude: float,
+        longitude: float,
+        limit: int = DEFAULT_NEAREST_LIMIT,
+        activity_name: str | None = None,
+    ) -> list[OrganizationEntity]:
+        return await self._coalesce(
+            query='nearest',
+            params=(normalize_float(latitude), normalize_float(longitude), limit, activity_name),
+            load=lambda: self.service.get_nearest_organizations(
+                db_session=db_session,
+                latitude=latitude,
+                longitude=longitude,
+                limit=limit,
+                activity_name=activity_name,
+            ),
+        )
+
+    async def get_organization_list_by_area(
+        self,
+        db_session: AsyncSession,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._coalesce(
+            query='by_area',
+            params=(
+                normalize_float(min_latitude),
+                normalize_float(max_latitude),
+                normalize_float(min_longitude),
+                normalize_float(max_longitude),
+                limit,
+                cursor,
+            ),
+            load=lambda: self.service.get_organization_list_by_area(
+                db_session=db_session,
+                min_latitude=min_latitude,
+                max_latitude=max_latitude,
+                min_longitude=min_longitude,
+                max_longitude=max_longitude,
+                limit=limit,
+                cursor=cursor,
+            ),
+        )
+
+    async def get_organization_clusters(
+        self,
+        db_session: AsyncSession,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+        zoom: int,
+    ) -> list[OrganizationCluster]:
+        return await self._coalesce(
+            query='clusters',
+            params=(
+                normalize_float(min_latitude),
+                normalize_float(max_latitude),
+                normalize_float(min_longitude),
+                normalize_float(max_longitude),
+                zoom,
+            ),
+            load=lambda: self.service.get_organization_clusters(
+                db_session=db_session,
+                min_latitude=min_latitude,
+                max_latitude=max_latitude,
+                min_longitude=min_longitude,
+                max_longitude=max_longitude,
+                zoom=zoom,
+            ),
+        )
+
+    async def get_organization_list_by_radius(
+        self,
+        db_session: AsyncSession,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        sort_by_distance: bool = False,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._coalesce(
+            query='by_radius',
+            params=(
+                normalize_float(latitude),
+                normalize_float(longitude),
+                normalize_float(radius_km),
+                sort_by_distance,
+                limit,
+                cursor,
+            ),
+            load=lambda: self.service.get_organization_list_by_radius(
+                db_session=db_session,
+                latitude=latitude,
+                longitude=longitude,
+                radius_km=radius_km,
+                sort_by_distance=sort_by_distance,
+                limit=limit,
+                cursor=cursor,
+            ),
+        )
+
+    async def get_organization_list_by_building(
+        self,
+        db_session: AsyncSession,
+        pk_building: uuid.UUID,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._coalesce(
+            query='by_building',
+            params=(pk_building, limit, cursor),
+            load=lambda: self.service.get_organization_list_by_building(
+                db_session=db_session, pk_building=pk_building, limit=limit, cursor=cursor
+            ),
+        )
+
+    async def get_organization_list_by_name(
+        self,
+        db_session: AsyncSession,
+        name: str,
+        ranked: bool = False,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._coalesce(
+            query='by_name',
+            params=(name, ranked, limit, cursor),
+            load=lambda: self.service.get_organization_list_by_name(
+                db_session=db_session, name=name, ranked=ranked, limit=limit, cursor=cursor
+            ),
+        )
+
+    async def get_organization_suggestions(
+        self,
+        db_session: AsyncSession,
+        prefix: str,
+        limit: int = DEFAULT_SUGGESTION_LIMIT,
+    ) -> list[OrganizationSuggestion]:
+        # Подсказки отвечают из индекса в памяти быстрее, чем стоит запуск общей задачи.
+        return await self.service.get_organization_suggestions(db_session=db_session, prefix=prefix, limit=limit)
+
+    async def get_organization_list_by_single_activity(
+        self,
+        db_session: AsyncSession,
+        activity_name: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._coalesce(
+            query='by_single_activity',
+            params=(activity_name, limit, cursor),
+            load=lambda: self.service.get_organization_list_by_single_activity(
+                db_session=db_session, activity_name=activity_name, limit=limit, cursor=cursor
+            ),
+        )
+
+    async def get_organization_list_by_activity(
+        self,
+        db_session: AsyncSession,
+        activity_name: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._coalesce(
+            query='by_activity',
+            params=(activity_name, limit, cursor),
+            load=lambda: self.service.get_organization_list_by_activity(
+                db_session=db_session, activity_name=activity_name, limit=limit, cursor=cursor
+            ),
+        )
+
+    async def get_organization_by_id(self, pk: uuid.UUID, db_session: AsyncSession) -> OrganizationEntity:
+        return await self._coalesce(
+            query='by_id',
+            params=(pk,),
+            load=lambda: self.service.get_organization_by_id(pk=pk, db_session=db_session),
+        )
+
+    async def get_organizations_by_ids(
+        self,
+        db_session: AsyncSession,
+        pks: list[uuid.UUID],
+    ) -> OrganizationLookupResult:
+        return await self._coalesce(
+            query='by_ids',
+            params=tuple(pks),
+            load=lambda: self.service.get_organizations_by_ids(db_session=db_session, pks=pks),
+        )
+
+    async def get_organization_list(
+        self,
+        db_session: AsyncSession,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._coalesce(
+            query='list',
+            params=(limit, cursor),
+            load=lambda: self.service.get_organization_list(db_session=db_session, limit=limit, cursor=cursor),
+        )
+
+    def stream_organization_list(
+        self,
+        db_session: AsyncSession,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[list[OrganizationEntity]]:
+        # Выгрузка отдаётся потоком по мере чтения, разделить её между клиентами нельзя.
+        return self.service.stream_organization_list(db_session=db_session, chunk_size=chunk_size)
+
+    async def create_organizations(
+        self,
+        db_session: AsyncSession,
+        organizations: list[OrganizationDraft],
+    ) -> OrganizationBatchResult:
+        result = await self.service.create_organizations(db_session=db_session, organizations=organizations)
+        self.single_flight.advance()
+        return result
+
+    async def upsert_organizations(
+        self,
+        db_session: AsyncSession,
+        organizations: list[OrganizationDraft],
+    ) -> OrganizationBatchResult:
+        result = await self.service.upsert_organizations(db_session=db_session, organizations=organizations)
+        self.single_flight.advance()
+        return result
+
+    async def delete_organizations(
+        self,
+        db_session: AsyncSession,
+        pks: list[uuid.UUID],
+    ) -> OrganizationBatchResult:
+        result = await self.service.delete_organizations(db_session=db_session, pks=pks)
+        self.single_flight.advance()
+        return result
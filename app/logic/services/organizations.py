@@ -1,26 +1,60 @@
 from abc import ABC, abstractmethod
-from typing import Iterable
+from dataclasses import dataclass, replace
+import datetime
+from typing import AsyncIterator
 import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from sqlalchemy import and_, func
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, aggregate_order_by, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import ColumnElement, Select
+from sqlalchemy import Float, Row, and_, any_, column, delete, exists, func, literal, or_, tuple_, update
 
-from geopy.distance import geodesic
+import numpy as np
 
-from domain.entities.organizations import Organization as OrganizationEntity
-from domain.entities.buildings import Buildings as BuildingsEntity
-from domain.models.organizations.models import Organization
-from domain.models.activities.models import Activity
+from domain.entities.organizations import Organization as OrganizationEntity, OrganizationBatchResult, OrganizationCluster, OrganizationDraft, OrganizationLookupResult, OrganizationSuggestion
+from domain.models.organizations.models import Organization, OrganizationReadModel
+from domain.models.activities.models import Activity, organization_activity
 from domain.models.buildings.models import Building
-from logic.exceptions.organizations import OrganizationNotFoundException, OrganizationWithActivityNotFoundException, OrganizationWithBuildingNotFoundException, OrganizationWithNameNotFoundException
+from infra.caches.buildings import BuildingCache
+from infra.indexes.activities import ActivityTaxonomyCache
+from infra.indexes.buildings import BuildingSpatialIndex
+from infra.indexes.organizations import OrganizationNameIndex
+from logic.exceptions.organizations import InvalidOrganizationBatchException, OrganizationNotFoundException, OrganizationWithActivityNotFoundException, OrganizationWithBuildingNotFoundException, OrganizationWithNameNotFoundException
+from logic.geo.bounds import EARTH_MEAN_RADIUS_KM, RADIUS_SLACK, bounding_boxes_for_radius
+from logic.geo.distance import geodesic_distances_km, geodesic_distances_within_radius, min_geodesic_distance_km_for_chord
+from logic.geo.grid import MAX_MERCATOR_LATITUDE
+from logic.mappers.organizations import OrganizationMapper
+from logic.pagination import DEFAULT_NEAREST_LIMIT, DEFAULT_PAGE_LIMIT, DEFAULT_STREAM_CHUNK_SIZE, DEFAULT_SUGGESTION_LIMIT, NEAREST_OVERFETCH_FACTOR, Page, decode_cursor, encode_cursor
+
+
+# Многострочная вставка передаёт 4 параметра на организацию, а протокол PostgreSQL допускает не более 32767.
+MAX_WRITE_BATCH_SIZE = 5000
+MAX_LOOKUP_BATCH_SIZE = 1000
+
+
+def _haversine_distance_km(latitude: float, longitude: float):
+    half_delta_latitude = func.radians(Building.latitude - latitude) / 2
+    half_delta_longitude = func.radians(Building.longitude - longitude) / 2
+    a = (
+        func.power(func.sin(half_delta_latitude), 2)
+        + func.cos(func.radians(latitude)) * func.cos(func.radians(Building.latitude))
+        * func.power(func.sin(half_delta_longitude), 2)
+    )
+    return 2 * EARTH_MEAN_RADIUS_KM * func.asin(func.sqrt(func.least(a, 1.0)))
 
 
 class BaseOrganizationService(ABC):
 
     @abstractmethod
-    async def get_organization_list_by_building(self, db_session: AsyncSession, pk_building: uuid.UUID) -> Iterable[OrganizationEntity]:
+    async def get_organization_list_by_building(
+        self,
+        db_session: AsyncSession,
+        pk_building: uuid.UUID,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
         ...
     
     @abstractmethod
@@ -28,19 +62,68 @@ class BaseOrganizationService(ABC):
         ...
     
     @abstractmethod
-    async def get_organization_list(self, db_session: AsyncSession) -> Iterable[OrganizationEntity]:
+    async def get_organizations_by_ids(
+        self,
+        db_session: AsyncSession,
+        pks: list[uuid.UUID],
+    ) -> OrganizationLookupResult:
+        ...
+
+    @abstractmethod
+    async def get_organization_list(
+        self,
+        db_session: AsyncSession,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
         ...
     
     @abstractmethod
-    async def get_organization_list_by_activity(self, db_session: AsyncSession, activity_name: str) -> Iterable[OrganizationEntity]:
+    def stream_organization_list(
+        self,
+        db_session: AsyncSession,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[list[OrganizationEntity]]:
         ...
     
     @abstractmethod
-    async def get_organization_list_by_single_activity(self, db_session: AsyncSession, activity_name: str) -> Iterable[OrganizationEntity]:
+    async def get_organization_list_by_activity(
+        self,
+        db_session: AsyncSession,
+        activity_name: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
         ...
     
     @abstractmethod
-    async def get_organization_list_by_name(self, db_session: AsyncSession, name: str) -> Iterable[OrganizationEntity]:
+    async def get_organization_list_by_single_activity(
+        self,
+        db_session: AsyncSession,
+        activity_name: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        ...
+    
+    @abstractmethod
+    async def get_organization_list_by_name(
+        self,
+        db_session: AsyncSession,
+        name: str,
+        ranked: bool = False,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        ...
+    
+    @abstractmethod
+    async def get_organization_suggestions(
+        self,
+        db_session: AsyncSession,
+        prefix: str,
+        limit: int = DEFAULT_SUGGESTION_LIMIT,
+    ) -> list[OrganizationSuggestion]:
         ...
     
     @abstractmethod
@@ -50,7 +133,21 @@ class BaseOrganizationService(ABC):
         latitude: float, 
         longitude: float, 
         radius_km: float, 
-    ) -> Iterable[OrganizationEntity]:
+        sort_by_distance: bool = False,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        ...
+
+    @abstractmethod
+    async def get_nearest_organizations(
+        self,
+        db_session: AsyncSession,
+        latitude: float,
+        longitude: float,
+        limit: int = DEFAULT_NEAREST_LIMIT,
+        activity_name: str | None = None,
+    ) -> list[OrganizationEntity]:
         ...
 
     @abstractmethod
@@ -60,13 +157,57 @@ class BaseOrganizationService(ABC):
         min_latitude: float, 
         max_latitude: float, 
         min_longitude: float, 
-        max_longitude: float
-    ) -> Iterable[OrganizationEntity]:
+        max_longitude: float,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        ...
+
+    @abstractmethod
+    async def get_organization_clusters(
+        self,
+        db_session: AsyncSession,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+        zoom: int,
+    ) -> list[OrganizationCluster]:
         ...
 
+    @abstractmethod
+    async def create_organizations(
+        self,
+        db_session: AsyncSession,
+        organizations: list[OrganizationDraft],
+    ) -> OrganizationBatchResult:
+        ...
 
+    @abstractmethod
+    async def upsert_organizations(
+        self,
+        db_session: AsyncSession,
+        organizations: list[OrganizationDraft],
+    ) -> OrganizationBatchResult:
+        ...
+
+    @abstractmethod
+    async def delete_organizations(
+        self,
+        db_session: AsyncSession,
+        pks: list[uuid.UUID],
+    ) -> OrganizationBatchResult:
+        ...
+
+
+@dataclass
 class ORMOrganizationService(BaseOrganizationService):
 
+    building_index: BuildingSpatialIndex | None = None
+    activity_taxonomy: ActivityTaxonomyCache | None = None
+    name_index: OrganizationNameIndex | None = None
+    read_model: bool = False
+    building_cache: BuildingCache | None = None
 
     async def get_organization_list_by_area(
         self,
@@ -74,55 +215,110 @@ class ORMOrganizationService(BaseOrganizationService):
         min_latitude: float, 
         max_latitude: float, 
         min_longitude: float, 
-        max_longitude: float
-    ) -> Iterable[OrganizationEntity]:
-        stmt = (
-            select(Building)
+        max_longitude: float,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        if self.building_index is not None:
+            await self.building_index.ensure_fresh(db_session=db_session)
+            building_ids = [
+                building.pk for building in self.building_index.get_buildings_in_area(
+                    min_latitude=min_latitude,
+                    max_latitude=max_latitude,
+                    min_longitude=min_longitude,
+                    max_longitude=max_longitude,
+                )
+            ]
+        else:
+            stmt = (
+                select(Building)
+                .filter(
+                    and_(
+                        Building.latitude >= min_latitude,
+                        Building.latitude <= max_latitude,
+                        Building.longitude >= min_longitude,
+                        Building.longitude <= max_longitude,    
+                    )
+                )
+            )
+            building_list_orm: list[Building] = (await db_session.execute(stmt)).scalars().all()
+            building_ids = [building.pk for building in building_list_orm]
+
+        # Один параметр-массив: IN со списком даёт параметр на здание и упирается в лимит 32767 параметров asyncpg.
+        organization_list_stmt = self._select_organization_rows().filter(
+            self._organization_source.building_pk == any_(literal(building_ids, ARRAY(UUID)))
+        )
+        return await self._get_organization_page(
+            db_session=db_session, stmt=organization_list_stmt, limit=limit, cursor=cursor
+        )
+
+    async def get_organization_clusters(
+        self,
+        db_session: AsyncSession,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+        zoom: int,
+    ) -> list[OrganizationCluster]:
+        # Здания группируются по ячейкам сетки в самой БД: клиент получает по строке на ячейку, а не каждую организацию.
+        # Организации считаются по индексу building_pk только для зданий в рамке, без соединения со всей таблицей.
+        # LATERAL, а не скалярный подзапрос: иначе PostgreSQL подставляет его в каждое выражение и считает заново.
+        organization_count_per_building = (
+            select(func.count().label('organization_count'))
+            .where(Organization.building_pk == Building.pk)
+            .lateral()
+        )
+        building_counts = (
+            select(Building.latitude, Building.longitude, organization_count_per_building.c.organization_count)
+            .join(organization_count_per_building, literal(True))
             .filter(
                 and_(
                     Building.latitude >= min_latitude,
                     Building.latitude <= max_latitude,
                     Building.longitude >= min_longitude,
-                    Building.longitude <= max_longitude,    
+                    Building.longitude <= max_longitude,
                 )
             )
+            .subquery()
         )
-        building_list_orm: list[Building] = (await db_session.execute(stmt)).scalars().all()
-        building_ids = [building.pk for building in building_list_orm]
-
-        organization_list_stmt = (
-            select(Organization)
-            .options(
-                selectinload(Organization.building),
-                selectinload(Organization.activities)
+        # Те же тайлы, что и в cluster_tile: строка — по координате Y проекции Web Mercator.
+        tile_count = literal(2 ** zoom)
+        latitude_radians = func.radians(
+            func.least(func.greatest(building_counts.c.latitude, -MAX_MERCATOR_LATITUDE), MAX_MERCATOR_LATITUDE)
+        )
+        mercator_y = func.ln(func.tan(func.pi() / 4 + latitude_radians / 2))
+        cell_row = func.least(
+            func.greatest(func.floor((1 - mercator_y / func.pi()) / 2 * tile_count), 0), tile_count - 1
+        ).label('cell_row')
+        cell_column = func.least(
+            func.greatest(func.floor((building_counts.c.longitude + 180.0) / 360.0 * tile_count), 0), tile_count - 1
+        ).label('cell_column')
+        organization_count = func.sum(building_counts.c.organization_count)
+        stmt = (
+            select(
+                cell_row,
+                cell_column,
+                organization_count.label('organization_count'),
+                func.count().label('building_count'),
+                # Центр ячейки взвешен по числу организаций в здании.
+                (func.sum(building_counts.c.latitude * building_counts.c.organization_count) / organization_count).label('latitude'),
+                (func.sum(building_counts.c.longitude * building_counts.c.organization_count) / organization_count).label('longitude'),
             )
-            .filter(Organization.building_pk.in_(building_ids))
-        )
-
-        organization_list_orm: list[Organization] = (await db_session.execute(organization_list_stmt)).scalars().all()
-
-        organization_list_entity = []
-        for organization in organization_list_orm:
-            
-            building = {
-                "pk": organization.building.pk,
-                "address": organization.building.address,
-                "latitude": organization.building.latitude,
-                "longitude": organization.building.longitude,
-            }
-            organization_list_entity.append(
-                OrganizationEntity(
-                    pk=organization.pk,
-                    title=organization.name,
-                    phone_number_list=organization.phone_numbers,
-                    building=building,
-                    activities=[activity.name for activity in organization.activities],
-                )
+            .filter(building_counts.c.organization_count > 0)
+            .group_by(cell_row, cell_column)
+            .order_by(cell_row, cell_column)
+        )
+        rows = (await db_session.execute(stmt)).all()
+        return [
+            OrganizationCluster(
+                latitude=row.latitude,
+                longitude=row.longitude,
+                organization_count=int(row.organization_count),
+                building_count=row.building_count,
             )
-        return organization_list_entity 
-
-
-
+            for row in rows
+        ]
 
     async def get_organization_list_by_radius(
         self, 
@@ -130,226 +326,663 @@ class ORMOrganizationService(BaseOrganizationService):
         latitude: float, 
         longitude: float, 
         radius_km: float, 
-    ) -> Iterable[OrganizationEntity]:
-        stmt = (select(Organization).options(selectinload(Organization.activities), selectinload(Organization.building)))
-        organization_list_orm = (await db_session.execute(stmt)).scalars().all()
-        center = (latitude, longitude)
-
-        organization_list_entity = []
-        for organization in organization_list_orm:
-            building_location = (organization.building.latitude, organization.building.longitude)
-            distance = geodesic(center, building_location).km
-            if distance <= radius_km:
-                building = {
-                "pk": organization.building.pk,
-                "address": organization.building.address,
-                "latitude": organization.building.latitude,
-                "longitude": organization.building.longitude,
-            }
-            organization_list_entity.append(
-                OrganizationEntity(
-                    pk=organization.pk,
-                    title=organization.name,
-                    phone_number_list=organization.phone_numbers,
-                    building=building,
-                    activities=[activity.name for activity in organization.activities],
+        sort_by_distance: bool = False,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        bounding_boxes = bounding_boxes_for_radius(latitude=latitude, longitude=longitude, radius_km=radius_km)
+
+        if self.building_index is not None:
+            await self.building_index.ensure_fresh(db_session=db_session)
+            building_candidates = [
+                building
+                for box in bounding_boxes
+                for building in self.building_index.get_buildings_in_area(
+                    min_latitude=box.min_latitude,
+                    max_latitude=box.max_latitude,
+                    min_longitude=box.min_longitude,
+                    max_longitude=box.max_longitude,
+                )
+            ]
+        else:
+            # Грубый отбор по рамке (индекс по latitude/longitude) и дешёвая проверка haversine в БД.
+            building_stmt = (
+                select(Building.pk, Building.latitude, Building.longitude)
+                .filter(
+                    or_(*[
+                        and_(
+                            Building.latitude.between(box.min_latitude, box.max_latitude),
+                            Building.longitude.between(box.min_longitude, box.max_longitude),
+                        )
+                        for box in bounding_boxes
+                    ]),
+                    _haversine_distance_km(latitude=latitude, longitude=longitude) <= radius_km * RADIUS_SLACK,
                 )
             )
-        return organization_list_entity
+            building_candidates = (await db_session.execute(building_stmt)).all()
+
+        # Точная геодезическая проверка только для оставшихся зданий, одним векторным вызовом.
+        within_radius, distances = geodesic_distances_within_radius(
+            latitude=latitude,
+            longitude=longitude,
+            latitudes=np.fromiter((building.latitude for building in building_candidates), dtype=float, count=len(building_candidates)),
+            longitudes=np.fromiter((building.longitude for building in building_candidates), dtype=float, count=len(building_candidates)),
+            radius_km=radius_km,
+        )
+        building_distances = {
+            building.pk: float(distance)
+            for building, is_within, distance in zip(building_candidates, within_radius, distances)
+            if is_within
+        }
+        if not building_distances:
+            return Page(items=[])
 
-    async def get_organization_list_by_building(self, db_session: AsyncSession, pk_building: uuid.UUID) -> Iterable[OrganizationEntity]:
-        stmt = (
-            select(Organization)
-            .options(
-                selectinload(Organization.activities), selectinload(Organization.building))
-            .filter(Organization.building_pk == pk_building)
+        if not sort_by_distance:
+            organization_list_stmt = self._select_organization_rows().filter(
+                self._organization_source.building_pk == any_(literal(list(building_distances), ARRAY(UUID)))
             )
-        
-        organization_list_orm: list[Organization] = (await db_session.execute(stmt)).scalars().all()
-        if not organization_list_orm:
-            raise OrganizationWithBuildingNotFoundException(pk_building=str(pk_building))
-        organization_list_entity = []
-        for organization in organization_list_orm:
-            building = {
-                "pk": organization.building.pk,
-                "address": organization.building.address,
-                "latitude": organization.building.latitude,
-                "longitude": organization.building.longitude,
-            }
-            organization_list_entity.append(
-                OrganizationEntity(
-                    pk=organization.pk,
-                    title=organization.name,
-                    phone_number_list=organization.phone_numbers,
-                    building=building,
-                    activities=[activity.name for activity in organization.activities],
-                )
+            page = await self._get_organization_page(
+                db_session=db_session, stmt=organization_list_stmt, limit=limit, cursor=cursor
             )
-        return organization_list_entity
-    
-    async def get_organization_list_by_name(self, db_session: AsyncSession, name: str) -> Iterable[OrganizationEntity]:
+            return replace(page, items=[
+                replace(entity, distance_km=building_distances[entity.building.pk]) for entity in page.items
+            ])
+
+        # Сортировка по удалённости в БД: расстояния до зданий передаются двумя массивами и соединяются через unnest,
+        # страница выбирается keyset-пагинацией по (distance_km, pk) с LIMIT, поэтому размер радиуса не влияет на память.
+        building_distance_rows = (
+            func.unnest(
+                literal(list(building_distances), ARRAY(UUID)),
+                literal(list(building_distances.values()), ARRAY(Float)),
+            )
+            .table_valued(column('building_pk', UUID), column('distance_km', Float))
+            .render_derived(name='building_distances')
+        )
         stmt = (
-            select(Organization)
-            .options(
-                selectinload(Organization.building),  # Предварительная загрузка связанных зданий
-                selectinload(Organization.activities),  # Предварительная загрузка активностей
+            self._select_organization_rows()
+            .add_columns(building_distance_rows.c.distance_km)
+            .join(building_distance_rows, self._organization_source.building_pk == building_distance_rows.c.building_pk)
+            .order_by(building_distance_rows.c.distance_km, self._organization_source.pk)
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            cursor_distance_km, cursor_pk = decode_cursor(cursor, float, uuid.UUID)
+            stmt = stmt.filter(
+                tuple_(building_distance_rows.c.distance_km, self._organization_source.pk) > (cursor_distance_km, cursor_pk)
             )
-            .where(func.lower(Organization.name).contains(func.lower(name)))
+
+        rows = (await db_session.execute(stmt)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            last_row = rows[limit - 1]
+            next_cursor = encode_cursor(last_row.distance_km, last_row.pk)
+
+        mapper = await self._get_mapper(db_session=db_session, rows=rows[:limit])
+        return Page(
+            items=mapper.to_entities(rows[:limit], distances=building_distances),
+            next_cursor=next_cursor,
         )
-    
-        # Выполнение запроса
-        result = await db_session.execute(stmt)
-        organization_list_orm = result.scalars().all()
 
-        if not organization_list_orm:
-            raise OrganizationWithNameNotFoundException(name=name)
-        organization_list_entity = []
-        for organization in organization_list_orm:
-            building = {
-                "pk": organization.building.pk,
-                "address": organization.building.address,
-                "latitude": organization.building.latitude,
-                "longitude": organization.building.longitude,
-            }
-            organization_list_entity.append(
-                OrganizationEntity(
-                    pk=organization.pk,
-                    title=organization.name,
-                    phone_number_list=organization.phone_numbers,
-                    building=building,
-                    activities=[activity.name for activity in organization.activities],
+    async def get_nearest_organizations(
+        self,
+        db_session: AsyncSession,
+        latitude: float,
+        longitude: float,
+        limit: int = DEFAULT_NEAREST_LIMIT,
+        activity_name: str | None = None,
+    ) -> list[OrganizationEntity]:
+        # KNN по GiST-индексу ix_building_earth_location: ORDER BY <-> LIMIT по одной таблице зданий всегда
+        # идёт по индексу, без вычисления расстояния до каждой строки. В соединении с организациями планировщик
+        # на небольших таблицах выбирал полный просмотр и сортировку, поэтому здания и организации читаются отдельно.
+        earth_distance = func.ll_to_earth(Building.latitude, Building.longitude).op('<->')(
+            func.ll_to_earth(latitude, longitude)
+        )
+        nearest_buildings_stmt = select(
+            Building.pk, Building.latitude, Building.longitude, earth_distance.label('earth_distance')
+        ).order_by(earth_distance)
+        stmt = self._select_organization_rows()
+        if activity_name is not None:
+            activity_ids = await self._get_activity_subtree_pks(db_session=db_session, activity_name=activity_name)
+            stmt = stmt.filter(self._filter_by_activity_pks(activity_ids))
+
+        # Индекс упорядочивает по хорде на сфере, а ответ — по расстоянию по эллипсоиду WGS-84, и при почти равных
+        # расстояниях порядки расходятся. Кандидатов добираем, пока нижняя оценка расстояния до недобранных
+        # организаций не превысит limit-е точное расстояние: тогда ни одна из них не может оказаться ближе.
+        fetch_limit = limit * NEAREST_OVERFETCH_FACTOR
+        while True:
+            buildings = (await db_session.execute(nearest_buildings_stmt.limit(fetch_limit))).all()
+            building_pks = literal([building.pk for building in buildings], ARRAY(UUID))
+            # Организации — в порядке хорды их зданий: array_position даёт место здания в выдаче индекса.
+            rows = (
+                await db_session.execute(
+                    stmt.filter(self._organization_source.building_pk == any_(building_pks))
+                    .order_by(
+                        func.array_position(building_pks, self._organization_source.building_pk),
+                        self._organization_source.pk,
+                    )
+                    .limit(fetch_limit)
                 )
+            ).all()
+            distances = geodesic_distances_km(
+                latitude=latitude,
+                longitude=longitude,
+                latitudes=np.fromiter((building.latitude for building in buildings), dtype=float, count=len(buildings)),
+                longitudes=np.fromiter((building.longitude for building in buildings), dtype=float, count=len(buildings)),
+            )
+            building_distances = {building.pk: float(distance) for building, distance in zip(buildings, distances)}
+            building_positions = {building.pk: position for position, building in enumerate(buildings)}
+
+            rows = sorted(rows, key=lambda row: (building_distances[row.building_pk], row.pk))
+            if len(rows) == fetch_limit:
+                # Недобранные организации здания последней строки — на том же расстоянии с большими pk,
+                # остальные — в зданиях не ближе по хорде, чем следующее за ним.
+                last_row = max(rows, key=lambda row: (building_positions[row.building_pk], row.pk))
+                last_key = (building_distances[last_row.building_pk], last_row.pk)
+                next_position = min(building_positions[last_row.building_pk] + 1, len(buildings) - 1)
+                next_chord = buildings[next_position].earth_distance
+            elif len(buildings) == fetch_limit:
+                last_key = None
+                next_chord = buildings[-1].earth_distance
+            else:
+                break
+            if len(rows) >= limit:
+                kth_key = (building_distances[rows[limit - 1].building_pk], rows[limit - 1].pk)
+                next_distance = min_geodesic_distance_km_for_chord(next_chord)
+                if (last_key is None or last_key >= kth_key) and next_distance > kth_key[0]:
+                    break
+            fetch_limit *= 2
+
+        rows = rows[:limit]
+        if not rows:
+            return []
+        mapper = await self._get_mapper(db_session=db_session, rows=rows)
+        return mapper.to_entities(rows, distances=building_distances)
+
+    async def get_organization_list_by_building(
+        self,
+        db_session: AsyncSession,
+        pk_building: uuid.UUID,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        stmt = self._select_organization_rows().filter(self._organization_source.building_pk == pk_building)
+
+        page = await self._get_organization_page(db_session=db_session, stmt=stmt, limit=limit, cursor=cursor)
+        if not page.items and cursor is None:
+            raise OrganizationWithBuildingNotFoundException(pk_building=str(pk_building))
+        return page
+    
+    async def get_organization_list_by_name(
+        self,
+        db_session: AsyncSession,
+        name: str,
+        ranked: bool = False,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        # lower(name) LIKE '%...%' обслуживается GIN-индексом ix_organization_name_trgm (pg_trgm).
+        # Регистр приводится в БД, чтобы правила lower() совпадали с выражением индекса.
+        escaped_name = name.replace('/', '//').replace('%', '/%').replace('_', '/_')
+        stmt = self._select_organization_rows().where(
+            func.lower(self._organization_source.name).like(func.concat('%', func.lower(escaped_name), '%'), escape='/')
+        )
+
+        if ranked:
+            page = await self._get_ranked_organization_page(
+                db_session=db_session,
+                stmt=stmt,
+                rank=func.similarity(func.lower(self._organization_source.name), func.lower(name)),
+                limit=limit,
+                cursor=cursor,
             )
-        return organization_list_entity
+        else:
+            page = await self._get_organization_page(db_session=db_session, stmt=stmt, limit=limit, cursor=cursor)
+        if not page.items and cursor is None:
+            raise OrganizationWithNameNotFoundException(name=name)
+        return page
 
-    async def get_organization_list_by_single_activity(self, db_session: AsyncSession, activity_name: str) -> Iterable[OrganizationEntity]:
-        activity_stmt = select(Activity).options(selectinload(Activity.children)).filter(Activity.name == activity_name)
-        activity = (await db_session.execute(activity_stmt)).scalar_one_or_none()
-        if not activity:
+    async def get_organization_suggestions(
+        self,
+        db_session: AsyncSession,
+        prefix: str,
+        limit: int = DEFAULT_SUGGESTION_LIMIT,
+    ) -> list[OrganizationSuggestion]:
+        if self.name_index is not None and self.name_index.is_ready:
+            return self.name_index.suggest(prefix=prefix, limit=limit)
+
+        escaped_prefix = prefix.replace('/', '//').replace('%', '/%').replace('_', '/_')
+        stmt = (
+            select(Organization.pk, Organization.name)
+            .filter(func.lower(Organization.name).like(func.concat(func.lower(escaped_prefix), '%'), escape='/'))
+            # Порядок и регистр — как в OrganizationNameIndex: lower() и побайтовое сравнение (COLLATE "C").
+            .order_by(func.lower(Organization.name).collate('C'), Organization.pk)
+            .limit(limit)
+        )
+        return [
+            OrganizationSuggestion(pk=row.pk, title=row.name)
+            for row in (await db_session.execute(stmt)).all()
+        ]
+
+    async def get_organization_list_by_single_activity(
+        self,
+        db_session: AsyncSession,
+        activity_name: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        if self.activity_taxonomy is not None:
+            await self.activity_taxonomy.ensure_fresh(db_session=db_session)
+            activity_ids = list(self.activity_taxonomy.get_activity_pks(activity_name))
+        else:
+            activity_stmt = select(Activity.pk).filter(Activity.name == activity_name)
+            activity_ids = (await db_session.execute(activity_stmt)).scalars().all()
+        if not activity_ids:
             raise OrganizationWithActivityNotFoundException(activity_name=activity_name)
 
-        organization_list_stmt: list[Organization] = (
-            select(Organization)
-            .options(selectinload(Organization.building), selectinload(Organization.activities))
-            .join(Organization.activities)
-            .filter(Activity.pk == activity.pk))
-        
-        organization_list_orm: list[Organization] = (await db_session.execute(organization_list_stmt)).scalars().all()
-        organization_list_entity = []
-
-        for organization in organization_list_orm:
-            building = {
-                "pk": organization.building.pk,
-                "address": organization.building.address,
-                "latitude": organization.building.latitude,
-                "longitude": organization.building.longitude,
-            }
-            organization_list_entity.append(
-                OrganizationEntity(
-                    pk=organization.pk,
-                    title=organization.name,
-                    phone_number_list=organization.phone_numbers,
-                    building=building,
-                    activities=[activity.name for activity in organization.activities],
-                )
-            )
-        return organization_list_entity
+        organization_list_stmt = self._select_organization_rows().filter(self._filter_by_activity_pks(activity_ids))
+        return await self._get_organization_page(
+            db_session=db_session, stmt=organization_list_stmt, limit=limit, cursor=cursor
+        )
 
     async def get_organization_by_id(self, pk: uuid.UUID, db_session: AsyncSession) -> OrganizationEntity:
 
-        stmt = select(Organization).options(
-            selectinload(Organization.building),
-            selectinload(Organization.activities)
-        ).filter(Organization.pk == pk)
+        stmt = self._select_organization_rows().filter(self._organization_source.pk == pk)
 
-        organization: Organization = (await db_session.execute(stmt)).scalar()
-        if not organization:
-            raise OrganizationNotFoundException(id=id)
+        row = (await db_session.execute(stmt)).first()
+        if not row:
+            raise OrganizationNotFoundException(id=str(pk))
 
-        building = {
-            "pk": organization.building.pk,
-            "address": organization.building.address,
-            "latitude": organization.building.latitude,
-            "longitude": organization.building.longitude,
-        }
+        return (await self._get_mapper(db_session=db_session, rows=[row])).to_entities([row])[0]
 
-        return OrganizationEntity(
-            pk=organization.pk,
-            title=organization.name,
-            phone_number_list=organization.phone_numbers,
-            building=building,
-            activities=[activity.name for activity in organization.activities],
+    async def get_organizations_by_ids(
+        self,
+        db_session: AsyncSession,
+        pks: list[uuid.UUID],
+    ) -> OrganizationLookupResult:
+        requested_pks = list(dict.fromkeys(pks))
+        if not requested_pks:
+            return OrganizationLookupResult(items=[], missing_pks=[])
+
+        # = ANY(массив) вместо IN (...): одно подготовленное выражение для любого размера пачки.
+        stmt = self._select_organization_rows().filter(
+            self._organization_source.pk == any_(literal(requested_pks, ARRAY(UUID)))
+        )
+        rows = (await db_session.execute(stmt)).all()
+        mapper = await self._get_mapper(db_session=db_session, rows=rows)
+        entities = {entity.pk: entity for entity in mapper.to_entities(rows)}
+
+        # Порядок ответа — порядок запроса (повторы pk схлопываются до первого вхождения).
+        return OrganizationLookupResult(
+            items=[entities[pk] for pk in requested_pks if pk in entities],
+            missing_pks=[pk for pk in requested_pks if pk not in entities],
         )
 
-    async def get_organization_list(self, db_session: AsyncSession) -> Iterable[OrganizationEntity]:
+    async def get_organization_list(
+        self,
+        db_session: AsyncSession,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
+        return await self._get_organization_page(
+            db_session=db_session, stmt=self._select_organization_rows(), limit=limit, cursor=cursor
+        )
 
-        stmt = select(Organization).options(
-            selectinload(Organization.building),
-            selectinload(Organization.activities)
+    async def stream_organization_list(
+        self,
+        db_session: AsyncSession,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[list[OrganizationEntity]]:
+        # Серверный курсор: в памяти одновременно находится только одна пачка организаций.
+        stmt = (
+            self._select_organization_rows()
+            .order_by(self._organization_source.created_at, self._organization_source.pk)
+            .execution_options(yield_per=chunk_size)
         )
+        result = await db_session.stream(stmt)
+        async for row_chunk in result.partitions():
+            mapper = await self._get_mapper(db_session=db_session, rows=row_chunk)
+            yield mapper.to_entities(row_chunk)
+
+    async def get_organization_list_by_activity(
+        self,
+        db_session: AsyncSession,
+        activity_name: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[OrganizationEntity]:
         
-        organization_list_orm: list[Organization] = (await db_session.execute(stmt)).scalars().all()
-        organization_list_entity = []
-
-        for organization in organization_list_orm:
-            building = {
-                "pk": organization.building.pk,
-                "address": organization.building.address,
-                "latitude": organization.building.latitude,
-                "longitude": organization.building.longitude,
-            }
-            organization_list_entity.append(
-                OrganizationEntity(
-                    pk=organization.pk,
-                    title=organization.name,
-                    phone_number_list=organization.phone_numbers,
-                    building=building,
-                    activities=[activity.name for activity in organization.activities],
+        activity_ids = await self._get_activity_subtree_pks(db_session=db_session, activity_name=activity_name)
+
+        organization_list_stmt = self._select_organization_rows().filter(self._filter_by_activity_pks(activity_ids))
+        return await self._get_organization_page(
+            db_session=db_session, stmt=organization_list_stmt, limit=limit, cursor=cursor
+        )
+
+    async def create_organizations(
+        self,
+        db_session: AsyncSession,
+        organizations: list[OrganizationDraft],
+    ) -> OrganizationBatchResult:
+        drafts = self._deduplicate_drafts(organizations)
+        # Одна многострочная вставка; уже существующие pk пропускаются.
+        stmt = (
+            pg_insert(Organization)
+            .values([self._to_row(draft) for draft in drafts])
+            .on_conflict_do_nothing(index_elements=[Organization.pk])
+            .returning(Organization.pk)
+        )
+        try:
+            created_pks = set((await db_session.execute(stmt)).scalars().all())
+            await self._sync_activity_links(
+                db_session=db_session,
+                activity_pks_by_organization={
+                    draft.pk: draft.activity_pks for draft in drafts if draft.pk in created_pks
+                },
+            )
+            await db_session.commit()
+        except IntegrityError as e:
+            await db_session.rollback()
+            raise InvalidOrganizationBatchException(detail=self._integrity_error_detail(e))
+
+        if self.name_index is not None:
+            self.name_index.add_many([(draft.pk, draft.title) for draft in drafts if draft.pk in created_pks])
+        return OrganizationBatchResult(
+            affected_pks=[draft.pk for draft in drafts if draft.pk in created_pks],
+            skipped_pks=[draft.pk for draft in drafts if draft.pk not in created_pks],
+        )
+
+    async def upsert_organizations(
+        self,
+        db_session: AsyncSession,
+        organizations: list[OrganizationDraft],
+    ) -> OrganizationBatchResult:
+        drafts = self._deduplicate_drafts(organizations)
+        stmt = pg_insert(Organization).values([self._to_row(draft) for draft in drafts])
+        # Совпадающие строки не переписываются: updated_at и версия таблицы двигаются только при изменениях.
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Organization.pk],
+            set_={
+                'name': stmt.excluded.name,
+                'phone_numbers': stmt.excluded.phone_numbers,
+                'building_pk': stmt.excluded.building_pk,
+                'updated_at': func.now(),
+            },
+            where=or_(
+                Organization.name.is_distinct_from(stmt.excluded.name),
+                Organization.phone_numbers.is_distinct_from(stmt.excluded.phone_numbers),
+                Organization.building_pk.is_distinct_from(stmt.excluded.building_pk),
+            ),
+        ).returning(Organization.pk)
+        try:
+            written_pks = set((await db_session.execute(stmt)).scalars().all())
+            relinked_pks = await self._sync_activity_links(
+                db_session=db_session,
+                activity_pks_by_organization={draft.pk: draft.activity_pks for draft in drafts},
+            )
+            if relinked_pks - written_pks:
+                # Связи не имеют своего updated_at — отмечаем такие организации изменёнными.
+                await db_session.execute(
+                    update(Organization)
+                    .where(Organization.pk.in_(relinked_pks - written_pks))
+                    .values(updated_at=func.now())
+                    .execution_options(synchronize_session=False)
                 )
+            await db_session.commit()
+        except IntegrityError as e:
+            await db_session.rollback()
+            raise InvalidOrganizationBatchException(detail=self._integrity_error_detail(e))
+
+        affected_pks = written_pks | relinked_pks
+        if self.name_index is not None:
+            self.name_index.add_many([(draft.pk, draft.title) for draft in drafts if draft.pk in written_pks])
+        return OrganizationBatchResult(
+            affected_pks=[draft.pk for draft in drafts if draft.pk in affected_pks],
+            skipped_pks=[draft.pk for draft in drafts if draft.pk not in affected_pks],
+        )
+
+    async def delete_organizations(
+        self,
+        db_session: AsyncSession,
+        pks: list[uuid.UUID],
+    ) -> OrganizationBatchResult:
+        pks = list(dict.fromkeys(pks))
+        await db_session.execute(
+            delete(organization_activity).where(organization_activity.c.organization_pk.in_(pks))
+        )
+        deleted_pks = set((
+            await db_session.execute(
+                delete(Organization)
+                .where(Organization.pk.in_(pks))
+                .returning(Organization.pk)
+                .execution_options(synchronize_session=False)
             )
-        return organization_list_entity
+        ).scalars().all())
+        await db_session.commit()
+
+        if self.name_index is not None:
+            self.name_index.discard_many(list(deleted_pks))
+        return OrganizationBatchResult(
+            affected_pks=[pk for pk in pks if pk in deleted_pks],
+            skipped_pks=[pk for pk in pks if pk not in deleted_pks],
+        )
 
-    async def get_organization_list_by_activity(self, db_session: AsyncSession, activity_name: str) -> Iterable[OrganizationEntity]:
-        
-        root_activity_stmt = select(Activity).options(selectinload(Activity.children)).filter(Activity.name == activity_name)
-        root_activity = (await db_session.execute(root_activity_stmt)).scalar_one_or_none()
-        if not root_activity:
+    async def _get_activity_subtree_pks(self, db_session: AsyncSession, activity_name: str) -> list[uuid.UUID]:
+        if self.activity_taxonomy is not None:
+            await self.activity_taxonomy.ensure_fresh(db_session=db_session)
+            activity_ids = list(self.activity_taxonomy.get_descendant_pks(activity_name))
+        else:
+            # Всё поддерево деятельностей одним рекурсивным запросом, независимо от глубины.
+            activity_subtree = (
+                select(Activity.pk)
+                .filter(Activity.name == activity_name)
+                .cte('activity_subtree', recursive=True)
+            )
+            activity_subtree = activity_subtree.union(
+                select(Activity.pk).join(activity_subtree, Activity.parent_pk == activity_subtree.c.pk)
+            )
+            activity_ids = (await db_session.execute(select(activity_subtree.c.pk))).scalars().all()
+        if not activity_ids:
             raise OrganizationWithActivityNotFoundException(activity_name=activity_name)
+        return activity_ids
 
-        def get_all_sub_activities(activity: Activity):
-            activities = [activity]
-            for child in activity.children:
-                activities.extend(get_all_sub_activities(child))
-            return activities
-        
-        all_activities = get_all_sub_activities(activity=root_activity)
+    async def _sync_activity_links(
+        self,
+        db_session: AsyncSession,
+        activity_pks_by_organization: dict[uuid.UUID, list[uuid.UUID]],
+    ) -> set[uuid.UUID]:
+        if not activity_pks_by_organization:
+            return set()
+
+        # Желаемые связи передаются двумя массивами и разворачиваются unnest — два параметра на весь пакет.
+        links = [
+            (organization_pk, activity_pk)
+            for organization_pk, activity_pks in activity_pks_by_organization.items()
+            for activity_pk in dict.fromkeys(activity_pks)
+        ]
+        desired_links = func.unnest(
+            literal([organization_pk for organization_pk, _ in links], ARRAY(UUID)),
+            literal([activity_pk for _, activity_pk in links], ARRAY(UUID)),
+        ).table_valued('organization_pk', 'activity_pk').render_derived(name='desired_link')
+
+        removed_pks = (
+            await db_session.execute(
+                delete(organization_activity)
+                .where(
+                    organization_activity.c.organization_pk.in_(list(activity_pks_by_organization)),
+                    ~exists().where(
+                        desired_links.c.organization_pk == organization_activity.c.organization_pk,
+                        desired_links.c.activity_pk == organization_activity.c.activity_pk,
+                    ),
+                )
+                .returning(organization_activity.c.organization_pk)
+            )
+        ).scalars().all()
+        added_pks = (
+            await db_session.execute(
+                pg_insert(organization_activity)
+                .from_select(
+                    ['organization_pk', 'activity_pk'],
+                    select(desired_links.c.organization_pk, desired_links.c.activity_pk),
+                )
+                .on_conflict_do_nothing(index_elements=['organization_pk', 'activity_pk'])
+                .returning(organization_activity.c.organization_pk)
+            )
+        ).scalars().all()
+        return set(removed_pks) | set(added_pks)
+
+    @staticmethod
+    def _integrity_error_detail(error: IntegrityError) -> str:
+        # asyncpg сообщает нарушенный ключ в detail, например: Key (building_pk)=(...) is not present in table "building".
+        return getattr(error.orig.__cause__, 'detail', None) or str(error.orig)
+
+    @staticmethod
+    def _deduplicate_drafts(organizations: list[OrganizationDraft]) -> list[OrganizationDraft]:
+        # Повтор pk в одном пакете: побеждает последняя версия, как при последовательной записи.
+        drafts = [
+            draft if draft.pk is not None else replace(draft, pk=uuid.uuid4())
+            for draft in organizations
+        ]
+        return list({draft.pk: draft for draft in drafts}.values())
+
+    @staticmethod
+    def _to_row(draft: OrganizationDraft) -> dict:
+        return {
+            'pk': draft.pk,
+            'name': draft.title,
+            'phone_numbers': draft.phone_number_list,
+            'building_pk': draft.building_pk,
+        }
 
-        activity_ids = [activity.pk for activity in all_activities]
+    async def _get_organization_page(
+        self,
+        db_session: AsyncSession,
+        stmt: Select,
+        limit: int,
+        cursor: str | None,
+    ) -> Page[OrganizationEntity]:
+        # Keyset-пагинация по (created_at, pk): created_at проиндексирован, pk разрешает совпадения.
+        stmt = (
+            stmt
+            .order_by(self._organization_source.created_at, self._organization_source.pk)
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            cursor_created_at, cursor_pk = decode_cursor(cursor, datetime.datetime, uuid.UUID)
+            stmt = stmt.filter(tuple_(self._organization_source.created_at, self._organization_source.pk) > (cursor_created_at, cursor_pk))
 
-        organization_list_stmt: list[Organization] = (
-            select(Organization)
-            .options(selectinload(Organization.building), selectinload(Organization.activities))
-            .join(Organization.activities)
-            .filter(Activity.pk.in_(activity_ids)))
-        
-        organization_list_orm: list[Organization] = (await db_session.execute(organization_list_stmt)).unique().scalars().all()
-        organization_list_entity = []
-
-        for organization in organization_list_orm:
-            building = {
-                "pk": organization.building.pk,
-                "address": organization.building.address,
-                "latitude": organization.building.latitude,
-                "longitude": organization.building.longitude,
-            }
-            organization_list_entity.append(
-                OrganizationEntity(
-                    pk=organization.pk,
-                    title=organization.name,
-                    phone_number_list=organization.phone_numbers,
-                    building=building,
-                    activities=[activity.name for activity in organization.activities],
-                )
+        rows = (await db_session.execute(stmt)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            last_row = rows[limit - 1]
+            next_cursor = encode_cursor(last_row.created_at, last_row.pk)
+
+        mapper = await self._get_mapper(db_session=db_session, rows=rows[:limit])
+        return Page(
+            items=mapper.to_entities(rows[:limit]),
+            next_cursor=next_cursor,
+        )
+
+    async def _get_ranked_organization_page(
+        self,
+        db_session: AsyncSession,
+        stmt: Select,
+        rank: ColumnElement[float],
+        limit: int,
+        cursor: str | None,
+    ) -> Page[OrganizationEntity]:
+        # Keyset-пагинация по (rank DESC, pk).
+        stmt = (
+            stmt
+            .add_columns(rank.label('rank'))
+            .order_by(rank.desc(), self._organization_source.pk)
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            cursor_rank, cursor_pk = decode_cursor(cursor, float, uuid.UUID)
+            stmt = stmt.filter(or_(rank < cursor_rank, and_(rank == cursor_rank, self._organization_source.pk > cursor_pk)))
+
+        rows = (await db_session.execute(stmt)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            last_row = rows[limit - 1]
+            next_cursor = encode_cursor(last_row.rank, last_row.pk)
+
+        mapper = await self._get_mapper(db_session=db_session, rows=rows[:limit])
+        return Page(
+            items=mapper.to_entities(rows[:limit]),
+            next_cursor=next_cursor,
+        )
+
+    @property
+    def _uses_building_cache(self) -> bool:
+        # В read model столбцы здания уже лежат в строке организации, кэш зданий там не нужен.
+        return self.building_cache is not None and not self.read_model
+
+    async def _get_mapper(self, db_session: AsyncSession, rows: list[Row]) -> OrganizationMapper:
+        if not self._uses_building_cache:
+            return OrganizationMapper()
+        buildings = await self.building_cache.get_many(
+            db_session=db_session, versions={row.building_pk: row.building_updated_at for row in rows}
+        )
+        return OrganizationMapper(buildings=buildings)
+
+    @property
+    def _organization_source(self) -> type[Organization] | type[OrganizationReadModel]:
+        # У read model те же имена столбцов организации, поэтому фильтры и сортировки общие.
+        return OrganizationReadModel if self.read_model else Organization
+
+    def _filter_by_activity_pks(self, activity_ids: list[uuid.UUID]) -> ColumnElement[bool]:
+        if self.read_model:
+            # Пересечение массивов обслуживается GIN-индексом по activity_pks.
+            return OrganizationReadModel.activity_pks.overlap(activity_ids)
+        return Organization.pk.in_(
+            select(organization_activity.c.organization_pk)
+            .filter(organization_activity.c.activity_pk.in_(activity_ids))
+        )
+
+    def _select_organization_rows(self) -> Select:
+        if self.read_model:
+            return select(
+                OrganizationReadModel.pk,
+                OrganizationReadModel.name,
+                OrganizationReadModel.phone_numbers,
+                OrganizationReadModel.created_at,
+                OrganizationReadModel.building_pk,
+                OrganizationReadModel.building_address,
+                OrganizationReadModel.building_latitude,
+                OrganizationReadModel.building_longitude,
+                OrganizationReadModel.activity_names,
             )
-        return organization_list_entity
-    
+
+        # Организация, её здание и названия деятельностей одной плоской строкой:
+        # один запрос вместо selectinload по зданиям и деятельностям, без ORM-объектов в identity map.
+        activity_names = (
+            select(func.array_agg(aggregate_order_by(Activity.name, Activity.name)))
+            .join(organization_activity, organization_activity.c.activity_pk == Activity.pk)
+            .where(organization_activity.c.organization_pk == Organization.pk)
+            .scalar_subquery()
+        )
+        if self._uses_building_cache:
+            # Из здания берётся только updated_at: сами здания приходят из кэша и сверяются по нему.
+            building_columns = (Building.updated_at.label('building_updated_at'),)
+        else:
+            building_columns = (
+                Building.address.label('building_address'),
+                Building.latitude.label('building_latitude'),
+                Building.longitude.label('building_longitude'),
+            )
+        return (
+            select(
+                Organization.pk,
+                Organization.name,
+                Organization.phone_numbers,
+                Organization.created_at,
+                Building.pk.label('building_pk'),
+                *building_columns,
+                activity_names.label('activity_names'),
+            )
+            .join(Building, Organization.building_pk == Building.pk)
+        )
@@ -0,0 +1,179 @@
+"""Генератор синтетических данных для бенчмарков: N зданий, M организаций и дерево деятельностей глубины K.
+
+Данные детерминированы по --seed и загружаются через COPY. По умолчанию генератор отказывается
+писать в непустую базу; --truncate сначала очищает организации, здания и деятельности.
+Запускать только на отдельной локальной базе.
+
+Запуск из корня репозитория:
+
+    PYTHONPATH=app python benchmarks/datagen.py --buildings 10000 --organizations 100000 --activity-depth 3 --truncate
+"""
+import argparse
+import asyncio
+from dataclasses import dataclass
+import datetime
+import random
+import sys
+import time
+import uuid
+
+import asyncpg
+
+from domain.db_session import engine
+
+
+NAME_PREFIXES = ('ООО', 'АО', 'ИП', 'ПАО', 'ЗАО')
+NAME_WORDS = (
+    'Рога', 'Копыта', 'Молоко', 'Мясо', 'Авто', 'Грузы', 'Запчасти', 'Сервис', 'Торг', 'Строй',
+    'Снаб', 'Маркет', 'Логистик', 'Фарм', 'Текстиль', 'Мебель', 'Электро', 'Пекарня', 'Ферма', 'Техно',
+)
+STREETS = ('Ленина', 'Гагарина', 'Мира', 'Советская', 'Садовая', 'Лесная', 'Школьная', 'Полевая', 'Новая', 'Речная')
+
+BATCH_SIZE = 10_000
+
+
+@dataclass
+class SyntheticDataset:
+
+    buildings: int
+    organizations: int
+    activity_depth: int
+    activity_fanout: int
+    activities_per_organization: int
+    center_latitude: float
+    center_longitude: float
+    spread_degrees: float
+    seed: int
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+        self._created_at = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self._rng.getrandbits(128), version=4)
+
+    def activities(self) -> list[tuple[uuid.UUID, str, uuid.UUID | None]]:
+        # Полное дерево: activity_fanout корней, у каждого узла activity_fanout детей, activity_depth уровней.
+        activities = []
+        level = [(None, '')]
+        for _ in range(self.activity_depth):
+            next_level = []
+            for parent_pk, parent_path in level:
+                for number in range(1, self.activity_fanout + 1):
+                    path = f'{parent_path}.{number}' if parent_path else str(number)
+                    pk = self._uuid()
+                    activities.append((pk, f'Деятельность {path}', parent_pk))
+                    next_level.append((pk, path))
+            level = next_level
+        return activities
+
+    def building_rows(self) -> list[tuple]:
+        return [
+            (
+                self._uuid(),
+                f'ул. {self._rng.choice(STREETS)}, {number}',
+                self.center_latitude + self._rng.uniform(-self.spread_degrees, self.spread_degrees),
+                self.center_longitude + self._rng.uniform(-self.spread_degrees, self.spread_degrees),
+            )
+            for number in range(1, self.buildings + 1)
+        ]
+
+    def organization_batches(self, building_pks: list[uuid.UUID], activity_pks: list[uuid.UUID]):
+        # Организации и их связи пачками, чтобы 10^6 строк не держать в памяти целиком.
+        organizations, links = [], []
+        for number in range(1, self.organizations + 1):
+            pk = self._uuid()
+            # created_at различаются, как у реальных данных: keyset-пагинация идёт по (created_at, pk).
+            created_at = self._created_at + datetime.timedelta(seconds=number)
+            organizations.append((
+                pk,
+                f'{self._rng.choice(NAME_PREFIXES)} {self._rng.choice(NAME_WORDS)} {number}',
+                [f'+7-9{self._rng.randrange(10**9):09d}' for _ in range(self._rng.randint(1, 3))],
+                self._rng.choice(building_pks),
+                created_at,
+                created_at,
+            ))
+            for activity_pk in self._rng.sample(activity_pks, min(self.activities_per_organization, len(activity_pks))):
+                links.append((pk, activity_pk))
+            if len(organizations) >= BATCH_SIZE:
+                yield organizations, links
+                organizations, links = [], []
+        if organizations:
+            yield organizations, links
+
+
+async def populate(connection: asyncpg.Connection, dataset: SyntheticDataset, truncate: bool) -> None:
+    if truncate:
+        await connection.execute('TRUNCATE organization_read_model, organization_activity, organization, building, activity')
+    elif await connection.fetchval('SELECT EXISTS (SELECT 1 FROM organization)'):
+        sys.exit('В базе уже есть организации; для перезаписи запустите с --truncate')
+
+    started_at = time.perf_counter()
+    activities = dataset.activities()
+    await connection.copy_records_to_table('activity', records=activities, columns=('pk', 'name', 'parent_pk'))
+
+    buildings = dataset.building_rows()
+    await connection.copy_records_to_table(
+        'building', records=buildings, columns=('pk', 'address', 'latitude', 'longitude')
+    )
+
+    building_pks = [building[0] for building in buildings]
+    activity_pks = [activity[0] for activity in activities]
+    written = 0
+    for organizations, links in dataset.organization_batches(building_pks, activity_pks):
+        async with connection.transaction():
+            await connection.copy_records_to_table(
+                'organization',
+                records=organizations,
+                columns=('pk', 'name', 'phone_numbers', 'building_pk', 'created_at', 'updated_at'),
+            )
+            await connection.copy_records_to_table(
+                'organization_activity', records=links, columns=('organization_pk', 'activity_pk')
+            )
+        written += len(organizations)
+        print(f'{written:>12,} организаций  {time.perf_counter() - started_at:8.1f} с', file=sys.stderr)
+
+    await connection.execute('ANALYZE activity, building, organization, organization_activity')
+    print(
+        f'Создано: {len(activities)} деятельностей, {len(buildings)} зданий, {written} организаций '
+        f'за {time.perf_counter() - started_at:.1f} с',
+        file=sys.stderr,
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    dataset = SyntheticDataset(
+        buildings=args.buildings,
+        organizations=args.organizations,
+        activity_depth=args.activity_depth,
+        activity_fanout=args.activity_fanout,
+        activities_per_organization=args.activities_per_organization,
+        center_latitude=args.center_latitude,
+        center_longitude=args.center_longitude,
+        spread_degrees=args.spread_degrees,
+        seed=args.seed,
+    )
+    connection = await asyncpg.connect(engine.url.set(drivername='postgresql').render_as_string(hide_password=False))
+    try:
+        await populate(connection, dataset, truncate=args.truncate)
+    finally:
+        await connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--buildings', type=int, default=1_000)
+    parser.add_argument('--organizations', type=int, default=10_000)
+    parser.add_argument('--activity-depth', type=int, default=3)
+    parser.add_argument('--activity-fanout', type=int, default=4)
+    parser.add_argument('--activities-per-organization', type=int, default=2)
+    parser.add_argument('--center-latitude', type=float, default=55.75)
+    parser.add_argument('--center-longitude', type=float, default=37.62)
+    parser.add_argument('--spread-degrees', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--truncate', action='store_true', help='Очистить организации, здания и деятельности перед загрузкой')
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
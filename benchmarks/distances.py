@@ -0,0 +1,62 @@
+"""Сравнение поштучного geopy.geodesic с векторными расстояниями из logic.geo.distance.
+
+Запуск из корня репозитория:
+
+    PYTHONPATH=app python benchmarks/distances.py --points 10000
+"""
+import argparse
+import time
+
+import numpy as np
+from geopy.distance import geodesic
+
+from logic.geo.distance import geodesic_distances_within_radius, haversine_distances_km, vincenty_distances_km
+
+
+def measure(label: str, func, repeat: int, points: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started_at)
+    print(f'{label:<32} {best * 1000:10.2f} ms  {points / best:14,.0f} points/s')
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--points', type=int, default=10_000)
+    parser.add_argument('--radius-km', type=float, default=50.0)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(seed=42)
+    latitude, longitude = 55.7558, 37.6173
+    latitudes = latitude + rng.uniform(-1.0, 1.0, args.points)
+    longitudes = longitude + rng.uniform(-1.0, 1.0, args.points)
+    center = (latitude, longitude)
+
+    def per_row_geopy():
+        return [
+            geodesic(center, (building_latitude, building_longitude)).km <= args.radius_km
+            for building_latitude, building_longitude in zip(latitudes, longitudes)
+        ]
+
+    baseline = measure('geopy.geodesic per row', per_row_geopy, args.repeat, args.points)
+    for label, func in (
+        ('numpy haversine', lambda: haversine_distances_km(latitude, longitude, latitudes, longitudes)),
+        ('numpy vincenty', lambda: vincenty_distances_km(latitude, longitude, latitudes, longitudes)),
+        (
+            'numpy vincenty + radius refine',
+            lambda: geodesic_distances_within_radius(latitude, longitude, latitudes, longitudes, args.radius_km),
+        ),
+    ):
+        elapsed = measure(label, func, args.repeat, args.points)
+        print(f'{"":<32} x{baseline / elapsed:.1f} faster than geopy')
+
+    within_radius, _ = geodesic_distances_within_radius(latitude, longitude, latitudes, longitudes, args.radius_km)
+    assert within_radius.tolist() == per_row_geopy(), 'результаты расходятся с geopy.geodesic'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Память и время построения сущностей организаций на выборке из 100k строк.
+
+Сравниваются прежние сущности (обычный dataclass и словарь здания на каждую строку)
+и slots-сущности с общим объектом Buildings из OrganizationMapper.
+
+Запуск из корня репозитория:
+
+    PYTHONPATH=app python benchmarks/entities.py --rows 100000
+"""
+import argparse
+from collections import namedtuple
+from dataclasses import dataclass
+import gc
+import random
+import time
+import tracemalloc
+from typing import Any, Callable
+import uuid
+
+from logic.mappers.organizations import OrganizationMapper
+
+
+OrganizationRow = namedtuple(
+    'OrganizationRow',
+    'pk name phone_numbers created_at building_pk building_address building_latitude building_longitude activity_names',
+)
+
+
+@dataclass
+class LegacyOrganization:
+
+    pk: uuid.UUID
+    title: str
+    phone_number_list: list[str]
+    building: dict[str, Any]
+    activities: list[str]
+    distance_km: float | None = None
+
+
+def legacy_to_entities(rows: list[OrganizationRow]) -> list[LegacyOrganization]:
+    return [
+        LegacyOrganization(
+            pk=row.pk,
+            title=row.name,
+            phone_number_list=row.phone_numbers,
+            building={
+                'pk': row.building_pk,
+                'address': row.building_address,
+                'latitude': row.building_latitude,
+                'longitude': row.building_longitude,
+            },
+            activities=row.activity_names or [],
+        )
+        for row in rows
+    ]
+
+
+def mapper_to_entities(rows: list[OrganizationRow]) -> list:
+    return OrganizationMapper().to_entities(rows)
+
+
+def build_rows(rows: int, organizations_per_building: int) -> list[OrganizationRow]:
+    rng = random.Random(42)
+    activities = ['Еда', 'Молочная продукция', 'Мясная продукция', 'Автомобили', 'Грузовые', 'Легковые']
+    buildings = [
+        (uuid.UUID(int=rng.getrandbits(128)), f'Ул. Ленина {number}', 55.0 + rng.random(), 37.0 + rng.random())
+        for number in range(max(rows // organizations_per_building, 1))
+    ]
+    return [
+        OrganizationRow(
+            uuid.UUID(int=rng.getrandbits(128)),
+            f'Организация {number}',
+            [f'+7-900-{number:07d}'],
+            None,
+            *rng.choice(buildings),
+            rng.sample(activities, 2),
+        )
+        for number in range(rows)
+    ]
+
+
+def measure(label: str, func: Callable[[list[OrganizationRow]], list], rows: list[OrganizationRow], repeat: int) -> None:
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        started_at = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - started_at)
+
+    # Учитывается только то, что добавляет маппинг: значения полей уже лежат в строках.
+    gc.collect()
+    tracemalloc.start()
+    entities = func(rows)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+
+    print(
+        f'{label:<28} {best * 1000:10.1f} ms  {best * 1e9 / len(rows):8.0f} ns/строка  '
+        f'{retained / 2**20:8.1f} MiB  {retained / len(rows):6.0f} B/сущность'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--organizations-per-building', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows, args.organizations_per_building)
+    measure('dataclass + dict здания', legacy_to_entities, rows, args.repeat)
+    measure('slots + общий Buildings', mapper_to_entities, rows, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
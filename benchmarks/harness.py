@@ -0,0 +1,206 @@
+"""Общие части бенчмарков: выборка параметров из сгенерированных данных, перцентили, отчёт и базовые линии.
+
+Базовая линия — JSON с результатами прошлого прогона (--save-baseline). При запуске с --baseline
+отчёт показывает изменение p50/p95 относительно неё, а рост p95 больше --tolerance даёт код возврата 1.
+"""
+import argparse
+from dataclasses import asdict, dataclass, field
+import datetime
+import json
+import math
+import os
+import platform
+import random
+import sys
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.models.activities.models import Activity
+from domain.models.buildings.models import Building
+from domain.models.organizations.models import Organization
+
+
+@dataclass
+class BenchmarkResult:
+
+    name: str
+    samples: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    throughput_per_second: float
+    allocated_kib_per_op: float | None = None
+
+
+@dataclass
+class Workload:
+    # Реальные значения из БД, из которых бенчмарки собирают параметры запросов.
+
+    organization_pks: list[uuid.UUID]
+    buildings: list[tuple[uuid.UUID, float, float]]
+    root_activity_names: list[str]
+    activity_names: list[str]
+    name_prefixes: list[str]
+    rng: random.Random = field(default_factory=lambda: random.Random(42))
+
+    def organization_pk(self) -> uuid.UUID:
+        return self.rng.choice(self.organization_pks)
+
+    def building(self) -> tuple[uuid.UUID, float, float]:
+        return self.rng.choice(self.buildings)
+
+    def root_activity_name(self) -> str:
+        return self.rng.choice(self.root_activity_names)
+
+    def activity_name(self) -> str:
+        return self.rng.choice(self.activity_names)
+
+    def name_prefix(self) -> str:
+        return self.rng.choice(self.name_prefixes)
+
+
+async def load_workload(db_session: AsyncSession, sample_size: int = 1000, seed: int = 42) -> Workload:
+    # Случайная выборка, а не первые строки: иначе все запросы попадают в одни и те же страницы.
+    # Выбирает клиент по --seed из упорядоченных по pk строк: ORDER BY random() в БД от seed не зависит.
+    rng = random.Random(seed)
+    organization_rows = (await db_session.execute(
+        select(Organization.pk, Organization.name).order_by(Organization.pk)
+    )).all()
+    organization_rows = rng.sample(organization_rows, min(sample_size, len(organization_rows)))
+    building_rows = (await db_session.execute(
+        select(Building.pk, Building.latitude, Building.longitude).order_by(Building.pk)
+    )).all()
+    building_rows = rng.sample(building_rows, min(sample_size, len(building_rows)))
+    activity_rows = (await db_session.execute(select(Activity.name, Activity.parent_pk))).all()
+    if not organization_rows or not activity_rows:
+        sys.exit('В базе нет организаций или деятельностей: сначала запустите benchmarks/datagen.py')
+
+    return Workload(
+        organization_pks=[row.pk for row in organization_rows],
+        buildings=[(row.pk, row.latitude, row.longitude) for row in building_rows],
+        root_activity_names=sorted({row.name for row in activity_rows if row.parent_pk is None}),
+        activity_names=sorted({row.name for row in activity_rows}),
+        name_prefixes=sorted({row.name.split()[0] for row in organization_rows}),
+        rng=random.Random(seed),
+    )
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    # Линейная интерполяция между соседними рангами, как numpy.percentile по умолчанию.
+    if not sorted_values:
+        return math.nan
+    position = (len(sorted_values) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(
+    name: str,
+    latencies_seconds: list[float],
+    elapsed_seconds: float,
+    errors: int = 0,
+    allocated_bytes_per_op: float | None = None,
+) -> BenchmarkResult:
+    latencies = sorted(latencies_seconds)
+    return BenchmarkResult(
+        name=name,
+        samples=len(latencies),
+        errors=errors,
+        p50_ms=percentile(latencies, 0.50) * 1000,
+        p95_ms=percentile(latencies, 0.95) * 1000,
+        p99_ms=percentile(latencies, 0.99) * 1000,
+        mean_ms=sum(latencies) / len(latencies) * 1000 if latencies else math.nan,
+        throughput_per_second=len(latencies) / elapsed_seconds if elapsed_seconds else 0.0,
+        allocated_kib_per_op=allocated_bytes_per_op / 1024 if allocated_bytes_per_op is not None else None,
+    )
+
+
+def _format_delta(value: float, baseline_value: float | None) -> str:
+    if baseline_value is None or not baseline_value:
+        return ''
+    return f'{(value - baseline_value) / baseline_value * 100:+6.1f}%'
+
+
+def print_report(results: list[BenchmarkResult], baseline: dict[str, BenchmarkResult] | None = None) -> None:
+    print(
+        f'{"сценарий":<28} {"n":>6} {"ошибки":>6} {"p50 мс":>9} {"p95 мс":>9} {"p99 мс":>9} '
+        f'{"оп/с":>9} {"КиБ/оп":>8}' + ('   Δp50     Δp95' if baseline else '')
+    )
+    for result in results:
+        allocated = f'{result.allocated_kib_per_op:8.1f}' if result.allocated_kib_per_op is not None else f'{"—":>8}'
+        line = (
+            f'{result.name:<28} {result.samples:>6} {result.errors:>6} {result.p50_ms:9.2f} {result.p95_ms:9.2f} '
+            f'{result.p99_ms:9.2f} {result.throughput_per_second:9.1f} {allocated}'
+        )
+        if baseline:
+            previous = baseline.get(result.name)
+            line += (
+                f'  {_format_delta(result.p50_ms, previous and previous.p50_ms):>7}'
+                f'  {_format_delta(result.p95_ms, previous and previous.p95_ms):>7}'
+            )
+        print(line)
+
+
+def save_baseline(path: str, results: list[BenchmarkResult], parameters: dict) -> None:
+    payload = {
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'parameters': parameters,
+        'results': [asdict(result) for result in results],
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+
+
+def load_baseline(path: str) -> dict[str, BenchmarkResult]:
+    with open(path, encoding='utf-8') as file:
+        payload = json.load(file)
+    return {result['name']: BenchmarkResult(**result) for result in payload['results']}
+
+
+def find_regressions(
+    results: list[BenchmarkResult],
+    baseline: dict[str, BenchmarkResult],
+    tolerance: float,
+) -> list[str]:
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is not None and previous.p95_ms and result.p95_ms > previous.p95_ms * (1 + tolerance):
+            regressions.append(f'{result.name}: p95 {previous.p95_ms:.2f} → {result.p95_ms:.2f} мс')
+    return regressions
+
+
+def add_baseline_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--save-baseline', metavar='PATH', help='Сохранить результаты как базовую линию (JSON)')
+    parser.add_argument('--baseline', metavar='PATH', help='Сравнить с сохранённой базовой линией')
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='Допустимый рост p95 относительно базовой линии; при превышении код возврата 1',
+    )
+
+
+def report(args: argparse.Namespace, results: list[BenchmarkResult], parameters: dict) -> None:
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    print_report(results, baseline=baseline)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results, parameters=parameters)
+        print(f'Базовая линия сохранена в {args.save_baseline}', file=sys.stderr)
+
+    if baseline:
+        regressions = find_regressions(results, baseline, tolerance=args.tolerance)
+        if regressions:
+            print(f'Регрессии p95 больше {args.tolerance:.0%}:', file=sys.stderr)
+            for regression in regressions:
+                print(f'  {regression}', file=sys.stderr)
+            sys.exit(1)
@@ -0,0 +1,250 @@
+"""Нагрузочный прогон всех маршрутов /api/v1/organizations: p50/p95/p99, пропускная способность, выделения памяти.
+
+Два режима:
+  --base-url http://localhost:8000  — запущенное приложение (uvicorn, docker); меряется вся цепочка, включая сеть;
+  --in-process                      — приложение в этом же процессе через ASGI-транспорт httpx, без сети;
+                                      только в нём доступен замер выделений памяти на запрос (tracemalloc).
+
+Каждый маршрут нагружается отдельно: --concurrency клиентов в течение --duration секунд.
+
+Запуск из корня репозитория на базе, заполненной benchmarks/datagen.py:
+
+    PYTHONPATH=app python benchmarks/http_load.py --in-process --duration 10 --concurrency 16
+    PYTHONPATH=app python benchmarks/http_load.py --base-url http://localhost:8000 --baseline benchmarks/baselines/http.json
+"""
+import argparse
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import time
+import tracemalloc
+from typing import AsyncIterator, Callable
+import uuid
+
+import httpx
+
+from domain.db_session import AsyncSessionLocal
+
+from harness import Workload, add_baseline_arguments, load_workload, report, summarize
+
+
+API_PREFIX = '/api/v1/organizations'
+
+
+@dataclass
+class RouteRequest:
+
+    method: str
+    path: str
+    params: dict = field(default_factory=dict)
+    json: dict | None = None
+
+
+def area_params(workload: Workload, half_size_degrees: float = 0.02) -> dict[str, float]:
+    _, latitude, longitude = workload.building()
+    return {
+        'min_latitude': latitude - half_size_degrees,
+        'max_latitude': latitude + half_size_degrees,
+        'min_longitude': longitude - half_size_degrees,
+        'max_longitude': longitude + half_size_degrees,
+    }
+
+
+def radius_params(workload: Workload, sort_by_distance: bool) -> dict:
+    _, latitude, longitude = workload.building()
+    return {'latitude': latitude, 'longitude': longitude, 'radius_km': 2.0, 'sort_by_distance': sort_by_distance}
+
+
+def nearest_params(workload: Workload) -> dict[str, float]:
+    _, latitude, longitude = workload.building()
+    return {'latitude': latitude, 'longitude': longitude}
+
+
+ROUTES: dict[str, Callable[[Workload], RouteRequest]] = {
+    'list': lambda workload: RouteRequest('GET', f'{API_PREFIX}/'),
+    'by_id': lambda workload: RouteRequest('GET', f'{API_PREFIX}/{workload.organization_pk()}'),
+    'by_building': lambda workload: RouteRequest('GET', f'{API_PREFIX}/buildings/{workload.building()[0]}'),
+    'by_area': lambda workload: RouteRequest('GET', f'{API_PREFIX}/by_area', area_params(workload)),
+    'clusters': lambda workload: RouteRequest(
+        'GET', f'{API_PREFIX}/clusters', {**area_params(workload, half_size_degrees=0.5), 'zoom': 10}
+    ),
+    'by_radius': lambda workload: RouteRequest('GET', f'{API_PREFIX}/by_radius', radius_params(workload, False)),
+    'by_radius_sorted': lambda workload: RouteRequest('GET', f'{API_PREFIX}/by_radius', radius_params(workload, True)),
+    'nearest': lambda workload: RouteRequest('GET', f'{API_PREFIX}/nearest', nearest_params(workload)),
+    'nearest_by_activity': lambda workload: RouteRequest(
+        'GET', f'{API_PREFIX}/nearest', {**nearest_params(workload), 'activity_name': workload.root_activity_name()}
+    ),
+    'by_name': lambda workload: RouteRequest('GET', f'{API_PREFIX}/name', {'name': workload.name_prefix()}),
+    'by_name_ranked': lambda workload: RouteRequest(
+        'GET', f'{API_PREFIX}/name', {'name': workload.name_prefix(), 'ranked': True}
+    ),
+    'suggestions': lambda workload: RouteRequest(
+        'GET', f'{API_PREFIX}/autocomplete', {'prefix': workload.name_prefix()[:2]}
+    ),
+    'by_single_activity': lambda workload: RouteRequest(
+        'GET', f'{API_PREFIX}/single_activity', {'activity_name': workload.activity_name()}
+    ),
+    'by_activity_subtree': lambda workload: RouteRequest(
+        'GET', f'{API_PREFIX}/activity', {'activity_name': workload.root_activity_name()}
+    ),
+    'export': lambda workload: RouteRequest('GET', f'{API_PREFIX}/export'),
+    'lookup_50': lambda workload: RouteRequest(
+        'POST', f'{API_PREFIX}/lookup', json={'pks': [str(workload.organization_pk()) for _ in range(50)]}
+    ),
+}
+
+WRITE_BATCH_SIZE = 100
+
+
+def write_requests(workload: Workload) -> list[RouteRequest]:
+    # Создание, обновление и удаление одной пачки: база после цикла не меняется.
+    pks = [str(uuid.uuid4()) for _ in range(WRITE_BATCH_SIZE)]
+    items = [
+        {'pk': pk, 'title': f'Бенчмарк {number}', 'phone_number_list': ['+7-900-0000000'], 'building_pk': str(workload.building()[0])}
+        for number, pk in enumerate(pks)
+    ]
+    return [
+        RouteRequest('POST', f'{API_PREFIX}/batch', json={'items': items}),
+        RouteRequest('PUT', f'{API_PREFIX}/batch', json={'items': [{**item, 'title': item['title'] + ' (обновлено)'} for item in items]}),
+        RouteRequest('POST', f'{API_PREFIX}/batch/delete', json={'pks': pks}),
+    ]
+
+
+WRITE_ROUTES = ('batch_create', 'batch_upsert', 'batch_delete')
+
+
+@asynccontextmanager
+async def open_client(args: argparse.Namespace) -> AsyncIterator[httpx.AsyncClient]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    if not args.in_process:
+        async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+            yield client
+        return
+
+    from application.api.main import create_app
+
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://benchmark', limits=limits, timeout=args.timeout) as client:
+            yield client
+
+
+async def send(client: httpx.AsyncClient, request: RouteRequest) -> bool:
+    try:
+        response = await client.request(request.method, request.path, params=request.params, json=request.json)
+        await response.aread()
+    except httpx.HTTPError:
+        return False
+    # 404 по случайному имени — штатный ответ, но считается ошибкой, чтобы пустые сценарии были видны.
+    return response.status_code < 400
+
+
+async def load_route(
+    client: httpx.AsyncClient,
+    build_request: Callable[[Workload], RouteRequest],
+    workload: Workload,
+    args: argparse.Namespace,
+) -> tuple[list[float], int, float]:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + args.duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            request = build_request(workload)
+            started_at = time.perf_counter()
+            errors += not await send(client, request)
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return latencies, errors, time.perf_counter() - started_at
+
+
+async def measure_allocations(
+    client: httpx.AsyncClient,
+    build_request: Callable[[Workload], RouteRequest],
+    workload: Workload,
+    iterations: int,
+) -> float:
+    # Последовательно, по одному запросу: пик tracemalloc относится к одному запросу.
+    peaks = []
+    tracemalloc.start()
+    for _ in range(iterations):
+        request = build_request(workload)
+        tracemalloc.reset_peak()
+        baseline_size, _ = tracemalloc.get_traced_memory()
+        await send(client, request)
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline_size)
+    tracemalloc.stop()
+    return sum(peaks) / len(peaks)
+
+
+async def run_writes(client: httpx.AsyncClient, workload: Workload, args: argparse.Namespace) -> list:
+    # Запросы цикла зависят друг от друга, поэтому каждый клиент выполняет их по порядку.
+    latencies = {name: [] for name in WRITE_ROUTES}
+    errors = dict.fromkeys(WRITE_ROUTES, 0)
+    deadline = time.perf_counter() + args.duration
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            for name, request in zip(WRITE_ROUTES, write_requests(workload)):
+                started_at = time.perf_counter()
+                errors[name] += not await send(client, request)
+                latencies[name].append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started_at
+    return [summarize(name, latencies[name], elapsed, errors=errors[name]) for name in WRITE_ROUTES]
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as db_session:
+        workload = await load_workload(db_session=db_session, seed=args.seed)
+
+    selected = args.only or list(ROUTES)
+    results = []
+    async with open_client(args) as client:
+        for name in selected:
+            build_request = ROUTES[name]
+            for _ in range(args.warmup):
+                await send(client, build_request(workload))
+            latencies, errors, elapsed = await load_route(client, build_request, workload, args)
+            allocated_bytes = None
+            if args.in_process and args.alloc_iterations:
+                allocated_bytes = await measure_allocations(client, build_request, workload, args.alloc_iterations)
+            results.append(summarize(name, latencies, elapsed, errors=errors, allocated_bytes_per_op=allocated_bytes))
+
+        if args.include_writes:
+            results.extend(await run_writes(client, workload, args))
+
+    report(args, results, parameters={
+        'target': 'in-process' if args.in_process else args.base_url,
+        'duration': args.duration,
+        'concurrency': args.concurrency,
+        'seed': args.seed,
+    })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--base-url', default='http://localhost:8000')
+    target.add_argument('--in-process', action='store_true', help='Запустить приложение в этом процессе через ASGI')
+    parser.add_argument('--duration', type=float, default=10.0, help='Секунд нагрузки на маршрут')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--alloc-iterations', type=int, default=10, help='Запросов под tracemalloc (--in-process); 0 — не мерить')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', nargs='+', choices=list(ROUTES), help='Нагрузить только эти маршруты')
+    parser.add_argument('--include-writes', action='store_true', help='Добавить цикл batch create/upsert/delete')
+    add_baseline_arguments(parser)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
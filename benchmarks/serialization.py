@@ -0,0 +1,96 @@
+"""Сравнение сериализации страницы организаций: pydantic-схемы + response_model против orjson по dataclass-сущностям.
+
+Запуск из корня репозитория:
+
+    PYTHONPATH=app python benchmarks/serialization.py --organizations 10000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from application.api.v1.organizations.responses import ORJSONEntityResponse, organization_list_content
+from application.api.v1.organizations.schemas import PageOrganizationResponseSchema
+from domain.entities.buildings import Buildings
+from domain.entities.organizations import Organization
+from logic.pagination import Page
+
+
+def build_page(organizations: int) -> Page[Organization]:
+    rng = random.Random(42)
+    activities = ['Еда', 'Молочная продукция', 'Мясная продукция', 'Автомобили', 'Грузовые', 'Легковые']
+    buildings = [
+        Buildings(
+            pk=uuid.UUID(int=rng.getrandbits(128)),
+            address=f'Ул. Ленина {number}',
+            latitude=55.0 + rng.random(),
+            longitude=37.0 + rng.random(),
+        )
+        for number in range(max(organizations // 10, 1))
+    ]
+    return Page(
+        items=[
+            Organization(
+                pk=uuid.UUID(int=rng.getrandbits(128)),
+                title=f'Организация {number}',
+                phone_number_list=[f'+7-900-{number:07d}', f'+7-901-{number:07d}'],
+                building=rng.choice(buildings),
+                activities=rng.sample(activities, 3),
+            )
+            for number in range(organizations)
+        ],
+        next_cursor='eyJjcmVhdGVkX2F0IjogIjIwMjUtMDEtMDEifQ',
+    )
+
+
+async def pydantic_response(page: Page[Organization], field) -> bytes:
+    # Путь FastAPI по умолчанию: схемы из сущностей, валидация по response_model, json.dumps.
+    content = await serialize_response(
+        field=field, response_content=PageOrganizationResponseSchema.from_page(page=page)
+    )
+    return JSONResponse(content).body
+
+
+async def orjson_response(page: Page[Organization], field) -> bytes:
+    return ORJSONEntityResponse({'items': organization_list_content(page.items), 'next_cursor': page.next_cursor}).body
+
+
+async def measure(label: str, func, repeat: int, organizations: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await func()
+        best = min(best, time.perf_counter() - started_at)
+    per_10k = best * 10_000 / organizations
+    print(f'{label:<32} {best * 1000:10.2f} ms  {per_10k * 1000:10.2f} ms / 10k организаций')
+    return best
+
+
+async def run(args: argparse.Namespace) -> None:
+    page = build_page(args.organizations)
+    field = create_model_field(name='Response', type_=PageOrganizationResponseSchema, mode='serialization')
+
+    baseline_body = await pydantic_response(page, field)
+    fast_body = await orjson_response(page, field)
+    assert json.loads(baseline_body) == json.loads(fast_body), 'тела ответов расходятся'
+
+    baseline = await measure('pydantic + response_model', lambda: pydantic_response(page, field), args.repeat, args.organizations)
+    elapsed = await measure('orjson по dataclass', lambda: orjson_response(page, field), args.repeat, args.organizations)
+    print(f'{"":<32} x{baseline / elapsed:.1f} faster, {len(fast_body) / 1024:.0f} KiB body')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--organizations', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
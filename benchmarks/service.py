@@ -0,0 +1,218 @@
+"""Микробенчмарки методов сервиса организаций напрямую, без HTTP.
+
+Сервис собирается так же, как в приложении (get_organization_service), поэтому индексы, read model
+и кэши включаются теми же переменными окружения. Каждый вызов получает свою сессию, как запрос.
+Выделения памяти меряются отдельным проходом под tracemalloc: пик на вызов.
+
+Запуск из корня репозитория на базе, заполненной benchmarks/datagen.py:
+
+    PYTHONPATH=app python benchmarks/service.py --iterations 200 --save-baseline benchmarks/baselines/service.json
+    PYTHONPATH=app python benchmarks/service.py --iterations 200 --baseline benchmarks/baselines/service.json
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Awaitable, Callable
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.api.v1.organizations.dependencies import get_organization_service
+from domain.db_session import AsyncSessionLocal
+from domain.entities.organizations import OrganizationDraft
+from infra.indexes.activities import activity_taxonomy_cache
+from infra.indexes.buildings import building_spatial_index
+from infra.indexes.organizations import organization_name_index
+from logic.exceptions.base import LogicException
+from logic.services.organizations import BaseOrganizationService
+from settings.config import config
+
+from harness import Workload, add_baseline_arguments, load_workload, report, summarize
+
+
+Case = Callable[[BaseOrganizationService, AsyncSession, Workload], Awaitable[object]]
+
+
+async def stream_all(service: BaseOrganizationService, db_session: AsyncSession, workload: Workload) -> int:
+    count = 0
+    async for chunk in service.stream_organization_list(db_session=db_session):
+        count += len(chunk)
+    return count
+
+
+async def write_cycle(service: BaseOrganizationService, db_session: AsyncSession, workload: Workload) -> None:
+    # Создание, обновление и удаление одной и той же пачки: база после вызова не меняется.
+    drafts = [
+        OrganizationDraft(
+            pk=uuid.uuid4(),
+            title=f'Бенчмарк {number}',
+            phone_number_list=['+7-900-0000000'],
+            building_pk=workload.building()[0],
+            activity_pks=[],
+        )
+        for number in range(100)
+    ]
+    await service.create_organizations(db_session=db_session, organizations=drafts)
+    for draft in drafts:
+        draft.title += ' (обновлено)'
+    await service.upsert_organizations(db_session=db_session, organizations=drafts)
+    await service.delete_organizations(db_session=db_session, pks=[draft.pk for draft in drafts])
+
+
+def area_around(workload: Workload, half_size_degrees: float = 0.02) -> dict[str, float]:
+    _, latitude, longitude = workload.building()
+    return {
+        'min_latitude': latitude - half_size_degrees,
+        'max_latitude': latitude + half_size_degrees,
+        'min_longitude': longitude - half_size_degrees,
+        'max_longitude': longitude + half_size_degrees,
+    }
+
+
+async def nearest(
+    service: BaseOrganizationService,
+    db_session: AsyncSession,
+    workload: Workload,
+    activity_name: str | None = None,
+) -> list:
+    _, latitude, longitude = workload.building()
+    return await service.get_nearest_organizations(
+        db_session=db_session, latitude=latitude, longitude=longitude, activity_name=activity_name
+    )
+
+
+CASES: dict[str, Case] = {
+    'list': lambda service, db_session, workload: service.get_organization_list(db_session=db_session),
+    'by_id': lambda service, db_session, workload: service.get_organization_by_id(
+        pk=workload.organization_pk(), db_session=db_session
+    ),
+    'by_building': lambda service, db_session, workload: service.get_organization_list_by_building(
+        db_session=db_session, pk_building=workload.building()[0]
+    ),
+    'by_area': lambda service, db_session, workload: service.get_organization_list_by_area(
+        db_session=db_session, **area_around(workload)
+    ),
+    'clusters': lambda service, db_session, workload: service.get_organization_clusters(
+        db_session=db_session, zoom=10, **area_around(workload, half_size_degrees=0.5)
+    ),
+    'by_radius': lambda service, db_session, workload: service.get_organization_list_by_radius(
+        db_session=db_session, latitude=workload.building()[1], longitude=workload.building()[2], radius_km=2.0
+    ),
+    'by_radius_sorted': lambda service, db_session, workload: service.get_organization_list_by_radius(
+        db_session=db_session,
+        latitude=workload.building()[1],
+        longitude=workload.building()[2],
+        radius_km=2.0,
+        sort_by_distance=True,
+    ),
+    'nearest': lambda service, db_session, workload: nearest(service, db_session, workload),
+    'nearest_by_activity': lambda service, db_session, workload: nearest(
+        service, db_session, workload, activity_name=workload.root_activity_name()
+    ),
+    'by_name': lambda service, db_session, workload: service.get_organization_list_by_name(
+        db_session=db_session, name=workload.name_prefix()
+    ),
+    'by_name_ranked': lambda service, db_session, workload: service.get_organization_list_by_name(
+        db_session=db_session, name=workload.name_prefix(), ranked=True
+    ),
+    'suggestions': lambda service, db_session, workload: service.get_organization_suggestions(
+        db_session=db_session, prefix=workload.name_prefix()[:2]
+    ),
+    'by_single_activity': lambda service, db_session, workload: service.get_organization_list_by_single_activity(
+        db_session=db_session, activity_name=workload.activity_name()
+    ),
+    'by_activity_subtree': lambda service, db_session, workload: service.get_organization_list_by_activity(
+        db_session=db_session, activity_name=workload.root_activity_name()
+    ),
+    'lookup_50': lambda service, db_session, workload: service.get_organizations_by_ids(
+        db_session=db_session, pks=[workload.organization_pk() for _ in range(50)]
+    ),
+    'stream': stream_all,
+}
+
+WRITE_CASES: dict[str, Case] = {
+    'write_cycle_100': write_cycle,
+}
+
+
+async def call(case: Case, service: BaseOrganizationService, workload: Workload) -> bool:
+    async with AsyncSessionLocal() as db_session:
+        try:
+            await case(service, db_session, workload)
+        except LogicException:
+            # «Не найдено» — штатный ответ, но считается отдельно, чтобы пустые сценарии были видны.
+            return False
+    return True
+
+
+async def run_case(name: str, case: Case, service: BaseOrganizationService, workload: Workload, args: argparse.Namespace):
+    for _ in range(args.warmup):
+        await call(case, service, workload)
+
+    latencies, errors = [], 0
+    started_at = time.perf_counter()
+    for _ in range(args.iterations):
+        call_started_at = time.perf_counter()
+        errors += not await call(case, service, workload)
+        latencies.append(time.perf_counter() - call_started_at)
+    elapsed = time.perf_counter() - started_at
+
+    allocated_bytes = None
+    if args.alloc_iterations:
+        peaks = []
+        tracemalloc.start()
+        for _ in range(args.alloc_iterations):
+            tracemalloc.reset_peak()
+            baseline_size, _ = tracemalloc.get_traced_memory()
+            await call(case, service, workload)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline_size)
+        tracemalloc.stop()
+        allocated_bytes = sum(peaks) / len(peaks)
+
+    return summarize(name, latencies, elapsed, errors=errors, allocated_bytes_per_op=allocated_bytes)
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as db_session:
+        workload = await load_workload(db_session=db_session, seed=args.seed)
+        if config.spatial_index_enabled:
+            await building_spatial_index.refresh(db_session=db_session)
+        if config.activity_cache_enabled:
+            await activity_taxonomy_cache.refresh(db_session=db_session)
+        if config.autocomplete_index_enabled:
+            await organization_name_index.refresh(db_session=db_session)
+
+    service = get_organization_service()
+    cases = {**CASES, **WRITE_CASES}
+    selected = args.only or [*CASES, *(WRITE_CASES if args.include_writes else ())]
+
+    results = []
+    for name in selected:
+        results.append(await run_case(name, cases[name], service, workload, args))
+
+    report(args, results, parameters={
+        'iterations': args.iterations,
+        'warmup': args.warmup,
+        'seed': args.seed,
+        'read_model': config.organization_read_model_enabled,
+        'spatial_index': config.spatial_index_enabled,
+        'building_cache': config.building_cache_enabled,
+        'response_cache': config.response_cache_enabled,
+    })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--alloc-iterations', type=int, default=10, help='Вызовов под tracemalloc; 0 — не мерить')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', nargs='+', choices=[*CASES, *WRITE_CASES], help='Запустить только эти сценарии')
+    parser.add_argument('--include-writes', action='store_true', help='Добавить сценарии записи (создают и удаляют свои строки)')
+    add_baseline_arguments(parser)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""building earth location index
+
+Revision ID: 3b9e4d7a1c58
+Revises: f2c6d8e0b154
+Create Date: 2025-02-14 10:42:17.208531
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e4d7a1c58'
+down_revision: Union[str, None] = 'f2c6d8e0b154'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # earthdistance переводит координаты в точку cube на поверхности Земли; GiST-индекс по ней
+    # обслуживает поиск ближайших через оператор <->.
+    op.execute('CREATE EXTENSION IF NOT EXISTS cube')
+    op.execute('CREATE EXTENSION IF NOT EXISTS earthdistance')
+    op.create_index(
+        'ix_building_earth_location',
+        'building',
+        [sa.text('ll_to_earth(latitude, longitude)')],
+        unique=False,
+        postgresql_using='gist',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_building_earth_location', table_name='building')
@@ -0,0 +1,118 @@
+"""organization read model refresh lock
+
+Revision ID: 5c8a3e1f9b26
+Revises: 9d2f6b1e4a75
+Create Date: 2025-02-17 10:41:06.318254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c8a3e1f9b26'
+down_revision: Union[str, None] = '9d2f6b1e4a75'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Без блокировки две транзакции, одновременно меняющие связи одной организации, записывают
+# в read model каждая свой снимок, и последняя затирает изменения первой.
+# FOR NO KEY UPDATE, а не FOR UPDATE: вставка в organization_activity берёт на организацию
+# FOR KEY SHARE по внешнему ключу, и FOR UPDATE в двух таких транзакциях приводил бы к взаимоблокировке.
+REFRESH_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_organization_read_model(organization_pks uuid[]) RETURNS void AS $$
+BEGIN
+    -- Пересчёты одной организации выполняются по очереди: после ожидания блокировки
+    -- следующие запросы видят уже зафиксированные изменения параллельной транзакции.
+    PERFORM 1 FROM organization WHERE pk = ANY(organization_pks) ORDER BY pk FOR NO KEY UPDATE;
+
+    DELETE FROM organization_read_model
+    WHERE pk = ANY(organization_pks)
+      AND NOT EXISTS (SELECT 1 FROM organization WHERE organization.pk = organization_read_model.pk);
+
+    INSERT INTO organization_read_model (
+        pk, name, phone_numbers,
+        building_pk, building_address, building_latitude, building_longitude,
+        activity_pks, activity_names, created_at, updated_at
+    )
+    SELECT
+        organization.pk, organization.name, organization.phone_numbers,
+        building.pk, building.address, building.latitude, building.longitude,
+        coalesce(activities.pks, '{}'), coalesce(activities.names, '{}'), organization.created_at, now()
+    FROM organization
+    JOIN building ON building.pk = organization.building_pk
+    LEFT JOIN LATERAL (
+        SELECT
+            array_agg(activity.pk ORDER BY activity.name) AS pks,
+            array_agg(activity.name ORDER BY activity.name) AS names
+        FROM organization_activity
+        JOIN activity ON activity.pk = organization_activity.activity_pk
+        WHERE organization_activity.organization_pk = organization.pk
+    ) AS activities ON true
+    WHERE organization.pk = ANY(organization_pks)
+    ON CONFLICT (pk) DO UPDATE SET
+        name = EXCLUDED.name,
+        phone_numbers = EXCLUDED.phone_numbers,
+        building_pk = EXCLUDED.building_pk,
+        building_address = EXCLUDED.building_address,
+        building_latitude = EXCLUDED.building_latitude,
+        building_longitude = EXCLUDED.building_longitude,
+        activity_pks = EXCLUDED.activity_pks,
+        activity_names = EXCLUDED.activity_names,
+        created_at = EXCLUDED.created_at,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+PREVIOUS_REFRESH_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_organization_read_model(organization_pks uuid[]) RETURNS void AS $$
+BEGIN
+    DELETE FROM organization_read_model
+    WHERE pk = ANY(organization_pks)
+      AND NOT EXISTS (SELECT 1 FROM organization WHERE organization.pk = organization_read_model.pk);
+
+    INSERT INTO organization_read_model (
+        pk, name, phone_numbers,
+        building_pk, building_address, building_latitude, building_longitude,
+        activity_pks, activity_names, created_at, updated_at
+    )
+    SELECT
+        organization.pk, organization.name, organization.phone_numbers,
+        building.pk, building.address, building.latitude, building.longitude,
+        coalesce(activities.pks, '{}'), coalesce(activities.names, '{}'), organization.created_at, now()
+    FROM organization
+    JOIN building ON building.pk = organization.building_pk
+    LEFT JOIN LATERAL (
+        SELECT
+            array_agg(activity.pk ORDER BY activity.name) AS pks,
+            array_agg(activity.name ORDER BY activity.name) AS names
+        FROM organization_activity
+        JOIN activity ON activity.pk = organization_activity.activity_pk
+        WHERE organization_activity.organization_pk = organization.pk
+    ) AS activities ON true
+    WHERE organization.pk = ANY(organization_pks)
+    ON CONFLICT (pk) DO UPDATE SET
+        name = EXCLUDED.name,
+        phone_numbers = EXCLUDED.phone_numbers,
+        building_pk = EXCLUDED.building_pk,
+        building_address = EXCLUDED.building_address,
+        building_latitude = EXCLUDED.building_latitude,
+        building_longitude = EXCLUDED.building_longitude,
+        activity_pks = EXCLUDED.activity_pks,
+        activity_names = EXCLUDED.activity_names,
+        created_at = EXCLUDED.created_at,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    op.execute(REFRESH_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_REFRESH_FUNCTION)
@@ -0,0 +1,77 @@
+"""table versions
+
+Revision ID: 8f3b2d6c4a19
+Revises: 5c8a3e1f9b26
+Create Date: 2025-02-18 12:15:33.902471
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3b2d6c4a19'
+down_revision: Union[str, None] = '5c8a3e1f9b26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+VERSIONED_TABLES = ('organization', 'organization_activity', 'building', 'activity')
+
+# Операторы, не затронувшие ни одной строки (например, повторный импорт без изменений), версию не двигают.
+BUMP_FUNCTION = """
+CREATE FUNCTION bump_table_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        IF NOT EXISTS (SELECT 1 FROM new_rows) THEN
+            RETURN NULL;
+        END IF;
+    ELSIF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF NOT EXISTS (SELECT 1 FROM old_rows) THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+    UPDATE table_version SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGER_EVENTS = {
+    'INSERT': 'REFERENCING NEW TABLE AS new_rows ',
+    'UPDATE': 'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows ',
+    'DELETE': 'REFERENCING OLD TABLE AS old_rows ',
+    'TRUNCATE': '',
+}
+
+
+def upgrade() -> None:
+    op.create_table('table_version',
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+    op.execute(
+        'INSERT INTO table_version (table_name) VALUES '
+        + ', '.join(f"('{table_name}')" for table_name in VERSIONED_TABLES)
+    )
+
+    op.execute(BUMP_FUNCTION)
+    for table_name in VERSIONED_TABLES:
+        for trigger_event, transition_tables in TRIGGER_EVENTS.items():
+            op.execute(
+                f'CREATE TRIGGER table_version_{trigger_event.lower()} '
+                f'AFTER {trigger_event} ON {table_name} '
+                f'{transition_tables}'
+                f'FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()'
+            )
+
+
+def downgrade() -> None:
+    for table_name in VERSIONED_TABLES:
+        for trigger_event in TRIGGER_EVENTS:
+            op.execute(f'DROP TRIGGER table_version_{trigger_event.lower()} ON {table_name}')
+    op.execute('DROP FUNCTION bump_table_version()')
+    op.drop_table('table_version')
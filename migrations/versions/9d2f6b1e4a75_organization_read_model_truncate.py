@@ -0,0 +1,62 @@
+"""organization read model truncate triggers
+
+Revision ID: 9d2f6b1e4a75
+Revises: 3b9e4d7a1c58
+Create Date: 2025-02-14 11:08:52.204917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2f6b1e4a75'
+down_revision: Union[str, None] = '3b9e4d7a1c58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# TRUNCATE не запускает триггеры на DELETE, поэтому для read model нужны отдельные.
+# Здания и деятельности можно очистить только вместе со ссылающимися таблицами
+# (или через CASCADE, который тоже запускает их триггеры), так что хватает двух.
+TRIGGER_FUNCTIONS = {
+    'organization': """
+CREATE FUNCTION organization_read_model_on_organization_truncate() RETURNS trigger AS $$
+BEGIN
+    TRUNCATE organization_read_model;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+""",
+    'organization_activity': """
+CREATE FUNCTION organization_read_model_on_organization_activity_truncate() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_organization_read_model(ARRAY(SELECT pk FROM organization));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+""",
+}
+
+
+def upgrade() -> None:
+    for table_name, trigger_function in TRIGGER_FUNCTIONS.items():
+        op.execute(trigger_function)
+        op.execute(
+            f'CREATE TRIGGER organization_read_model_truncate '
+            f'AFTER TRUNCATE ON {table_name} '
+            f'FOR EACH STATEMENT EXECUTE FUNCTION organization_read_model_on_{table_name}_truncate()'
+        )
+
+    # Строки, оставшиеся после прежних TRUNCATE.
+    op.execute(
+        'DELETE FROM organization_read_model '
+        'WHERE NOT EXISTS (SELECT 1 FROM organization WHERE organization.pk = organization_read_model.pk)'
+    )
+
+
+def downgrade() -> None:
+    for table_name in TRIGGER_FUNCTIONS:
+        op.execute(f'DROP TRIGGER organization_read_model_truncate ON {table_name}')
+        op.execute(f'DROP FUNCTION organization_read_model_on_{table_name}_truncate()')
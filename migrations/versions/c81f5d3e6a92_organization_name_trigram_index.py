@@ -0,0 +1,33 @@
+"""organization name trigram index
+
+Revision ID: c81f5d3e6a92
+Revises: a4d8e2c91b37
+Create Date: 2025-02-07 10:41:55.228930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f5d3e6a92'
+down_revision: Union[str, None] = 'a4d8e2c91b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_organization_name_trgm',
+        'organization',
+        [sa.text('lower(name) gin_trgm_ops')],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_organization_name_trgm', table_name='organization')
@@ -0,0 +1,209 @@
+"""organization read model
+
+Revision ID: e5b7a19c4d03
+Revises: c81f5d3e6a92
+Create Date: 2025-02-10 16:22:40.517384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b7a19c4d03'
+down_revision: Union[str, None] = 'c81f5d3e6a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+REFRESH_FUNCTION = """
+CREATE FUNCTION refresh_organization_read_model(organization_pks uuid[]) RETURNS void AS $$
+BEGIN
+    DELETE FROM organization_read_model
+    WHERE pk = ANY(organization_pks)
+      AND NOT EXISTS (SELECT 1 FROM organization WHERE organization.pk = organization_read_model.pk);
+
+    INSERT INTO organization_read_model (
+        pk, name, phone_numbers,
+        building_pk, building_address, building_latitude, building_longitude,
+        activity_pks, activity_names, created_at, updated_at
+    )
+    SELECT
+        organization.pk, organization.name, organization.phone_numbers,
+        building.pk, building.address, building.latitude, building.longitude,
+        coalesce(activities.pks, '{}'), coalesce(activities.names, '{}'), organization.created_at, now()
+    FROM organization
+    JOIN building ON building.pk = organization.building_pk
+    LEFT JOIN LATERAL (
+        SELECT
+            array_agg(activity.pk ORDER BY activity.name) AS pks,
+            array_agg(activity.name ORDER BY activity.name) AS names
+        FROM organization_activity
+        JOIN activity ON activity.pk = organization_activity.activity_pk
+        WHERE organization_activity.organization_pk = organization.pk
+    ) AS activities ON true
+    WHERE organization.pk = ANY(organization_pks)
+    ON CONFLICT (pk) DO UPDATE SET
+        name = EXCLUDED.name,
+        phone_numbers = EXCLUDED.phone_numbers,
+        building_pk = EXCLUDED.building_pk,
+        building_address = EXCLUDED.building_address,
+        building_latitude = EXCLUDED.building_latitude,
+        building_longitude = EXCLUDED.building_longitude,
+        activity_pks = EXCLUDED.activity_pks,
+        activity_names = EXCLUDED.activity_names,
+        created_at = EXCLUDED.created_at,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Триггеры уровня оператора с таблицами переходов: массовая вставка или
+# обновление пересчитывает затронутые организации одним вызовом, а не построчно.
+TRIGGER_FUNCTIONS = {
+    'organization': """
+CREATE FUNCTION organization_read_model_on_organization() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_organization_read_model(ARRAY(SELECT pk FROM new_rows));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM refresh_organization_read_model(ARRAY(SELECT pk FROM new_rows UNION SELECT pk FROM old_rows));
+    ELSE
+        PERFORM refresh_organization_read_model(ARRAY(SELECT pk FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+""",
+    'organization_activity': """
+CREATE FUNCTION organization_read_model_on_organization_activity() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_organization_read_model(ARRAY(SELECT DISTINCT organization_pk FROM new_rows));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM refresh_organization_read_model(
+            ARRAY(SELECT organization_pk FROM new_rows UNION SELECT organization_pk FROM old_rows)
+        );
+    ELSE
+        PERFORM refresh_organization_read_model(ARRAY(SELECT DISTINCT organization_pk FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+""",
+    'building': """
+CREATE FUNCTION organization_read_model_on_building() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_organization_read_model(ARRAY(
+        SELECT organization.pk
+        FROM new_rows
+        JOIN old_rows ON old_rows.pk = new_rows.pk
+        JOIN organization ON organization.building_pk = new_rows.pk
+        WHERE (new_rows.address, new_rows.latitude, new_rows.longitude)
+            IS DISTINCT FROM (old_rows.address, old_rows.latitude, old_rows.longitude)
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+""",
+    'activity': """
+CREATE FUNCTION organization_read_model_on_activity() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_organization_read_model(ARRAY(
+        SELECT DISTINCT organization_activity.organization_pk
+        FROM new_rows
+        JOIN old_rows ON old_rows.pk = new_rows.pk
+        JOIN organization_activity ON organization_activity.activity_pk = new_rows.pk
+        WHERE new_rows.name IS DISTINCT FROM old_rows.name
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+""",
+}
+
+# Здания и деятельности удаляются только после отвязки организаций,
+# поэтому для них достаточно отслеживать UPDATE.
+TRIGGER_EVENTS = {
+    'organization': ('INSERT', 'UPDATE', 'DELETE'),
+    'organization_activity': ('INSERT', 'UPDATE', 'DELETE'),
+    'building': ('UPDATE',),
+    'activity': ('UPDATE',),
+}
+
+TRANSITION_TABLES = {
+    'INSERT': 'NEW TABLE AS new_rows',
+    'UPDATE': 'OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'DELETE': 'OLD TABLE AS old_rows',
+}
+
+
+def upgrade() -> None:
+    op.create_table('organization_read_model',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('phone_numbers', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.Column('building_pk', sa.UUID(), nullable=False),
+    sa.Column('building_address', sa.String(), nullable=False),
+    sa.Column('building_latitude', sa.Float(), nullable=False),
+    sa.Column('building_longitude', sa.Float(), nullable=False),
+    sa.Column('activity_pks', postgresql.ARRAY(sa.UUID()), server_default=sa.text("'{}'"), nullable=False),
+    sa.Column('activity_names', postgresql.ARRAY(sa.String()), server_default=sa.text("'{}'"), nullable=False),
+    sa.Column('pk', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('pk')
+    )
+    op.create_index(op.f('ix_organization_read_model_created_at'), 'organization_read_model', ['created_at'], unique=False)
+    op.create_index(op.f('ix_organization_read_model_building_pk'), 'organization_read_model', ['building_pk'], unique=False)
+    op.create_index(
+        'ix_organization_read_model_name_trgm',
+        'organization_read_model',
+        [sa.text('lower(name) gin_trgm_ops')],
+        unique=False,
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_organization_read_model_activity_pks',
+        'organization_read_model',
+        ['activity_pks'],
+        unique=False,
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_organization_read_model_activity_names',
+        'organization_read_model',
+        ['activity_names'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+    op.execute(REFRESH_FUNCTION)
+    for table_name, trigger_function in TRIGGER_FUNCTIONS.items():
+        op.execute(trigger_function)
+        for trigger_event in TRIGGER_EVENTS[table_name]:
+            op.execute(
+                f'CREATE TRIGGER organization_read_model_{trigger_event.lower()} '
+                f'AFTER {trigger_event} ON {table_name} '
+                f'REFERENCING {TRANSITION_TABLES[trigger_event]} '
+                f'FOR EACH STATEMENT EXECUTE FUNCTION organization_read_model_on_{table_name}()'
+            )
+
+    op.execute('SELECT refresh_organization_read_model(ARRAY(SELECT pk FROM organization))')
+
+
+def downgrade() -> None:
+    for table_name, trigger_events in TRIGGER_EVENTS.items():
+        for trigger_event in trigger_events:
+            op.execute(f'DROP TRIGGER organization_read_model_{trigger_event.lower()} ON {table_name}')
+        op.execute(f'DROP FUNCTION organization_read_model_on_{table_name}()')
+    op.execute('DROP FUNCTION refresh_organization_read_model(uuid[])')
+
+    op.drop_index('ix_organization_read_model_activity_names', table_name='organization_read_model')
+    op.drop_index('ix_organization_read_model_activity_pks', table_name='organization_read_model')
+    op.drop_index('ix_organization_read_model_name_trgm', table_name='organization_read_model')
+    op.drop_index(op.f('ix_organization_read_model_building_pk'), table_name='organization_read_model')
+    op.drop_index(op.f('ix_organization_read_model_created_at'), table_name='organization_read_model')
+    op.drop_table('organization_read_model')
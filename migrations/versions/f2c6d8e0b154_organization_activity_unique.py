@@ -0,0 +1,40 @@
+"""organization activity unique
+
+Revision ID: f2c6d8e0b154
+Revises: e5b7a19c4d03
+Create Date: 2025-02-12 11:08:03.662915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6d8e0b154'
+down_revision: Union[str, None] = 'e5b7a19c4d03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Повторные связи организации с одной и той же деятельностью не несут смысла и мешают ON CONFLICT.
+    op.execute(
+        'DELETE FROM organization_activity AS duplicate '
+        'USING organization_activity AS original '
+        'WHERE duplicate.organization_pk = original.organization_pk '
+        'AND duplicate.activity_pk = original.activity_pk '
+        'AND duplicate.pk > original.pk'
+    )
+    op.create_unique_constraint(
+        'uq_organization_activity_organization_pk_activity_pk',
+        'organization_activity',
+        ['organization_pk', 'activity_pk'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'uq_organization_activity_organization_pk_activity_pk', 'organization_activity', type_='unique'
+    )
@@ -0,0 +1,9 @@
+import os
+
+
+# Настройки читаются при импорте модулей приложения; сами тесты к базе не подключаются.
+os.environ.setdefault('POSTGRES_HOST', 'localhost')
+os.environ.setdefault('POSTGRES_PORT', '5432')
+os.environ.setdefault('POSTGRES_DB', 'organizations')
+os.environ.setdefault('POSTGRES_USER', 'postgres')
+os.environ.setdefault('POSTGRES_PASSWORD', 'postgres')
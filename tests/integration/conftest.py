@@ -0,0 +1,32 @@
+import contextlib
+import os
+from typing import AsyncIterator, Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+
+# Тесты этого каталога ходят в настоящий PostgreSQL с расширениями cube, earthdistance и pg_trgm,
+# накатанный до alembic head. Каждый тест работает в транзакции, которая в конце откатывается.
+TEST_DATABASE_DSN = os.environ.get('TEST_DATABASE_DSN')
+
+
+@pytest.fixture
+def db_session_factory() -> Callable[[], contextlib.AbstractAsyncContextManager[AsyncSession]]:
+    if not TEST_DATABASE_DSN:
+        pytest.skip('TEST_DATABASE_DSN не задан')
+
+    @contextlib.asynccontextmanager
+    async def rolled_back_session() -> AsyncIterator[AsyncSession]:
+        engine = create_async_engine(TEST_DATABASE_DSN)
+        try:
+            async with engine.connect() as connection:
+                transaction = await connection.begin()
+                try:
+                    yield AsyncSession(bind=connection, join_transaction_mode='create_savepoint')
+                finally:
+                    await transaction.rollback()
+        finally:
+            await engine.dispose()
+
+    return rolled_back_session
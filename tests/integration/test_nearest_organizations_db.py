@@ -0,0 +1,84 @@
+import asyncio
+import math
+import random
+
+from geopy.distance import geodesic
+from sqlalchemy import select, text
+
+from domain.models.buildings.models import Building
+from domain.models.organizations.models import Organization
+from logic.services.organizations import ORMOrganizationService
+
+
+CENTER = (70.0, -150.0)
+
+
+def sphere_destination(latitude: float, longitude: float, angle: float, bearing: float) -> tuple[float, float]:
+    # Точка на заданном угловом расстоянии по сфере — так, как её видит ll_to_earth.
+    latitude, longitude, bearing = math.radians(latitude), math.radians(longitude), math.radians(bearing)
+    destination_latitude = math.asin(
+        math.sin(latitude) * math.cos(angle) + math.cos(latitude) * math.sin(angle) * math.cos(bearing)
+    )
+    destination_longitude = longitude + math.atan2(
+        math.sin(bearing) * math.sin(angle) * math.cos(latitude),
+        math.cos(angle) - math.sin(latitude) * math.sin(destination_latitude),
+    )
+    return math.degrees(destination_latitude), math.degrees(destination_longitude)
+
+
+def test_nearest_matches_brute_force_geodesic_ranking(db_session_factory):
+    async def scenario():
+        async with db_session_factory() as db_session:
+            # Здания почти на одной окружности по сфере: порядок по хорде почти случаен относительно
+            # порядка по эллипсоиду, и ближайшие по эллипсоиду оказываются далеко в выдаче индекса.
+            # В части зданий несколько организаций — граница выборки проходит внутри здания.
+            rng = random.Random(4)
+            for number in range(200):
+                building_latitude, building_longitude = sphere_destination(
+                    *CENTER, angle=10 / 6371 * (1 + rng.uniform(0, 1e-4)), bearing=rng.uniform(0, 360)
+                )
+                building = Building(address=f'Кольцо, {number}', latitude=building_latitude, longitude=building_longitude)
+                db_session.add_all(
+                    Organization(name=f'Организация {number}.{index}', phone_numbers=[], building=building)
+                    for index in range(rng.randint(1, 3))
+                )
+            await db_session.flush()
+
+            all_rows = (
+                await db_session.execute(
+                    select(Organization.pk, Building.latitude, Building.longitude).join(Building)
+                )
+            ).all()
+            expected = sorted(all_rows, key=lambda row: (geodesic(CENTER, (row.latitude, row.longitude)).km, row.pk))
+
+            for limit in (1, 2, 5, 20):
+                nearest = await ORMOrganizationService().get_nearest_organizations(
+                    db_session=db_session, latitude=CENTER[0], longitude=CENTER[1], limit=limit
+                )
+                assert [organization.pk for organization in nearest] == [row.pk for row in expected[:limit]]
+                for organization, row in zip(nearest, expected):
+                    assert math.isclose(
+                        organization.distance_km, geodesic(CENTER, (row.latitude, row.longitude)).km, abs_tol=1e-6
+                    )
+
+    asyncio.run(scenario())
+
+
+def test_knn_ordering_is_served_by_the_earth_location_index(db_session_factory):
+    async def scenario():
+        async with db_session_factory() as db_session:
+            # На маленькой тестовой таблице планировщику дешевле полный просмотр, поэтому он запрещён:
+            # проверяется, что индекс вообще умеет отдавать порядок по <->.
+            await db_session.execute(text('SET LOCAL enable_seqscan = off'))
+            plan = (
+                await db_session.execute(
+                    text(
+                        'EXPLAIN SELECT pk FROM building '
+                        'ORDER BY ll_to_earth(latitude, longitude) <-> ll_to_earth(:latitude, :longitude) LIMIT 5'
+                    ),
+                    {'latitude': CENTER[0], 'longitude': CENTER[1]},
+                )
+            ).scalars().all()
+            assert any('Index Scan using ix_building_earth_location' in line for line in plan)
+
+    asyncio.run(scenario())
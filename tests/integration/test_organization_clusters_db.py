@@ -0,0 +1,45 @@
+import asyncio
+import math
+import random
+
+from domain.models.buildings.models import Building
+from domain.models.organizations.models import Organization
+from logic.geo.grid import cluster_tile
+from logic.services.organizations import ORMOrganizationService
+
+
+def test_sql_clusters_use_the_same_tiles_as_cluster_tile(db_session_factory):
+    async def scenario():
+        async with db_session_factory() as db_session:
+            # Отдельный участок карты, где нет других данных: кластеры целиком состоят из тестовых зданий.
+            rng = random.Random(6)
+            buildings = [
+                Building(address=f'Тестовая, {number}', latitude=rng.uniform(-84.0, -80.0), longitude=rng.uniform(-120.0, -100.0))
+                for number in range(300)
+            ]
+            db_session.add_all(
+                Organization(name=f'Организация {number}', phone_numbers=[], building=building)
+                for number, building in enumerate(buildings)
+            )
+            await db_session.flush()
+
+            for zoom in (3, 6, 9):
+                clusters = await ORMOrganizationService().get_organization_clusters(
+                    db_session=db_session,
+                    min_latitude=-84.0,
+                    max_latitude=-80.0,
+                    min_longitude=-120.0,
+                    max_longitude=-100.0,
+                    zoom=zoom,
+                )
+
+                expected: dict[tuple[int, int], list[Building]] = {}
+                for building in buildings:
+                    expected.setdefault(cluster_tile(building.latitude, building.longitude, zoom), []).append(building)
+                assert sorted(cluster.building_count for cluster in clusters) == sorted(map(len, expected.values()))
+                for cluster in clusters:
+                    members = expected[cluster_tile(cluster.latitude, cluster.longitude, zoom)]
+                    assert cluster.building_count == len(members)
+                    assert math.isclose(cluster.latitude, sum(building.latitude for building in members) / len(members))
+
+    asyncio.run(scenario())
@@ -0,0 +1,65 @@
+import asyncio
+
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.models.buildings.models import Building
+from domain.models.organizations.models import Organization
+from infra.indexes.organizations import OrganizationNameIndex
+from logic.services.organizations import ORMOrganizationService
+
+
+PREFIXES = ('str', 'straß', 'strasse', 'STRASSE', 'ё', 'е', 'кафе')
+
+
+async def add_organizations(db_session: AsyncSession, names: list[str]) -> list[Organization]:
+    building = Building(address='Тестовая, 1', latitude=55.75, longitude=37.62)
+    organizations = [Organization(name=name, phone_numbers=[], building=building) for name in names]
+    db_session.add_all(organizations)
+    await db_session.flush()
+    return organizations
+
+
+async def assert_index_matches_sql(db_session: AsyncSession, index: OrganizationNameIndex) -> None:
+    sql_service = ORMOrganizationService()
+    for prefix in PREFIXES:
+        from_sql = await sql_service.get_organization_suggestions(db_session=db_session, prefix=prefix, limit=50)
+        assert index.suggest(prefix=prefix, limit=50) == from_sql, prefix
+
+
+def test_index_and_sql_fallback_normalize_names_the_same_way(db_session_factory):
+    async def scenario():
+        async with db_session_factory() as db_session:
+            await add_organizations(db_session, ['Straße 1', 'STRASSE 2', 'Ёлка', 'ёж', 'Еда', 'Кафе Ё', 'кафе е'])
+            index = OrganizationNameIndex()
+            await index.refresh(db_session=db_session)
+
+            await assert_index_matches_sql(db_session=db_session, index=index)
+
+    asyncio.run(scenario())
+
+
+def test_refresh_picks_up_changes_made_outside_the_index(db_session_factory):
+    async def scenario():
+        async with db_session_factory() as db_session:
+            renamed, removed = await add_organizations(db_session, ['Straße до', 'Straße удалить'])
+            index = OrganizationNameIndex()
+            await index.refresh(db_session=db_session)
+
+            await add_organizations(db_session, ['Straße новая'])
+            await db_session.execute(
+                update(Organization).where(Organization.pk == renamed.pk).values(name='Straße после')
+            )
+            await index.refresh(db_session=db_session)
+
+            titles = [suggestion.title for suggestion in index.suggest(prefix='straße', limit=50)]
+            assert 'Straße новая' in titles and 'Straße после' in titles and 'Straße до' not in titles
+            await assert_index_matches_sql(db_session=db_session, index=index)
+
+            await db_session.execute(delete(Organization).where(Organization.pk == removed.pk))
+            await index.refresh(db_session=db_session)
+
+            assert 'Straße удалить' not in [suggestion.title for suggestion in index.suggest(prefix='straße', limit=50)]
+            await assert_index_matches_sql(db_session=db_session, index=index)
+
+    asyncio.run(scenario())
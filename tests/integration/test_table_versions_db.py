@@ -0,0 +1,59 @@
+import asyncio
+
+from sqlalchemy import delete, insert, update
+
+from domain.models.activities.models import Activity, organization_activity
+from domain.models.buildings.models import Building
+from domain.models.organizations.models import Organization
+from infra.caches.versions import TableDataVersion
+from infra.table_versions import fetch_table_version
+
+
+def test_triggers_bump_version_only_for_statements_that_change_rows(db_session_factory):
+    async def scenario():
+        async with db_session_factory() as db_session:
+            async def building_version() -> int:
+                return await fetch_table_version(db_session=db_session, table_name=Building.__tablename__)
+
+            initial = await building_version()
+            building = Building(address='Тестовая, 1', latitude=55.75, longitude=37.62)
+            db_session.add(building)
+            await db_session.flush()
+            assert await building_version() == initial + 1
+
+            await db_session.execute(update(Building).where(Building.pk == building.pk).values(address='Тестовая, 2'))
+            assert await building_version() == initial + 2
+
+            await db_session.execute(update(Building).where(Building.address == 'такого адреса нет').values(latitude=0))
+            await db_session.execute(delete(Building).where(Building.address == 'такого адреса нет'))
+            assert await building_version() == initial + 2
+
+            await db_session.execute(delete(Building).where(Building.pk == building.pk))
+            assert await building_version() == initial + 3
+
+    asyncio.run(scenario())
+
+
+def test_data_version_changes_with_activity_links(db_session_factory):
+    async def scenario():
+        async with db_session_factory() as db_session:
+            activity = Activity(name='Тестовая деятельность')
+            organization = Organization(
+                name='Тестовая организация',
+                phone_numbers=[],
+                building=Building(address='Тестовая, 1', latitude=55.75, longitude=37.62),
+            )
+            db_session.add_all([activity, organization])
+            await db_session.flush()
+
+            data_version = TableDataVersion(
+                table_names=(Organization.__tablename__, organization_activity.name),
+                check_interval_seconds=0.0,
+            )
+            before = await data_version.get(db_session=db_session)
+            await db_session.execute(
+                insert(organization_activity).values(organization_pk=organization.pk, activity_pk=activity.pk)
+            )
+            assert await data_version.get(db_session=db_session) != before
+
+    asyncio.run(scenario())
@@ -0,0 +1,92 @@
+import asyncio
+from dataclasses import dataclass, field
+import fnmatch
+import time
+from typing import Any, AsyncIterator
+import uuid
+
+from infra.caches.backends import InMemoryCacheBackend, RedisCacheBackend
+from logic.pagination import Page
+
+
+@dataclass
+class FakeRedis:
+    # Хранит значения в словаре; срок жизни проверяется при чтении, как в Redis.
+
+    values: dict[str, tuple[bytes, float]] = field(default_factory=dict)
+
+    async def get(self, name: str) -> bytes | None:
+        entry = self.values.get(name)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    async def set(self, name: str, value: bytes, px: int | None = None) -> Any:
+        assert isinstance(value, bytes)
+        expires_at = time.monotonic() + px / 1000 if px is not None else float('inf')
+        self.values[name] = (value, expires_at)
+        return True
+
+    async def delete(self, *names: str) -> Any:
+        for name in names:
+            self.values.pop(name, None)
+        return len(names)
+
+    async def scan_iter(self, match: str | None = None) -> AsyncIterator[str]:
+        for name in list(self.values):
+            if match is None or fnmatch.fnmatchcase(name, match):
+                yield name
+
+
+def test_redis_backend_round_trip():
+    client = FakeRedis()
+    backend = RedisCacheBackend(client=client)
+    page = Page(items=[uuid.uuid4(), uuid.uuid4()], next_cursor='cursor')
+
+    async def scenario():
+        assert await backend.get('page') is None
+        await backend.set('page', page, ttl_seconds=60)
+        return await backend.get('page')
+
+    assert asyncio.run(scenario()) == page
+    assert list(client.values) == ['organizations:page']
+
+
+def test_redis_backend_ttl_is_at_least_one_millisecond():
+    client = FakeRedis()
+    backend = RedisCacheBackend(client=client)
+
+    async def scenario():
+        await backend.set('short', 'value', ttl_seconds=0.0001)
+        await asyncio.sleep(0.01)
+        return await backend.get('short')
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_redis_backend_clear_removes_only_own_prefix():
+    client = FakeRedis()
+    backend = RedisCacheBackend(client=client)
+    client.values['other:key'] = (b'value', float('inf'))
+
+    async def scenario():
+        await backend.set('first', 1, ttl_seconds=60)
+        await backend.set('second', 2, ttl_seconds=60)
+        await backend.clear()
+        return await backend.get('first'), await backend.get('second')
+
+    assert asyncio.run(scenario()) == (None, None)
+    assert list(client.values) == ['other:key']
+
+
+def test_in_memory_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2)
+
+    async def scenario():
+        await backend.set('first', 1, ttl_seconds=60)
+        await backend.set('second', 2, ttl_seconds=60)
+        await backend.get('first')
+        await backend.set('third', 3, ttl_seconds=60)
+        return [await backend.get(key) for key in ('first', 'second', 'third')]
+
+    assert asyncio.run(scenario()) == [1, None, 3]
@@ -0,0 +1,140 @@
+import asyncio
+import gc
+
+from infra.coalescing import SingleFlight
+
+
+class Loader:
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        return call
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_identical_calls_share_one_load():
+    async def scenario():
+        single_flight, loader = SingleFlight(), Loader()
+        tasks = [asyncio.create_task(single_flight.run('list', ('key',), loader)) for _ in range(10)]
+        await settle()
+        loader.release.set()
+        return await asyncio.gather(*tasks), loader.calls, len(single_flight)
+
+    assert asyncio.run(scenario()) == ([1] * 10, 1, 0)
+
+
+def test_different_keys_are_loaded_separately():
+    async def scenario():
+        single_flight, loader = SingleFlight(), Loader()
+        tasks = [
+            asyncio.create_task(single_flight.run(name, key, loader))
+            for name, key in (('list', 1), ('list', 2), ('by_name', 1))
+        ]
+        await settle()
+        loader.release.set()
+        return sorted(await asyncio.gather(*tasks))
+
+    assert asyncio.run(scenario()) == [1, 2, 3]
+
+
+def test_sequential_calls_are_not_cached():
+    async def scenario():
+        single_flight, loader = SingleFlight(), Loader()
+        loader.release.set()
+        return [await single_flight.run('list', 1, loader) for _ in range(3)]
+
+    assert asyncio.run(scenario()) == [1, 2, 3]
+
+
+def test_error_is_raised_in_every_waiter():
+    async def scenario():
+        single_flight, release = SingleFlight(), asyncio.Event()
+
+        async def load():
+            await release.wait()
+            raise LookupError('нет данных')
+
+        tasks = [asyncio.create_task(single_flight.run('list', 1, load)) for _ in range(3)]
+        await settle()
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True), len(single_flight)
+
+    results, in_flight = asyncio.run(scenario())
+    assert [type(result) for result in results] == [LookupError] * 3
+    assert in_flight == 0
+
+
+def test_cancelled_leader_hands_load_over_to_waiter():
+    async def scenario():
+        single_flight, loader = SingleFlight(), Loader()
+        leader = asyncio.create_task(single_flight.run('list', 1, loader))
+        await settle()
+        followers = [asyncio.create_task(single_flight.run('list', 1, loader)) for _ in range(3)]
+        await settle()
+
+        leader.cancel()
+        await settle()
+        loader.release.set()
+        return await asyncio.gather(*followers), leader.cancelled(), loader.calls
+
+    # Вторую загрузку выполняет один из ожидавших, остальные получают её результат.
+    assert asyncio.run(scenario()) == ([2, 2, 2], True, 2)
+
+
+def test_cancelled_waiter_does_not_cancel_load():
+    async def scenario():
+        single_flight, loader = SingleFlight(), Loader()
+        leader = asyncio.create_task(single_flight.run('list', 1, loader))
+        await settle()
+        follower = asyncio.create_task(single_flight.run('list', 1, loader))
+        await settle()
+
+        follower.cancel()
+        await settle()
+        loader.release.set()
+        return await leader, follower.cancelled()
+
+    assert asyncio.run(scenario()) == (1, True)
+
+
+def test_calls_after_advance_do_not_join_earlier_load():
+    async def scenario():
+        single_flight, loader = SingleFlight(), Loader()
+        before = asyncio.create_task(single_flight.run('list', 1, loader))
+        await settle()
+        single_flight.advance()
+        after = asyncio.create_task(single_flight.run('list', 1, loader))
+        await settle()
+        loader.release.set()
+        return await before, await after
+
+    assert asyncio.run(scenario()) == (1, 2)
+
+
+def test_leader_error_without_waiters_is_not_reported_as_unretrieved():
+    async def scenario():
+        reported = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: reported.append(context))
+        single_flight = SingleFlight()
+
+        async def load():
+            raise LookupError()
+
+        try:
+            await single_flight.run('list', 1, load)
+        except LookupError:
+            pass
+        gc.collect()
+        return reported
+
+    assert asyncio.run(scenario()) == []
@@ -0,0 +1,65 @@
+import random
+
+from geopy.distance import geodesic
+import pytest
+
+from logic.geo.bounds import BoundingBox, bounding_boxes_for_radius
+
+
+def contains(boxes: list[BoundingBox], latitude: float, longitude: float) -> bool:
+    return any(
+        box.min_latitude <= latitude <= box.max_latitude and box.min_longitude <= longitude <= box.max_longitude
+        for box in boxes
+    )
+
+
+@pytest.mark.parametrize(
+    ('latitude', 'longitude', 'radius_km'),
+    [
+        (55.75, 37.62, 5.0),
+        (0.0, 0.0, 100.0),
+        (-33.87, 151.21, 1500.0),
+        (64.5, 179.9, 50.0),
+        (-70.0, -179.95, 300.0),
+        (88.5, 10.0, 200.0),
+        (-89.9, 0.0, 30.0),
+        (45.0, 90.0, 8000.0),
+    ],
+)
+def test_boxes_cover_geodesic_circle(latitude: float, longitude: float, radius_km: float):
+    boxes = bounding_boxes_for_radius(latitude=latitude, longitude=longitude, radius_km=radius_km)
+    rng = random.Random(f'{latitude}:{longitude}:{radius_km}')
+
+    for bearing in [step * 2.5 for step in range(144)] + [rng.uniform(0, 360) for _ in range(200)]:
+        point = geodesic(kilometers=radius_km).destination((latitude, longitude), bearing)
+        assert contains(boxes, point.latitude, point.longitude), (bearing, point)
+
+
+def test_box_is_not_much_wider_than_circle():
+    [box] = bounding_boxes_for_radius(latitude=55.75, longitude=37.62, radius_km=10.0)
+
+    assert geodesic((box.min_latitude, 37.62), (box.max_latitude, 37.62)).km < 20.0 * 1.02
+    assert geodesic((55.75, box.min_longitude), (55.75, box.max_longitude)).km < 20.0 * 1.02
+
+
+def test_box_crossing_antimeridian_is_split():
+    boxes = bounding_boxes_for_radius(latitude=10.0, longitude=179.99, radius_km=50.0)
+
+    assert len(boxes) == 2
+    assert boxes[0].max_longitude == 180.0
+    assert boxes[1].min_longitude == -180.0
+    assert contains(boxes, 10.0, -179.9)
+    assert not contains(boxes, 10.0, 0.0)
+
+
+def test_circle_around_pole_spans_all_longitudes():
+    [box] = bounding_boxes_for_radius(latitude=89.9, longitude=0.0, radius_km=50.0)
+
+    assert box.max_latitude == 90.0
+    assert (box.min_longitude, box.max_longitude) == (-180.0, 180.0)
+
+
+def test_radius_larger_than_half_circumference_covers_earth():
+    assert bounding_boxes_for_radius(latitude=0.0, longitude=0.0, radius_km=25000.0) == [
+        BoundingBox(-90.0, 90.0, -180.0, 180.0)
+    ]
@@ -0,0 +1,108 @@
+import random
+
+from geopy.distance import geodesic
+import numpy as np
+
+from logic.geo.distance import (
+    EARTHDISTANCE_RADIUS_KM,
+    geodesic_distances_km,
+    geodesic_distances_within_radius,
+    haversine_distances_km,
+    min_geodesic_distance_km_for_chord,
+    vincenty_distances_km,
+)
+
+
+def random_points(rng: random.Random, count: int) -> tuple[np.ndarray, np.ndarray]:
+    latitudes = np.array([rng.uniform(-89.0, 89.0) for _ in range(count)])
+    longitudes = np.array([rng.uniform(-180.0, 180.0) for _ in range(count)])
+    return latitudes, longitudes
+
+
+def geopy_distances_km(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    return np.array([geodesic((latitude, longitude), point).km for point in zip(latitudes, longitudes)])
+
+
+def test_vincenty_matches_geopy():
+    rng = random.Random(1)
+    for latitude, longitude in [(55.75, 37.62), (0.0, 0.0), (-45.0, 170.0)]:
+        latitudes, longitudes = random_points(rng, count=300)
+        distances = vincenty_distances_km(latitude=latitude, longitude=longitude, latitudes=latitudes, longitudes=longitudes)
+        expected = geopy_distances_km(latitude, longitude, latitudes, longitudes)
+
+        converged = ~np.isnan(distances)
+        assert converged.mean() > 0.95
+        np.testing.assert_allclose(distances[converged], expected[converged], rtol=0, atol=1e-6)
+
+
+def test_vincenty_matches_geopy_at_short_distances():
+    latitudes = np.array([55.75, 55.7501, 55.76, 55.8, 56.75])
+    longitudes = np.array([37.62, 37.6201, 37.63, 37.5, 37.62])
+
+    distances = vincenty_distances_km(latitude=55.75, longitude=37.62, latitudes=latitudes, longitudes=longitudes)
+
+    np.testing.assert_allclose(distances, geopy_distances_km(55.75, 37.62, latitudes, longitudes), rtol=0, atol=1e-9)
+    assert distances[0] == 0.0
+
+
+def test_vincenty_returns_nan_for_nearly_antipodal_points():
+    distances = vincenty_distances_km(latitude=0.0, longitude=0.0, latitudes=np.array([0.5]), longitudes=np.array([179.7]))
+
+    assert np.isnan(distances[0])
+
+
+def test_geodesic_distances_fill_non_converged_points():
+    latitudes = np.array([0.5, 10.0])
+    longitudes = np.array([179.7, 10.0])
+
+    distances = geodesic_distances_km(latitude=0.0, longitude=0.0, latitudes=latitudes, longitudes=longitudes)
+
+    np.testing.assert_allclose(distances, geopy_distances_km(0.0, 0.0, latitudes, longitudes), rtol=0, atol=1e-6)
+
+
+def test_within_radius_agrees_with_geopy_at_boundary():
+    radius_km = 2.0
+    points = [geodesic(kilometers=radius_km).destination((55.75, 37.62), bearing) for bearing in range(0, 360, 15)]
+    latitudes = np.array([point.latitude for point in points])
+    longitudes = np.array([point.longitude for point in points])
+    expected = geopy_distances_km(55.75, 37.62, latitudes, longitudes)
+
+    mask, distances = geodesic_distances_within_radius(
+        latitude=55.75, longitude=37.62, latitudes=latitudes, longitudes=longitudes, radius_km=radius_km
+    )
+
+    np.testing.assert_array_equal(mask, expected <= radius_km)
+    np.testing.assert_array_equal(distances, expected)
+
+
+def test_haversine_is_close_to_geodesic():
+    rng = random.Random(2)
+    latitudes, longitudes = random_points(rng, count=100)
+
+    distances = haversine_distances_km(latitude=55.75, longitude=37.62, latitudes=latitudes, longitudes=longitudes)
+
+    np.testing.assert_allclose(distances, geopy_distances_km(55.75, 37.62, latitudes, longitudes), rtol=0.006)
+
+
+def earth_chord_meters(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    # Как ll_to_earth(...) <-> ll_to_earth(...) в earthdistance: евклидово расстояние между точками на сфере.
+    def to_earth(latitudes, longitudes):
+        latitudes, longitudes = np.radians(latitudes), np.radians(longitudes)
+        return EARTHDISTANCE_RADIUS_KM * 1000 * np.stack(
+            [np.cos(latitudes) * np.cos(longitudes), np.cos(latitudes) * np.sin(longitudes), np.sin(latitudes)]
+        )
+
+    return np.linalg.norm(to_earth(latitudes, longitudes) - to_earth(np.array([latitude]), np.array([longitude])), axis=0)
+
+
+def test_min_geodesic_distance_for_chord_is_a_lower_bound():
+    rng = random.Random(3)
+    for latitude, longitude in [(55.75, 37.62), (0.0, 0.0), (-89.0, 10.0), (70.0, -150.0)]:
+        latitudes, longitudes = random_points(rng, count=300)
+        latitudes = np.concatenate([latitudes, latitude + np.array([0.01, -0.01, 0.0, 1.0, 0.0])])
+        longitudes = np.concatenate([longitudes, longitude + np.array([0.0, 0.0, 0.01, 0.0, 1.0])])
+        chords = earth_chord_meters(latitude, longitude, latitudes, longitudes)
+
+        bounds = np.array([min_geodesic_distance_km_for_chord(chord) for chord in chords])
+
+        assert (bounds <= geopy_distances_km(latitude, longitude, latitudes, longitudes)).all()
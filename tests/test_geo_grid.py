@@ -0,0 +1,44 @@
+import math
+import random
+
+import pytest
+
+from logic.geo.grid import MAX_MERCATOR_LATITUDE, cluster_tile
+
+
+def tile_north_latitude(row: int, zoom: int) -> float:
+    # Обратное преобразование Web Mercator: широта северного края строки тайлов.
+    return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / 2 ** zoom))))
+
+
+def test_tiles_match_web_mercator_edges():
+    rng = random.Random(5)
+    for _ in range(500):
+        zoom = rng.randrange(0, 21)
+        row, column = rng.randrange(2 ** zoom), rng.randrange(2 ** zoom)
+        north, south = tile_north_latitude(row, zoom), tile_north_latitude(row + 1, zoom)
+        west, east = column * 360.0 / 2 ** zoom - 180.0, (column + 1) * 360.0 / 2 ** zoom - 180.0
+
+        latitude = south + (north - south) * rng.uniform(0.01, 0.99)
+        longitude = west + (east - west) * rng.uniform(0.01, 0.99)
+
+        assert cluster_tile(latitude=latitude, longitude=longitude, zoom=zoom) == (row, column)
+
+
+def test_rows_are_not_equal_degree_bands():
+    # На 8-м уровне строка тайлов у экватора ~1.4°, а на широте Москвы — меньше 0.8°.
+    assert cluster_tile(latitude=0.5, longitude=0.0, zoom=8)[0] == cluster_tile(latitude=1.3, longitude=0.0, zoom=8)[0]
+    assert cluster_tile(latitude=55.0, longitude=0.0, zoom=8)[0] != cluster_tile(latitude=55.8, longitude=0.0, zoom=8)[0]
+
+
+@pytest.mark.parametrize(
+    ('latitude', 'longitude', 'expected'),
+    [
+        (90.0, -180.0, (0, 0)),
+        (MAX_MERCATOR_LATITUDE, 0.0, (0, 2)),
+        (-90.0, 180.0, (3, 3)),
+        (0.0, 0.0, (2, 2)),
+    ],
+)
+def test_poles_and_antimeridian_stay_inside_the_map(latitude: float, longitude: float, expected: tuple[int, int]):
+    assert cluster_tile(latitude=latitude, longitude=longitude, zoom=2) == expected
@@ -0,0 +1,89 @@
+import random
+import uuid
+
+import pytest
+
+from infra.indexes.organizations import OrganizationNameIndex
+
+
+def titles(index: OrganizationNameIndex, prefix: str, limit: int = 100) -> list[str]:
+    return [suggestion.title for suggestion in index.suggest(prefix=prefix, limit=limit)]
+
+
+def test_suggest_matches_prefix_case_insensitively():
+    index = OrganizationNameIndex()
+    for title in ('Рога и копыта', 'Роза', 'рОмашка', 'Ёлка', 'Автосервис'):
+        index.add(pk=uuid.uuid4(), title=title)
+
+    assert titles(index, 'ро') == ['Рога и копыта', 'Роза', 'рОмашка']
+    assert titles(index, 'РОГ') == ['Рога и копыта']
+    assert titles(index, 'ёл') == ['Ёлка']
+    assert titles(index, 'нет') == []
+
+
+def test_suggest_respects_limit_and_order():
+    index = OrganizationNameIndex()
+    for number in range(20):
+        index.add(pk=uuid.uuid4(), title=f'Аптека {number:02d}')
+
+    assert titles(index, 'апт', limit=3) == ['Аптека 00', 'Аптека 01', 'Аптека 02']
+
+
+def test_add_replaces_previous_title_and_discard_removes_it():
+    index = OrganizationNameIndex()
+    pk = uuid.uuid4()
+    index.add(pk=pk, title='Старое название')
+    index.add(pk=pk, title='Новое название')
+
+    assert titles(index, 'стар') == []
+    assert [suggestion.pk for suggestion in index.suggest(prefix='нов', limit=10)] == [pk]
+
+    index.discard(pk=pk)
+    index.discard(pk=pk)
+    assert titles(index, '') == []
+
+
+def test_discard_keeps_organizations_with_same_name():
+    index = OrganizationNameIndex()
+    first_pk, second_pk, third_pk = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    for pk in (first_pk, second_pk, third_pk):
+        index.add(pk=pk, title='Кафе')
+
+    index.discard(pk=second_pk)
+
+    assert {suggestion.pk for suggestion in index.suggest(prefix='кафе', limit=10)} == {first_pk, third_pk}
+
+
+@pytest.mark.parametrize('batch_size', [10, 500])
+def test_bulk_changes_match_single_changes(batch_size: int):
+    rng = random.Random(batch_size)
+    pks = [uuid.uuid4() for _ in range(1000)]
+    bulk_index, single_index = OrganizationNameIndex(bulk_threshold=64), OrganizationNameIndex()
+
+    initial = [(pk, f'Организация {rng.randrange(300)}') for pk in pks]
+    bulk_index.add_many(initial)
+    for pk, title in initial:
+        single_index.add(pk=pk, title=title)
+
+    renamed = [(pk, f'Переименованная {rng.randrange(300)}') for pk in rng.sample(pks, batch_size)]
+    removed = rng.sample(pks, batch_size)
+    bulk_index.add_many(renamed)
+    bulk_index.discard_many(removed)
+    for pk, title in renamed:
+        single_index.add(pk=pk, title=title)
+    for pk in removed:
+        single_index.discard(pk=pk)
+
+    for prefix in ('', 'орг', 'организация 1', 'пер'):
+        assert sorted(bulk_index.suggest(prefix=prefix, limit=2000), key=lambda suggestion: suggestion.pk) == sorted(
+            single_index.suggest(prefix=prefix, limit=2000), key=lambda suggestion: suggestion.pk
+        )
+    assert len(bulk_index.suggest(prefix='', limit=2000)) == len({*pks} - {*removed})
+
+
+def test_keys_use_lower_like_the_sql_fallback():
+    index = OrganizationNameIndex()
+    index.add(pk=uuid.uuid4(), title='Straße')
+
+    assert titles(index, 'STRAß') == ['Straße']
+    assert titles(index, 'strasse') == []
@@ -0,0 +1,58 @@
+import base64
+import datetime
+import uuid
+
+import pytest
+
+from logic.exceptions.pagination import InvalidCursorException
+from logic.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime.datetime(2025, 2, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+    pk = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, pk)
+
+    assert decode_cursor(cursor, datetime.datetime, uuid.UUID) == (created_at, pk)
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor(1.5, uuid.uuid4())
+
+    assert '=' not in cursor
+    assert set(cursor) <= set('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_')
+
+
+def test_float_cursor_accepts_integer_values():
+    pk = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(3, pk), float, uuid.UUID) == (3.0, pk)
+
+
+def test_encode_cursor_rejects_unsupported_values():
+    with pytest.raises(TypeError):
+        encode_cursor(object())
+
+
+@pytest.mark.parametrize(
+    'cursor',
+    [
+        'not a cursor',
+        base64.urlsafe_b64encode(b'{"a": 1}').decode(),
+        encode_cursor('2025-02-01T12:30:15'),
+        encode_cursor('2025-02-01T12:30:15', 'not-a-uuid'),
+        encode_cursor('yesterday', str(uuid.uuid4())),
+        encode_cursor([], str(uuid.uuid4())),
+    ],
+)
+def test_decode_cursor_rejects_malformed_cursors(cursor: str):
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, datetime.datetime, uuid.UUID)
+
+
+def test_decode_cursor_rejects_wrong_value_type():
+    cursor = encode_cursor('1.5', str(uuid.uuid4()))
+
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, float, uuid.UUID)
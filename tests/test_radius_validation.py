@@ -0,0 +1,45 @@
+from fastapi.testclient import TestClient
+import pytest
+
+from application.api.main import create_app
+from application.api.v1.organizations.dependencies import get_organization_service
+from domain.db_session import get_read_db
+from logic.pagination import Page
+
+
+class StubOrganizationService:
+
+    async def get_organization_list_by_radius(self, **kwargs) -> Page:
+        return Page(items=[], next_cursor=None)
+
+
+async def no_db_session():
+    yield None
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = create_app()
+    app.dependency_overrides[get_read_db] = no_db_session
+    app.dependency_overrides[get_organization_service] = StubOrganizationService
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    'params',
+    [
+        {'latitude': 90.5, 'longitude': 37.62, 'radius_km': 1},
+        {'latitude': -91, 'longitude': 37.62, 'radius_km': 1},
+        {'latitude': 55.75, 'longitude': 180.5, 'radius_km': 1},
+        {'latitude': 55.75, 'longitude': -181, 'radius_km': 1},
+        {'latitude': 55.75, 'longitude': 37.62, 'radius_km': 0},
+        {'latitude': 55.75, 'longitude': 37.62, 'radius_km': -5},
+    ],
+)
+def test_by_radius_rejects_out_of_range_params(client: TestClient, params: dict):
+    assert client.get('/api/v1/organizations/by_radius', params=params).status_code == 422
+
+
+def test_by_radius_accepts_boundary_coordinates(client: TestClient):
+    params = {'latitude': -90, 'longitude': 180, 'radius_km': 0.5}
+    assert client.get('/api/v1/organizations/by_radius', params=params).status_code == 200